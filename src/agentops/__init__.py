@@ -6,17 +6,40 @@ and fix infrastructure issues with human-in-the-loop approval and
 automatic rollback safety guarantees.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Corey A. Wade"
 
-from agentops.agents.base import BaseAgent, AgentCard, AgentState
-from agentops.protocol.messages import Message, TaskMessage, MessageType
-from agentops.protocol.a2a import A2AProtocol
-from agentops.orchestrator.engine import Orchestrator
-from agentops.safety.kill_switch import KillSwitch
-from agentops.safety.rollback import RollbackManager
-from agentops.observe.tracer import Tracer
-from agentops.inventory.registry import DeviceRegistry
+# Public names are imported on first access (PEP 562), so a bare
+# ``import agentops`` doesn't pull in the orchestrator and every agent.
+_LAZY_IMPORTS: dict[str, str] = {
+    "BaseAgent": "agentops.agents.base",
+    "AgentCard": "agentops.agents.base",
+    "AgentState": "agentops.agents.base",
+    "Message": "agentops.protocol.messages",
+    "TaskMessage": "agentops.protocol.messages",
+    "MessageType": "agentops.protocol.messages",
+    "A2AProtocol": "agentops.protocol.a2a",
+    "Orchestrator": "agentops.orchestrator.engine",
+    "KillSwitch": "agentops.safety.kill_switch",
+    "RollbackManager": "agentops.safety.rollback",
+    "Tracer": "agentops.observe.tracer",
+    "DeviceRegistry": "agentops.inventory.registry",
+}
+
+if TYPE_CHECKING:
+    from agentops.agents.base import AgentCard, AgentState, BaseAgent
+    from agentops.inventory.registry import DeviceRegistry
+    from agentops.observe.tracer import Tracer
+    from agentops.orchestrator.engine import Orchestrator
+    from agentops.protocol.a2a import A2AProtocol
+    from agentops.protocol.messages import Message, MessageType, TaskMessage
+    from agentops.safety.kill_switch import KillSwitch
+    from agentops.safety.rollback import RollbackManager
 
 __all__ = [
     "BaseAgent",
@@ -32,3 +55,16 @@ __all__ = [
     "Tracer",
     "DeviceRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -4,17 +4,35 @@ Base agent class with Agent Card, lifecycle management, and message handling.
 Every agent in AgentOps inherits from BaseAgent, which provides:
 - Agent Card: a machine-readable capability declaration (A2A standard)
 - Lifecycle: init -> ready -> active -> paused -> stopped
-- Message bus: async-compatible send/receive with priority routing
+- Message bus: sync receive, plus an asyncio.Queue inbox drained by a
+  background consumer when the agent runs inside an event loop
 - Observability: automatic tracing of all agent actions
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import time
-import uuid
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from agentops import serialization
+from agentops.ids import new_uuid
+
+
+# Maximum entries retained in each agent's inbox, outbox, and action log
+DEFAULT_HISTORY_LIMIT = 10_000
+
+# Maximum messages waiting in the async inbox before post_message() blocks
+DEFAULT_QUEUE_SIZE = 1024
+
+# Seconds an async message handler may run before the consumer abandons it
+DEFAULT_HANDLER_TIMEOUT = 300.0
 
 
 class AgentState(str, Enum):
@@ -27,7 +45,31 @@ class AgentState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# One bit per state; each state's allowed targets are OR-ed into a mask so a
+# transition check is a single AND.
+_STATE_BITS: dict[AgentState, int] = {state: 1 << i for i, state in enumerate(AgentState)}
+
+
+def _mask(*states: AgentState) -> int:
+    bits = 0
+    for state in states:
+        bits |= _STATE_BITS[state]
+    return bits
+
+
+_VALID_TRANSITIONS: dict[AgentState, int] = {
+    AgentState.INIT: _mask(AgentState.READY, AgentState.ERROR),
+    AgentState.READY: _mask(AgentState.ACTIVE, AgentState.STOPPED, AgentState.ERROR),
+    AgentState.ACTIVE: _mask(
+        AgentState.PAUSED, AgentState.READY, AgentState.STOPPED, AgentState.ERROR
+    ),
+    AgentState.PAUSED: _mask(AgentState.ACTIVE, AgentState.STOPPED, AgentState.ERROR),
+    AgentState.STOPPED: _mask(AgentState.INIT),
+    AgentState.ERROR: _mask(AgentState.INIT, AgentState.STOPPED),
+}
+
+
+@dataclass(slots=True)
 class AgentCard:
     """
     A2A Agent Card — machine-readable capability declaration.
@@ -47,22 +89,130 @@ class AgentCard:
     priority: int = 5  # 1 = highest, 10 = lowest
     max_concurrent_tasks: int = 10
     tags: list[str] = field(default_factory=list)
+    _cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name not in ("_cache", "_json"):
+            # Any field reassignment invalidates the serialized card. Mutating
+            # a list field in place does not, so reassign it instead.
+            object.__setattr__(self, "_cache", None)
+            object.__setattr__(self, "_json", None)
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize card for A2A discovery."""
-        return {
-            "agent_id": self.agent_id,
-            "name": self.name,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "input_schemas": self.input_schemas,
-            "output_schemas": self.output_schemas,
-            "endpoint": self.endpoint,
-            "version": self.version,
-            "priority": self.priority,
-            "max_concurrent_tasks": self.max_concurrent_tasks,
-            "tags": self.tags,
-        }
+        """Serialize card for A2A discovery (cached until a field is reassigned)."""
+        if self._cache is None:
+            self._cache = _card_to_dict(self)
+        return dict(self._cache)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize card to UTF-8 JSON, cached so HTTP handlers can write it directly."""
+        if self._json is None:
+            self._json = serialization.dumps(self.to_dict())
+        return self._json
+
+
+_card_to_dict = serialization.make_to_dict(AgentCard)
+
+
+class BatchingOutbox:
+    """
+    Buffers outgoing messages and hands them to a transport in batches.
+
+    A batch is sent when it reaches ``max_batch`` messages, when
+    ``linger_ms`` has passed since the first buffered message (only inside
+    a running event loop), or when flush() is called explicitly.
+
+    ``send_batch`` must be a plain function: flush() calls it inline and
+    has nothing to await a coroutine with, so ``async def`` transports
+    are rejected rather than having their batches silently dropped.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[dict[str, Any]]], None],
+        max_batch: int = 256,
+        linger_ms: float = 5.0,
+    ) -> None:
+        if inspect.iscoroutinefunction(send_batch):
+            raise TypeError("send_batch must be synchronous, not an async function")
+        self._send_batch = send_batch
+        self.max_batch = max_batch
+        self.linger_seconds = linger_ms / 1000
+        self._buf: list[dict[str, Any]] = []
+        self._linger_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def add(self, message: dict[str, Any]) -> None:
+        """Buffer a message, flushing if the batch is full."""
+        self._buf.append(message)
+        if len(self._buf) >= self.max_batch:
+            self.flush()
+        elif self._linger_task is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # no loop: flushed when full or by an explicit flush()
+            self._linger_task = loop.create_task(self._flush_after_linger())
+
+    def flush(self) -> int:
+        """Send everything buffered as one batch. Returns the batch size."""
+        batch, self._buf = self._buf, []
+        if batch:
+            self._send_batch(batch)
+        return len(batch)
+
+    async def _flush_after_linger(self) -> None:
+        try:
+            await asyncio.sleep(self.linger_seconds)
+            self.flush()
+        finally:
+            self._linger_task = None
+
+
+def format_details(details: dict[str, Any], limit: int = 3) -> str:
+    """Render the first ``limit`` action-log details as ``k=v, k=v``."""
+    return ", ".join(f"{k}={v}" for k, v in islice(details.items(), limit))
+
+
+class ActionBatch:
+    """
+    Buffers action-log entries and appends them to the log in bulk.
+
+    Entries keep their own timestamps and stay one per action; only the
+    append into the bounded log is batched. Obtain one from
+    BaseAgent.log_batch().
+    """
+
+    __slots__ = ("_emit", "max_batch", "_buf")
+
+    def __init__(
+        self,
+        emit: Callable[[list[tuple[float, str, dict[str, Any]]]], None],
+        max_batch: int = 256,
+    ) -> None:
+        self._emit = emit
+        self.max_batch = max_batch
+        self._buf: list[tuple[float, str, dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def add(self, action: str, details: dict[str, Any] | None = None) -> None:
+        """Buffer an action, flushing if the batch is full."""
+        self._buf.append((time.time(), action, details or {}))
+        if len(self._buf) >= self.max_batch:
+            self.flush()
+
+    def flush(self) -> int:
+        """Append everything buffered to the log. Returns the batch size."""
+        batch, self._buf = self._buf, []
+        if batch:
+            self._emit(batch)
+        return len(batch)
 
 
 class BaseAgent:
@@ -73,18 +223,62 @@ class BaseAgent:
     publication for A2A protocol discovery.
     """
 
-    def __init__(self, name: str, description: str, capabilities: list[str] | None = None):
-        self.agent_id = str(uuid.uuid4())
+    __slots__ = (
+        "agent_id",
+        "_id_prefix",
+        "name",
+        "description",
+        "handler_timeout_seconds",
+        "_state",
+        "_message_handlers",
+        "_inbox",
+        "_outbox",
+        "_action_log",
+        "_audit_log",
+        "_evicted",
+        "_queue",
+        "_consumer",
+        "_batcher",
+        "_created_at",
+        "_last_active",
+        "_active_tasks",
+        "_task_counts",
+        "card",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        capabilities: list[str] | None = None,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self.agent_id = new_uuid()
+        self._id_prefix = self.agent_id[:4]
         self.name = name
         self.description = description
+        # Upper bound on an async handler's run time when dispatched from the
+        # inbox consumer; None disables the limit.
+        self.handler_timeout_seconds: float | None = DEFAULT_HANDLER_TIMEOUT
         self._state = AgentState.INIT
         self._message_handlers: dict[str, Callable] = {}
-        self._inbox: list[dict[str, Any]] = []
-        self._outbox: list[dict[str, Any]] = []
-        self._action_log: list[dict[str, Any]] = []
+        # Bounded so long-running agents don't grow without limit; the
+        # oldest entries are evicted first and counted in _evicted.
+        self._inbox: deque[dict[str, Any]] = deque(maxlen=history_limit)
+        self._outbox: deque[dict[str, Any]] = deque(maxlen=history_limit)
+        self._action_log: deque[tuple[float, str, dict[str, Any]]] = deque(maxlen=history_limit)
+        # Shared cross-agent audit buffer, if attached (see attach_audit_log)
+        self._audit_log: deque[tuple[float, BaseAgent, str, dict[str, Any]]] | None = None
+        self._evicted: dict[str, int] = {"inbox": 0, "outbox": 0, "action_log": 0}
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
+        self._consumer: asyncio.Task | None = None
+        self._batcher: BatchingOutbox | None = None
         self._created_at = time.time()
         self._last_active = time.time()
         self._active_tasks: dict[str, dict[str, Any]] = {}
+        # Tasks per status, kept in step with _active_tasks for O(1) status
+        self._task_counts: dict[str, int] = {"created": 0, "completed": 0, "failed": 0}
 
         self.card = AgentCard(
             agent_id=self.agent_id,
@@ -101,15 +295,7 @@ class BaseAgent:
     @state.setter
     def state(self, new_state: AgentState) -> None:
         old_state = self._state
-        valid_transitions = {
-            AgentState.INIT: {AgentState.READY, AgentState.ERROR},
-            AgentState.READY: {AgentState.ACTIVE, AgentState.STOPPED, AgentState.ERROR},
-            AgentState.ACTIVE: {AgentState.PAUSED, AgentState.READY, AgentState.STOPPED, AgentState.ERROR},
-            AgentState.PAUSED: {AgentState.ACTIVE, AgentState.STOPPED, AgentState.ERROR},
-            AgentState.STOPPED: {AgentState.INIT},
-            AgentState.ERROR: {AgentState.INIT, AgentState.STOPPED},
-        }
-        if new_state not in valid_transitions.get(old_state, set()):
+        if not _VALID_TRANSITIONS.get(old_state, 0) & _STATE_BITS.get(new_state, 0):
             raise ValueError(
                 f"Invalid state transition: {old_state.value} -> {new_state.value}"
             )
@@ -126,6 +312,7 @@ class BaseAgent:
             self.initialize()
         self.state = AgentState.ACTIVE
         self._last_active = time.time()
+        self._start_consumer()
 
     def pause(self) -> None:
         """Pause task processing (can resume)."""
@@ -139,6 +326,10 @@ class BaseAgent:
     def stop(self) -> None:
         """Stop the agent gracefully."""
         self.state = AgentState.STOPPED
+        self.flush_outbox()
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
 
     def register_handler(self, message_type: str, handler: Callable) -> None:
         """Register a handler for a specific message type."""
@@ -150,7 +341,7 @@ class BaseAgent:
 
         Returns the handler's response, or None if no handler matched.
         """
-        self._inbox.append(message)
+        self._append_bounded(self._inbox, "inbox", message)
         self._last_active = time.time()
         msg_type = message.get("type", "unknown")
         handler = self._message_handlers.get(msg_type)
@@ -163,17 +354,82 @@ class BaseAgent:
         self._log_action("message_unhandled", {"type": msg_type})
         return None
 
+    async def post_message(self, message: dict[str, Any]) -> None:
+        """
+        Enqueue a message on the async inbox without running its handler.
+
+        Blocks when the inbox is full, giving senders backpressure. The
+        consumer started by start() dispatches queued messages in order.
+        """
+        await self._queue.put(message)
+
+    async def drain(self) -> None:
+        """Wait until every posted message has been dispatched."""
+        await self._queue.join()
+
+    def _start_consumer(self) -> None:
+        """Start the inbox consumer if called from inside an event loop."""
+        if self._consumer is not None and not self._consumer.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # synchronous use — callers invoke receive_message directly
+        self._consumer = loop.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        """Dispatch queued messages to their handlers, awaiting async ones."""
+        while True:
+            message = await self._queue.get()
+            try:
+                result = self.receive_message(message)
+                if inspect.isawaitable(result):
+                    # asyncio.timeout avoids the set/callback allocation that
+                    # asyncio.wait() does for each single-future await
+                    async with asyncio.timeout(self.handler_timeout_seconds):
+                        await result
+            except TimeoutError:
+                self._log_action("message_handler_timeout", {
+                    "type": message.get("type", "unknown"),
+                    "timeout": self.handler_timeout_seconds,
+                })
+            except Exception as e:
+                self._log_action("message_handler_error", {
+                    "type": message.get("type", "unknown"),
+                    "error": str(e),
+                })
+            finally:
+                self._queue.task_done()
+
     def send_message(self, target_id: str, message: dict[str, Any]) -> None:
         """Queue a message for delivery to another agent."""
         message["source_agent_id"] = self.agent_id
         message["target_agent_id"] = target_id
         message["timestamp"] = time.time()
-        self._outbox.append(message)
+        self._append_bounded(self._outbox, "outbox", message)
+        if self._batcher is not None:
+            self._batcher.add(message)
         self._log_action("message_sent", {"target": target_id, "type": message.get("type")})
 
+    def set_batch_transport(
+        self,
+        send_batch: Callable[[list[dict[str, Any]]], None],
+        max_batch: int = 256,
+        linger_ms: float = 5.0,
+    ) -> None:
+        """Deliver sent messages to the synchronous ``send_batch`` in batches."""
+        self.flush_outbox()
+        self._batcher = BatchingOutbox(send_batch, max_batch=max_batch, linger_ms=linger_ms)
+
+    def flush_outbox(self) -> int:
+        """Send any buffered outgoing messages now. Returns how many were sent."""
+        if self._batcher is None:
+            return 0
+        return self._batcher.flush()
+
     def create_task(self, task_type: str, params: dict[str, Any]) -> str:
         """Create a new task tracked by this agent."""
-        task_id = str(uuid.uuid4())
+        task_id = new_uuid()
         task = {
             "task_id": task_id,
             "type": task_type,
@@ -184,6 +440,7 @@ class BaseAgent:
             "result": None,
         }
         self._active_tasks[task_id] = task
+        self._task_counts["created"] += 1
         self._log_action("task_created", {"task_id": task_id, "type": task_type})
         return task_id
 
@@ -191,49 +448,124 @@ class BaseAgent:
         """Mark a task as completed with its result."""
         if task_id not in self._active_tasks:
             raise KeyError(f"Unknown task: {task_id}")
-        self._active_tasks[task_id]["status"] = "completed"
-        self._active_tasks[task_id]["result"] = result
-        self._active_tasks[task_id]["updated_at"] = time.time()
+        task = self._active_tasks[task_id]
+        self._set_task_status(task, "completed")
+        task["result"] = result
+        task["updated_at"] = time.time()
         self._log_action("task_completed", {"task_id": task_id})
 
     def fail_task(self, task_id: str, error: str) -> None:
         """Mark a task as failed."""
         if task_id not in self._active_tasks:
             raise KeyError(f"Unknown task: {task_id}")
-        self._active_tasks[task_id]["status"] = "failed"
-        self._active_tasks[task_id]["error"] = error
-        self._active_tasks[task_id]["updated_at"] = time.time()
+        task = self._active_tasks[task_id]
+        self._set_task_status(task, "failed")
+        task["error"] = error
+        task["updated_at"] = time.time()
         self._log_action("task_failed", {"task_id": task_id, "error": error})
 
+    @property
+    def active_task_count(self) -> int:
+        """Number of tasks created but not yet completed or failed."""
+        return self._task_counts["created"]
+
+    def _set_task_status(self, task: dict[str, Any], status: str) -> None:
+        """Move a task to a new status, keeping the per-status counters in step."""
+        self._task_counts[task["status"]] -= 1
+        self._task_counts[status] += 1
+        task["status"] = status
+
     def get_status(self) -> dict[str, Any]:
         """Return current agent status summary."""
         return {
             "agent_id": self.agent_id,
             "name": self.name,
             "state": self._state.value,
-            "active_tasks": len([t for t in self._active_tasks.values() if t["status"] == "created"]),
-            "completed_tasks": len([t for t in self._active_tasks.values() if t["status"] == "completed"]),
-            "failed_tasks": len([t for t in self._active_tasks.values() if t["status"] == "failed"]),
-            "messages_received": len(self._inbox),
-            "messages_sent": len(self._outbox),
+            "active_tasks": self._task_counts["created"],
+            "completed_tasks": self._task_counts["completed"],
+            "failed_tasks": self._task_counts["failed"],
+            "messages_received": len(self._inbox) + self._evicted["inbox"],
+            "messages_sent": len(self._outbox) + self._evicted["outbox"],
+            "evicted_log_entries": self._evicted["action_log"],
             "last_active": self._last_active,
             "uptime": time.time() - self._created_at,
         }
 
-    def get_action_log(self) -> list[dict[str, Any]]:
-        """Return the full action log for audit."""
-        return list(self._action_log)
+    def get_action_log(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Return the action log for audit, oldest first.
+
+        Entries are stored as compact tuples and expanded into dicts here.
+        If ``limit`` is given, only the most recent ``limit`` entries are
+        materialized.
+        """
+        entries: Iterable[tuple[float, str, dict[str, Any]]] = self._action_log
+        if limit is not None:
+            # Walk from the newest end so only the tail is touched
+            entries = reversed(list(islice(reversed(self._action_log), limit)))
+        agent_id, agent_name = self.agent_id, self.name
+        return [
+            {
+                "timestamp": ts,
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+                "action": action,
+                "details": details,
+            }
+            for ts, action, details in entries
+        ]
+
+    def _next_id(self, kind: str, seq: Iterator[int]) -> str:
+        """Build a short ID such as ``EV-3f2a-00002a`` from a per-agent counter."""
+        return f"{kind}-{self._id_prefix}-{next(seq):06x}"
+
+    def attach_audit_log(
+        self, buffer: deque[tuple[float, BaseAgent, str, dict[str, Any]]],
+    ) -> None:
+        """
+        Also append every logged action to ``buffer``, tagged with this agent.
+
+        Several agents can share one bounded buffer, which then holds the
+        most recent actions across all of them in write order.
+        """
+        self._audit_log = buffer
 
     def _log_action(self, action: str, details: dict[str, Any] | None = None) -> None:
         """Log an agent action for observability."""
-        entry = {
-            "timestamp": time.time(),
-            "agent_id": self.agent_id,
-            "agent_name": self.name,
-            "action": action,
-            "details": details or {},
-        }
-        self._action_log.append(entry)
+        # agent_id/agent_name are constant per instance, so they are filled
+        # in by get_action_log() rather than stored with every entry.
+        ts, details = time.time(), details or {}
+        self._append_bounded(self._action_log, "action_log", (ts, action, details))
+        if self._audit_log is not None:
+            self._audit_log.append((ts, self, action, details))
+
+    @contextmanager
+    def log_batch(self, max_batch: int = 256) -> Iterator[ActionBatch]:
+        """
+        Collect actions logged inside the block and append them together.
+
+        Buffered entries are flushed on exit, including when the block
+        raises, so the audit trail up to a failure is kept.
+        """
+        batch = ActionBatch(self._extend_action_log, max_batch)
+        try:
+            yield batch
+        finally:
+            batch.flush()
+
+    def _extend_action_log(self, entries: list[tuple[float, str, dict[str, Any]]]) -> None:
+        log = self._action_log
+        if log.maxlen is not None:
+            self._evicted["action_log"] += max(0, len(log) + len(entries) - log.maxlen)
+        log.extend(entries)
+        if self._audit_log is not None:
+            self._audit_log.extend((ts, self, action, details) for ts, action, details in entries)
+
+    def _append_bounded(self, buffer: deque, name: str, item: Any) -> None:
+        """Append to a bounded buffer, counting the entry evicted on overflow."""
+        if len(buffer) == buffer.maxlen:
+            self._evicted[name] += 1
+        buffer.append(item)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name!r} state={self._state.value}>"
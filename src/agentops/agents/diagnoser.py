@@ -12,15 +12,19 @@ then performs structured root cause analysis:
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import operator
 import time
-import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from itertools import islice
+from typing import Any, Callable
 
 from agentops.agents.base import BaseAgent
+from agentops.ids import short_hex
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticEvidence:
     """A piece of evidence collected during diagnosis."""
     evidence_id: str
@@ -32,7 +36,7 @@ class DiagnosticEvidence:
     relevance_score: float = 0.5  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RootCauseHypothesis:
     """A ranked hypothesis about the root cause."""
     hypothesis_id: str
@@ -40,12 +44,12 @@ class RootCauseHypothesis:
     confidence: float  # 0.0 to 1.0
     category: str  # hardware, software, config, capacity, external
     affected_devices: list[str] = field(default_factory=list)
-    evidence: list[DiagnosticEvidence] = field(default_factory=list)
+    evidence_ids: list[str] = field(default_factory=list)  # see DiagnosisReport.get_evidence
     recommended_action: str = ""
     blast_radius: int = 1  # estimated number of affected services
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosisReport:
     """Complete diagnosis report for an incident."""
     report_id: str
@@ -57,6 +61,21 @@ class DiagnosisReport:
     topology_context: dict[str, Any]
     duration_seconds: float
     confidence_level: str  # high, medium, low
+    _evidence_index: dict[str, DiagnosticEvidence] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self._evidence_index = {e.evidence_id: e for e in self.evidence_collected}
+
+    def get_evidence(self, evidence_id: str) -> DiagnosticEvidence | None:
+        """Look up a piece of collected evidence by ID."""
+        return self._evidence_index.get(evidence_id)
+
+    def evidence_for(self, hypothesis: RootCauseHypothesis) -> list[DiagnosticEvidence]:
+        """Resolve a hypothesis's evidence IDs against this report's evidence."""
+        index = self._evidence_index
+        return [index[eid] for eid in hypothesis.evidence_ids if eid in index]
 
 
 # Diagnostic rule templates for common infrastructure issues
@@ -119,6 +138,36 @@ DIAGNOSTIC_RULES: dict[str, dict[str, Any]] = {
 }
 
 
+def _compile_rules(rules: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Precompute per-rule tuples and hypothesis confidences once at import."""
+    compiled = {}
+    for incident_type, rule in rules.items():
+        causes = tuple(rule["common_causes"])
+        compiled[incident_type] = {
+            "category": rule["category"],
+            "causes": causes,
+            # Primary cause gets highest confidence
+            "confidences": tuple(
+                round(max(0.3, 0.95 - (i * 0.15)), 2) for i in range(len(causes))
+            ),
+            "correlations": tuple(rule["correlations"]),
+        }
+    return compiled
+
+
+_RULES_COMPILED = _compile_rules(DIAGNOSTIC_RULES)
+
+# Incident classification, checked in priority order:
+# (metric_name, default_value, comparison, threshold, incident_type)
+_CLASSIFY_TABLE: tuple[tuple[str, float, Callable[[float, float], bool], float, str], ...] = (
+    ("link_state", 1, operator.lt, 0.5, "link_down"),
+    ("bgp_prefixes", 999, operator.lt, 100, "bgp_flap"),
+    ("cpu_percent", 0, operator.gt, 90, "cpu_spike"),
+    ("memory_percent", 0, operator.gt, 85, "memory_leak"),
+    ("disk_percent", 0, operator.gt, 90, "disk_full"),
+)
+
+
 class DiagnoserAgent(BaseAgent):
     """
     Root cause analysis agent.
@@ -139,14 +188,23 @@ class DiagnoserAgent(BaseAgent):
             ],
         )
         self.diagnosis_reports: list[DiagnosisReport] = []
-        self._topology: dict[str, list[str]] = {}  # device_id -> [neighbor_ids]
+        # device_id -> neighbor_ids, de-duplicated, in the order they were given
+        self._topology: dict[str, tuple[str, ...]] = {}
+        self._topo_cache: dict[str, dict[str, Any]] = {}  # cleared by set_topology
+        # Evidence/hypothesis IDs: agent prefix + per-agent sequence number
+        self._evidence_seq = itertools.count(1)
+        self._hypothesis_seq = itertools.count(1)
 
         self.register_handler("diagnose", self._handle_diagnose)
         self.register_handler("set_topology", self._handle_set_topology)
 
     def set_topology(self, topology: dict[str, list[str]]) -> None:
         """Set the network topology graph for correlation."""
-        self._topology = topology
+        self._topology = {
+            device_id: tuple(dict.fromkeys(neighbors))
+            for device_id, neighbors in topology.items()
+        }
+        self._topo_cache.clear()
         self._log_action("topology_updated", {"devices": len(topology)})
 
     def diagnose_incident(
@@ -166,18 +224,65 @@ class DiagnoserAgent(BaseAgent):
         4. Generate and rank hypotheses
         5. Produce a diagnosis report
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        now = time.time()
+        metrics = metrics or {}
         task_id = self.create_task("diagnosis", {
             "incident_id": incident_id,
             "device_id": device_id,
         })
 
         # Step 1: Classify incident type
-        incident_type = self._classify_incident(alerts, metrics or {})
+        incident_type = self._classify_incident(alerts, metrics)
 
         # Step 2: Collect evidence
-        evidence = self._collect_evidence(device_id, alerts, metrics or {}, incident_type)
+        evidence = self._collect_evidence(device_id, alerts, metrics, incident_type, now)
+
+        return self._finish_diagnosis(
+            task_id, start_ns, incident_id, device_id, incident_type, evidence
+        )
 
+    async def diagnose_incident_async(
+        self,
+        incident_id: str,
+        device_id: str,
+        alerts: list[dict[str, Any]],
+        metrics: dict[str, float] | None = None,
+    ) -> DiagnosisReport:
+        """
+        Async variant of diagnose_incident().
+
+        Neighbor checks are issued concurrently with asyncio.gather, so
+        their round-trips overlap instead of running back to back.
+        """
+        start_ns = time.monotonic_ns()
+        now = time.time()
+        metrics = metrics or {}
+        task_id = self.create_task("diagnosis", {
+            "incident_id": incident_id,
+            "device_id": device_id,
+        })
+
+        incident_type = self._classify_incident(alerts, metrics)
+
+        evidence = self._collect_local_evidence(device_id, alerts, metrics, incident_type, now)
+        neighbors = self._topology.get(device_id, ())[:3]  # Check first 3 neighbors
+        evidence.extend(await asyncio.gather(*(self._query_neighbor(n) for n in neighbors)))
+
+        return self._finish_diagnosis(
+            task_id, start_ns, incident_id, device_id, incident_type, evidence
+        )
+
+    def _finish_diagnosis(
+        self,
+        task_id: str,
+        start_ns: int,
+        incident_id: str,
+        device_id: str,
+        incident_type: str,
+        evidence: list[DiagnosticEvidence],
+    ) -> DiagnosisReport:
+        """Run steps 3-5 on collected evidence and record the report."""
         # Step 3: Get topology context
         topology_context = self._get_topology_context(device_id)
 
@@ -198,10 +303,10 @@ class DiagnoserAgent(BaseAgent):
         else:
             confidence_level = "low"
 
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_ns) / 1e9
 
         report = DiagnosisReport(
-            report_id=f"DIAG-{uuid.uuid4().hex[:8]}",
+            report_id=f"DIAG-{short_hex(8)}",
             incident_id=incident_id,
             timestamp=time.time(),
             primary_hypothesis=hypotheses[0] if hypotheses else None,
@@ -233,17 +338,10 @@ class DiagnoserAgent(BaseAgent):
     ) -> str:
         """Classify the incident type based on alert patterns."""
         alert_metrics = {a.get("metric", "") for a in alerts}
-
-        if "link_state" in alert_metrics or metrics.get("link_state", 1) < 0.5:
-            return "link_down"
-        if "bgp_prefixes" in alert_metrics or metrics.get("bgp_prefixes", 999) < 100:
-            return "bgp_flap"
-        if "cpu_percent" in alert_metrics or metrics.get("cpu_percent", 0) > 90:
-            return "cpu_spike"
-        if "memory_percent" in alert_metrics or metrics.get("memory_percent", 0) > 85:
-            return "memory_leak"
-        if "disk_percent" in alert_metrics or metrics.get("disk_percent", 0) > 90:
-            return "disk_full"
+        for metric_name, default, compare, threshold, incident_type in _CLASSIFY_TABLE:
+            value = metrics.get(metric_name, default)
+            if metric_name in alert_metrics or compare(value, threshold):
+                return incident_type
         return "unknown"
 
     def _collect_evidence(
@@ -252,75 +350,107 @@ class DiagnoserAgent(BaseAgent):
         alerts: list[dict[str, Any]],
         metrics: dict[str, float],
         incident_type: str,
+        now: float | None = None,
+    ) -> list[DiagnosticEvidence]:
+        """Collect diagnostic evidence from multiple sources, stamped with ``now``."""
+        if now is None:
+            now = time.time()
+        evidence = self._collect_local_evidence(device_id, alerts, metrics, incident_type, now)
+
+        # Topology neighbor evidence
+        neighbors = self._topology.get(device_id, ())
+        for neighbor in neighbors[:3]:  # Check first 3 neighbors
+            evidence.append(self._neighbor_evidence(neighbor, now))
+
+        return evidence
+
+    def _collect_local_evidence(
+        self,
+        device_id: str,
+        alerts: list[dict[str, Any]],
+        metrics: dict[str, float],
+        incident_type: str,
+        now: float,
     ) -> list[DiagnosticEvidence]:
-        """Collect diagnostic evidence from multiple sources."""
+        """Collect alert, metric, and log evidence from the affected device."""
         evidence = []
 
         # Alert evidence
         for alert in alerts:
             evidence.append(DiagnosticEvidence(
-                evidence_id=f"EV-{uuid.uuid4().hex[:6]}",
+                evidence_id=self._next_id("EV", self._evidence_seq),
                 source=device_id,
                 category="metric",
                 description=f"Alert: {alert.get('message', 'Unknown alert')}",
                 data=alert,
+                timestamp=now,
                 relevance_score=0.9,
             ))
 
         # Metric evidence
         for metric_name, value in metrics.items():
             evidence.append(DiagnosticEvidence(
-                evidence_id=f"EV-{uuid.uuid4().hex[:6]}",
+                evidence_id=self._next_id("EV", self._evidence_seq),
                 source=device_id,
                 category="metric",
                 description=f"Current {metric_name} = {value}",
                 data={"metric": metric_name, "value": value},
+                timestamp=now,
                 relevance_score=0.7,
             ))
 
         # Simulated log evidence
-        if incident_type in DIAGNOSTIC_RULES:
-            rules = DIAGNOSTIC_RULES[incident_type]
+        rules = _RULES_COMPILED.get(incident_type)
+        if rules:
             for correlation in rules["correlations"]:
                 evidence.append(DiagnosticEvidence(
-                    evidence_id=f"EV-{uuid.uuid4().hex[:6]}",
+                    evidence_id=self._next_id("EV", self._evidence_seq),
                     source=device_id,
                     category="log",
                     description=f"Investigation: {correlation}",
                     data={"check": correlation, "result": "anomaly_detected"},
+                    timestamp=now,
                     relevance_score=0.6,
                 ))
 
-        # Topology neighbor evidence
-        neighbors = self._topology.get(device_id, [])
-        for neighbor in neighbors[:3]:  # Check first 3 neighbors
-            evidence.append(DiagnosticEvidence(
-                evidence_id=f"EV-{uuid.uuid4().hex[:6]}",
-                source=neighbor,
-                category="topology",
-                description=f"Neighbor {neighbor} status checked",
-                data={"neighbor_id": neighbor, "reachable": True},
-                relevance_score=0.5,
-            ))
-
         return evidence
 
+    def _neighbor_evidence(self, neighbor: str, now: float) -> DiagnosticEvidence:
+        """Build the (simulated) status evidence for a topology neighbor."""
+        return DiagnosticEvidence(
+            evidence_id=self._next_id("EV", self._evidence_seq),
+            source=neighbor,
+            category="topology",
+            description=f"Neighbor {neighbor} status checked",
+            data={"neighbor_id": neighbor, "reachable": True},
+            timestamp=now,
+            relevance_score=0.5,
+        )
+
+    async def _query_neighbor(self, neighbor: str) -> DiagnosticEvidence:
+        """Check a neighbor's status; simulated today, a telemetry call in production."""
+        return self._neighbor_evidence(neighbor, time.time())
+
     def _get_topology_context(self, device_id: str) -> dict[str, Any]:
-        """Get topology context around the affected device."""
-        neighbors = self._topology.get(device_id, [])
-        second_hop = set()
-        for n in neighbors:
-            for nn in self._topology.get(n, []):
-                if nn != device_id:
-                    second_hop.add(nn)
+        """Get topology context around the affected device (memoized per topology)."""
+        cached = self._topo_cache.get(device_id)
+        if cached is not None:
+            return dict(cached)
 
-        return {
+        neighbors = self._topology.get(device_id, ())
+        second_hop = frozenset().union(
+            *(self._topology.get(n, ()) for n in neighbors)
+        ) - {device_id}
+
+        context = {
             "device_id": device_id,
-            "direct_neighbors": neighbors,
+            "direct_neighbors": list(neighbors),
             "second_hop_neighbors": list(second_hop),
             "neighbor_count": len(neighbors),
             "potential_blast_radius": len(neighbors) + len(second_hop) + 1,
         }
+        self._topo_cache[device_id] = context
+        return dict(context)
 
     def _generate_hypotheses(
         self,
@@ -332,28 +462,33 @@ class DiagnoserAgent(BaseAgent):
         """Generate ranked root cause hypotheses."""
         hypotheses = []
 
-        if incident_type in DIAGNOSTIC_RULES:
-            rules = DIAGNOSTIC_RULES[incident_type]
-            causes = rules["common_causes"]
-
-            for i, cause in enumerate(causes):
-                # Primary cause gets highest confidence
-                confidence = max(0.3, 0.95 - (i * 0.15))
-                relevant_evidence = [e for e in evidence if e.relevance_score > 0.5]
-
+        rules = _RULES_COMPILED.get(incident_type)
+        if rules:
+            # Shared by every hypothesis: the first three relevant pieces of
+            # evidence, found without scanning the whole list per cause. Only
+            # IDs are stored; the report holds each evidence object once.
+            relevant_ids = [
+                e.evidence_id
+                for e in islice((e for e in evidence if e.relevance_score > 0.5), 3)
+            ]
+            affected_devices = [device_id] + topology_context.get("direct_neighbors", [])[:2]
+            blast_radius = topology_context.get("potential_blast_radius", 1)
+            category = rules["category"]
+
+            for cause, confidence in zip(rules["causes"], rules["confidences"], strict=True):
                 hypotheses.append(RootCauseHypothesis(
-                    hypothesis_id=f"HYP-{uuid.uuid4().hex[:6]}",
+                    hypothesis_id=self._next_id("HYP", self._hypothesis_seq),
                     description=cause,
-                    confidence=round(confidence, 2),
-                    category=rules["category"],
-                    affected_devices=[device_id] + topology_context.get("direct_neighbors", [])[:2],
-                    evidence=relevant_evidence[:3],
+                    confidence=confidence,
+                    category=category,
+                    affected_devices=list(affected_devices),
+                    evidence_ids=list(relevant_ids),
                     recommended_action=f"Investigate: {cause}",
-                    blast_radius=topology_context.get("potential_blast_radius", 1),
+                    blast_radius=blast_radius,
                 ))
         else:
             hypotheses.append(RootCauseHypothesis(
-                hypothesis_id=f"HYP-{uuid.uuid4().hex[:6]}",
+                hypothesis_id=self._next_id("HYP", self._hypothesis_seq),
                 description="Unclassified incident — manual investigation required",
                 confidence=0.3,
                 category="unknown",
@@ -365,7 +500,7 @@ class DiagnoserAgent(BaseAgent):
 
     # Message handlers
     def _handle_diagnose(self, message: dict[str, Any]) -> dict[str, Any]:
-        incident_id = message.get("incident_id", f"INC-{uuid.uuid4().hex[:6]}")
+        incident_id = message.get("incident_id", f"INC-{short_hex(6)}")
         device_id = message.get("device_id", "unknown")
         alerts = message.get("alerts", [])
         metrics = message.get("metrics")
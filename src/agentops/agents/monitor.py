@@ -13,10 +13,18 @@ Mock infrastructure metrics simulate realistic patterns including:
 
 from __future__ import annotations
 
+import math
 import random
+import threading
 import time
+from array import array
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import compress, repeat
+from operator import lt, mul
 from typing import Any
 
 from agentops.agents.base import BaseAgent
@@ -31,32 +39,46 @@ class Severity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+# Comparison -> sign applied to values and thresholds so every rule is a "gt" test
+_COMPARISON_SIGN = {"gt": 1.0, "lt": -1.0}
+
+
+@dataclass(slots=True)
 class ThresholdRule:
-    """A threshold-based alerting rule."""
+    """
+    A threshold-based alerting rule.
+
+    Thresholds are pre-multiplied by the comparison's sign at construction,
+    so treat rules as immutable once created.
+    """
     metric_name: str
     warning_threshold: float
     critical_threshold: float
     comparison: str = "gt"  # gt, lt, eq, ne
     duration_seconds: int = 60
     description: str = ""
+    _sign: float = field(default=0.0, init=False, repr=False, compare=False)
+    _warn_signed: float = field(default=0.0, init=False, repr=False, compare=False)
+    _crit_signed: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._sign = sign = _COMPARISON_SIGN.get(self.comparison, 0.0)
+        self._warn_signed = sign * self.warning_threshold
+        self._crit_signed = sign * self.critical_threshold
 
     def evaluate(self, value: float) -> Severity | None:
         """Evaluate a metric value against this rule."""
-        if self.comparison == "gt":
-            if value > self.critical_threshold:
-                return Severity.CRITICAL
-            if value > self.warning_threshold:
-                return Severity.HIGH
-        elif self.comparison == "lt":
-            if value < self.critical_threshold:
-                return Severity.CRITICAL
-            if value < self.warning_threshold:
-                return Severity.HIGH
+        if not self._sign:
+            return None
+        signed = self._sign * value
+        if signed > self._crit_signed:
+            return Severity.CRITICAL
+        if signed > self._warn_signed:
+            return Severity.HIGH
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSample:
     """A single metric measurement."""
     device_id: str
@@ -66,18 +88,139 @@ class MetricSample:
     labels: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
-    """A triggered alert from threshold violation or anomaly detection."""
+    """
+    A triggered alert from threshold violation or anomaly detection.
+
+    Threshold alerts carry their rule and leave ``message`` unset until
+    :meth:`render_message` is first called, so alert storms do not pay
+    for string formatting nobody reads.
+    """
     alert_id: str
     device_id: str
     metric_name: str
     severity: Severity
     current_value: float
     threshold_value: float
-    message: str
+    message: str | None = None
     timestamp: float = field(default_factory=time.time)
     acknowledged: bool = False
+    rule: ThresholdRule | None = field(default=None, repr=False, compare=False)
+
+    def render_message(self) -> str:
+        """Return the human-readable message, formatting it on first use."""
+        if self.message is None:
+            description = self.rule.description if self.rule else ""
+            self.message = (
+                f"{description}: {self.metric_name}="
+                f"{self.current_value:.2f} exceeds threshold {self.threshold_value}"
+            )
+        return self.message
+
+
+# Alerts retained for audit and lookup; the oldest are evicted past this
+DEFAULT_ALERT_RETENTION = 100_000
+
+# Samples retained per device metric, and how many of the most recent ones
+# the rolling anomaly statistics cover
+HISTORY_CAPACITY = 1000
+ANOMALY_WINDOW = 100
+
+# Samples within this many std of the rolling mean cannot reach |z| > 3, so
+# check_device skips scoring them (the margin absorbs float rounding)
+_ANOMALY_PREFILTER_Z = 2.99
+
+
+@dataclass(slots=True)
+class WelfordState:
+    """Welford online mean/variance, with removal for sliding windows."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+
+    @property
+    def std(self) -> float:
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+class MetricSeries:
+    """
+    Fixed-capacity ring buffer of samples for one device metric.
+
+    Samples are stored as parallel preallocated ``array('d')`` columns of
+    values and timestamps, so appends never reallocate and no
+    MetricSample objects are retained. A WelfordState over the most recent ``window`` values is
+    updated on every append and eviction, making the rolling mean and
+    standard deviation O(1) to read.
+    """
+
+    __slots__ = ("capacity", "window", "stats", "_values", "_timestamps", "_head", "_count")
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY, window: int = ANOMALY_WINDOW) -> None:
+        self.capacity = capacity
+        self.window = min(window, capacity)
+        self._values = array("d", bytes(8 * capacity))
+        self._timestamps = array("d", bytes(8 * capacity))
+        self.stats = WelfordState()
+        self._head = 0  # next write position
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float, timestamp: float = 0.0) -> None:
+        """Add a sample, evicting the oldest once the buffer is full."""
+        if self.stats.count >= self.window:
+            # The value sliding out of the stats window
+            self.stats.remove(self._values[(self._head - self.window) % self.capacity])
+        self._values[self._head] = value
+        self._timestamps[self._head] = timestamp
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        self.stats.update(value)
+
+    def last(self) -> float:
+        """Most recently appended value."""
+        if not self._count:
+            raise IndexError("empty series")
+        return self._values[self._head - 1]
+
+    def _tail(self, column: array, n: int | None) -> list[float]:
+        n = self._count if n is None else min(n, self._count)
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return column[start:start + n].tolist()
+        return column[start:].tolist() + column[:self._head].tolist()
+
+    def values(self, n: int | None = None) -> list[float]:
+        """The most recent ``n`` values (default: all), oldest first."""
+        return self._tail(self._values, n)
+
+    def timestamps(self, n: int | None = None) -> list[float]:
+        """Collection times matching :meth:`values`, oldest first."""
+        return self._tail(self._timestamps, n)
+
+    def window_stats(self) -> tuple[int, float, float]:
+        """(count, mean, std) over the most recent ``window`` values."""
+        stats = self.stats
+        return stats.count, stats.mean, stats.std
 
 
 class MonitorAgent(BaseAgent):
@@ -89,7 +232,9 @@ class MonitorAgent(BaseAgent):
     resolution pipeline.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, seed: int | None = None, alert_retention: int = DEFAULT_ALERT_RETENTION,
+    ) -> None:
         super().__init__(
             name="MonitorAgent",
             description="Collects metrics, evaluates thresholds, detects anomalies",
@@ -101,10 +246,28 @@ class MonitorAgent(BaseAgent):
             ],
         )
         self.rules: list[ThresholdRule] = []
-        self.metric_history: dict[str, list[MetricSample]] = {}
-        self.alerts: list[Alert] = []
+        self._rules_by_metric: dict[str, list[ThresholdRule]] = defaultdict(list)
+        # metric_name -> [(sign, warn_signed, crit_signed, rule)] for the hot loops
+        self._rule_rows: dict[str, list[tuple[float, float, float, ThresholdRule]]] = (
+            defaultdict(list)
+        )
+        # metric_name -> (lo, hi): values inside the closed interval trip no rule
+        self._quiet_bounds: dict[str, tuple[float, float]] = {}
+        self.metric_history: dict[str, MetricSeries] = {}
+        self.alerts: deque[Alert] = deque(maxlen=alert_retention)
+        self._alerts_by_id: dict[str, Alert] = {}
+        # Unacknowledged alerts, in creation order (dicts used as ordered sets)
+        self._active: dict[str, Alert] = {}
+        self._active_by_severity: dict[Severity, dict[str, Alert]] = defaultdict(dict)
         self._alert_counter = 0
         self._mock_metrics: dict[str, dict[str, float]] = {}
+        # Per-agent generator for mock jitter; pass a seed for reproducible runs
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()  # Random.gauss is not thread-safe
+        # device_id -> (metric names, base values, jitter sigmas)
+        self._mock_columns: dict[
+            str, tuple[tuple[str, ...], tuple[float, ...], tuple[float, ...]]
+        ] = {}
 
         # Register message handlers
         self.register_handler("collect_metrics", self._handle_collect_metrics)
@@ -116,7 +279,7 @@ class MonitorAgent(BaseAgent):
 
     def _setup_default_rules(self) -> None:
         """Configure default monitoring rules."""
-        self.rules = [
+        for rule in [
             ThresholdRule("cpu_percent", 80.0, 95.0, "gt", 60, "CPU utilization"),
             ThresholdRule("memory_percent", 85.0, 95.0, "gt", 60, "Memory utilization"),
             ThresholdRule("disk_percent", 80.0, 90.0, "gt", 300, "Disk utilization"),
@@ -124,7 +287,27 @@ class MonitorAgent(BaseAgent):
             ThresholdRule("response_time_ms", 500.0, 2000.0, "gt", 30, "API response time"),
             ThresholdRule("bgp_prefixes", 100.0, 50.0, "lt", 10, "BGP received prefixes drop"),
             ThresholdRule("link_state", 1.0, 0.5, "lt", 5, "Link state (1=up, 0=down)"),
-        ]
+        ]:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: ThresholdRule) -> None:
+        """Register a threshold rule and index it by metric name."""
+        self.rules.append(rule)
+        self._rules_by_metric[rule.metric_name].append(rule)
+        if rule._sign:
+            self._rule_rows[rule.metric_name].append(
+                (rule._sign, rule._warn_signed, rule._crit_signed, rule)
+            )
+
+        # A rule fires when sign * value exceeds a signed threshold, so it stays
+        # quiet while sign * value <= the smaller of the two
+        lo, hi = self._quiet_bounds.get(rule.metric_name, (-math.inf, math.inf))
+        limit = min(rule._warn_signed, rule._crit_signed)
+        if rule._sign > 0:
+            hi = min(hi, limit)
+        elif rule._sign < 0:
+            lo = max(lo, -limit)
+        self._quiet_bounds[rule.metric_name] = (lo, hi)
 
     def setup_mock_device(self, device_id: str, scenario: str = "healthy") -> None:
         """
@@ -161,154 +344,314 @@ class MonitorAgent(BaseAgent):
             metrics.update(scenario_overrides[scenario])
 
         self._mock_metrics[device_id] = metrics
+        self._mock_columns[device_id] = (
+            tuple(metrics),
+            tuple(metrics.values()),
+            # 2% gaussian jitter; link_state is binary so it gets none
+            tuple(0.0 if name == "link_state" else value * 0.02 for name, value in metrics.items()),
+        )
         self._log_action("mock_device_setup", {"device_id": device_id, "scenario": scenario})
 
-    def collect_metrics(self, device_id: str) -> list[MetricSample]:
+    def _record_samples(self, device_id: str) -> tuple[list[MetricSample], list[MetricSeries]]:
         """
-        Collect current metrics from a device.
+        Draw one sample per mock metric and append each to its history series.
 
-        Uses mock metrics with realistic jitter for demonstration.
+        Only touches this device's history, so it may run on a worker
+        thread; the caller logs the collection.
         """
-        if device_id not in self._mock_metrics:
-            self.setup_mock_device(device_id)
-
+        names, bases, sigmas = self._mock_columns[device_id]
+        # Add realistic jitter: one gauss(base, sigma) draw per metric, clamped at 0.
+        # Values keep full precision; reports round them for display.
+        with self._rng_lock:
+            drawn = list(map(self._rng.gauss, bases, sigmas))
+        values = map(max, repeat(0.0), drawn)
+
+        # One clock read per collection; every sample shares it
+        now = time.time()
         samples = []
-        for metric_name, base_value in self._mock_metrics[device_id].items():
-            # Add realistic jitter
-            if metric_name == "link_state":
-                value = base_value  # binary metric
-            else:
-                jitter = random.gauss(0, base_value * 0.02)
-                value = max(0, base_value + jitter)
-
+        touched = []
+        for metric_name, value in zip(names, values, strict=True):
             sample = MetricSample(
                 device_id=device_id,
                 metric_name=metric_name,
-                value=round(value, 3),
+                value=value,
+                timestamp=now,
             )
             samples.append(sample)
 
-            # Store in history
+            # Store in history (ring buffer keeps the last HISTORY_CAPACITY values)
             key = f"{device_id}:{metric_name}"
-            if key not in self.metric_history:
-                self.metric_history[key] = []
-            self.metric_history[key].append(sample)
+            series = self.metric_history.get(key)
+            if series is None:
+                series = self.metric_history[key] = MetricSeries()
+            series.append(sample.value, sample.timestamp)
+            touched.append(series)
 
-            # Keep last 1000 samples per metric
-            if len(self.metric_history[key]) > 1000:
-                self.metric_history[key] = self.metric_history[key][-1000:]
+        return samples, touched
 
+    def _log_collected(self, device_id: str, samples: list[MetricSample]) -> None:
         self._log_action("metrics_collected", {
             "device_id": device_id,
             "sample_count": len(samples),
         })
-        return samples
 
-    def evaluate_metrics(self, samples: list[MetricSample]) -> list[Alert]:
-        """Evaluate collected metrics against all threshold rules."""
-        new_alerts = []
+    def collect_metrics(self, device_id: str) -> list[MetricSample]:
+        """
+        Collect current metrics from a device.
 
-        for sample in samples:
-            for rule in self.rules:
-                if rule.metric_name != sample.metric_name:
-                    continue
-
-                severity = rule.evaluate(sample.value)
-                if severity:
-                    self._alert_counter += 1
-                    alert = Alert(
-                        alert_id=f"ALT-{self._alert_counter:06d}",
-                        device_id=sample.device_id,
-                        metric_name=sample.metric_name,
-                        severity=severity,
-                        current_value=sample.value,
-                        threshold_value=(
-                            rule.critical_threshold
-                            if severity == Severity.CRITICAL
-                            else rule.warning_threshold
-                        ),
-                        message=(
-                            f"{rule.description}: {sample.metric_name}="
-                            f"{sample.value:.2f} exceeds threshold "
-                            f"{rule.critical_threshold if severity == Severity.CRITICAL else rule.warning_threshold}"
-                        ),
-                    )
-                    new_alerts.append(alert)
-                    self.alerts.append(alert)
+        Uses mock metrics with realistic jitter for demonstration.
+        """
+        if device_id not in self._mock_metrics:
+            self.setup_mock_device(device_id)
+        samples = self._record_samples(device_id)[0]
+        self._log_collected(device_id, samples)
+        return samples
 
+    def _make_alert(
+        self, device_id: str, metric_name: str, value: float,
+        rule: ThresholdRule, severity: Severity, timestamp: float,
+    ) -> Alert:
+        """Create and record an alert for a rule violation."""
+        threshold = (
+            rule.critical_threshold
+            if severity == Severity.CRITICAL
+            else rule.warning_threshold
+        )
+        self._alert_counter += 1
+        alert = Alert(
+            alert_id=f"ALT-{self._alert_counter:06d}",
+            device_id=device_id,
+            metric_name=metric_name,
+            severity=severity,
+            current_value=value,
+            threshold_value=threshold,
+            timestamp=timestamp,
+            rule=rule,
+        )
+        if len(self.alerts) == self.alerts.maxlen:
+            self._forget_alert(self.alerts[0])
+        self.alerts.append(alert)
+        self._alerts_by_id[alert.alert_id] = alert
+        self._active[alert.alert_id] = alert
+        self._active_by_severity[severity][alert.alert_id] = alert
+        return alert
+
+    def _forget_alert(self, alert: Alert) -> None:
+        """Drop an alert that is being evicted from retention from every index."""
+        self._alerts_by_id.pop(alert.alert_id, None)
+        self._active.pop(alert.alert_id, None)
+        self._active_by_severity[alert.severity].pop(alert.alert_id, None)
+
+    def _log_alerts(self, new_alerts: list[Alert]) -> None:
         if new_alerts:
             self._log_action("alerts_generated", {
                 "count": len(new_alerts),
                 "severities": [a.severity.value for a in new_alerts],
             })
 
+    def _threshold_hits(
+        self, metric_name: str, value: float,
+    ) -> Sequence[tuple[ThresholdRule, Severity]]:
+        """
+        Rules a value violates, each with the severity it trips.
+
+        Values inside a metric's quiet bounds (or metrics with no rules)
+        return an empty tuple without touching the rule table.
+        """
+        bounds = self._quiet_bounds.get(metric_name)
+        if bounds is None or bounds[0] <= value <= bounds[1]:
+            return ()
+        hits = []
+        for sign, warn, crit, rule in self._rule_rows[metric_name]:
+            signed = sign * value
+            if signed > crit:
+                hits.append((rule, Severity.CRITICAL))
+            elif signed > warn:
+                hits.append((rule, Severity.HIGH))
+        return hits
+
+    def evaluate_metrics(self, samples: list[MetricSample]) -> list[Alert]:
+        """Evaluate collected metrics against all threshold rules."""
+        new_alerts = []
+        now = time.time()
+
+        for sample in samples:
+            for rule, severity in self._threshold_hits(sample.metric_name, sample.value):
+                new_alerts.append(self._make_alert(
+                    sample.device_id, sample.metric_name, sample.value, rule, severity, now,
+                ))
+
+        self._log_alerts(new_alerts)
         return new_alerts
 
-    def detect_anomaly(self, device_id: str, metric_name: str) -> dict[str, Any] | None:
+    def evaluate_metrics_batch(
+        self,
+        device_ids: Sequence[str],
+        values_by_metric: Mapping[str, Sequence[float]],
+    ) -> list[Alert]:
         """
-        Simple anomaly detection using rolling statistics.
+        Evaluate one metric column per rule across many devices at once.
 
-        Compares current value against the rolling mean +/- 3 standard deviations.
+        ``values_by_metric[name][i]`` is the value of ``name`` on
+        ``device_ids[i]``. Each column is multiplied by a rule sign once,
+        then compared against the signed thresholds from the rule table
+        with C-level ``map``/``compress`` rather than calling
+        ThresholdRule.evaluate per sample.
         """
-        key = f"{device_id}:{metric_name}"
-        history = self.metric_history.get(key, [])
+        new_alerts = []
+        positions = range(len(device_ids))
+        now = time.time()
+
+        for metric_name, values in values_by_metric.items():
+            rows = self._rule_rows.get(metric_name)
+            if not rows:
+                continue
+            signed_columns: dict[float, list[float]] = {}
+            for sign, warn, crit, rule in rows:
+                signed = signed_columns.get(sign)
+                if signed is None:
+                    signed = signed_columns[sign] = list(map(mul, repeat(sign), values))
+                # lt(threshold, v) is v > threshold
+                critical = set(compress(positions, map(lt, repeat(crit), signed)))
+                warning = compress(positions, map(lt, repeat(warn), signed))
+                for i in sorted(critical.union(warning)):
+                    severity = Severity.CRITICAL if i in critical else Severity.HIGH
+                    new_alerts.append(self._make_alert(
+                        device_ids[i], metric_name, values[i], rule, severity, now,
+                    ))
+
+        self._log_alerts(new_alerts)
+        return new_alerts
 
-        if len(history) < 10:
+    def evaluate_metric_matrix(
+        self,
+        device_ids: Sequence[str],
+        metric_names: Sequence[str],
+        rows: Iterable[Sequence[float]],
+    ) -> list[Alert]:
+        """
+        Evaluate an (N_devices x N_metrics) matrix of values.
+
+        ``rows[i][j]`` is ``metric_names[j]`` on ``device_ids[i]``. The
+        matrix is transposed into per-metric columns and handed to
+        :meth:`evaluate_metrics_batch`.
+        """
+        columns = list(zip(*rows, strict=True)) or [()] * len(metric_names)
+        if len(columns) != len(metric_names):
+            raise ValueError(
+                f"expected {len(metric_names)} values per row, got {len(columns)}"
+            )
+        values_by_metric = dict(zip(metric_names, columns, strict=True))
+        return self.evaluate_metrics_batch(device_ids, values_by_metric)
+
+    @staticmethod
+    def _score_anomaly(
+        series: MetricSeries, device_id: str, metric_name: str,
+    ) -> dict[str, Any] | None:
+        """Z-score the latest value of a series against its rolling window."""
+        stats = series.stats
+        if stats.count < 10:
             return None
 
-        values = [s.value for s in history[-100:]]
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std = variance ** 0.5
+        mean, std = stats.mean, stats.std
 
         if std == 0:
             return None
 
-        current = history[-1].value
+        current = series.last()
         z_score = (current - mean) / std
 
         if abs(z_score) > 3.0:
-            result = {
+            return {
                 "device_id": device_id,
                 "metric_name": metric_name,
-                "current_value": current,
+                "current_value": round(current, 3),
                 "mean": round(mean, 3),
                 "std": round(std, 3),
                 "z_score": round(z_score, 3),
                 "anomaly": True,
                 "direction": "high" if z_score > 0 else "low",
             }
-            self._log_action("anomaly_detected", result)
-            return result
-
         return None
 
-    def check_device(self, device_id: str) -> dict[str, Any]:
+    def detect_anomaly(self, device_id: str, metric_name: str) -> dict[str, Any] | None:
         """
-        Full health check: collect metrics, evaluate thresholds, detect anomalies.
+        Simple anomaly detection using rolling statistics.
 
-        Returns a complete health report for the device.
+        Compares current value against the rolling mean +/- 3 standard
+        deviations of the last ANOMALY_WINDOW samples.
         """
-        samples = self.collect_metrics(device_id)
-        alerts = self.evaluate_metrics(samples)
-        anomalies = []
+        series = self.metric_history.get(f"{device_id}:{metric_name}")
+        if series is None:
+            return None
 
-        for sample in samples:
-            anomaly = self.detect_anomaly(device_id, sample.metric_name)
-            if anomaly:
-                anomalies.append(anomaly)
+        result = self._score_anomaly(series, device_id, metric_name)
+        if result:
+            self._log_action("anomaly_detected", result)
+        return result
+
+    def _scan_device(self, device_id: str) -> tuple[
+        list[MetricSample],
+        list[tuple[str, float, ThresholdRule, Severity]],
+        list[dict[str, Any]],
+    ]:
+        """
+        Collect a device's metrics and find its rule violations and anomalies.
+
+        Threshold evaluation and anomaly scoring run in a single pass over
+        the freshly recorded samples, reusing each sample's history series
+        instead of looking it up again by key. Violations are returned as
+        (metric, value, rule, severity) rather than turned into alerts, so
+        this touches no shared alert state and is safe on worker threads.
+        """
+        samples, touched = self._record_samples(device_id)
+        violations: list[tuple[str, float, ThresholdRule, Severity]] = []
+        anomalies: list[dict[str, Any]] = []
+
+        for sample, series in zip(samples, touched, strict=True):
+            value = sample.value
+            # The healthy common case stops at the quiet bounds and the z prefilter
+            violations.extend(
+                (sample.metric_name, value, rule, severity)
+                for rule, severity in self._threshold_hits(sample.metric_name, value)
+            )
+            stats = series.stats
+            if stats.count >= 10 and abs(value - stats.mean) > _ANOMALY_PREFILTER_Z * stats.std:
+                anomaly = self._score_anomaly(series, device_id, sample.metric_name)
+                if anomaly:
+                    anomalies.append(anomaly)
+
+        return samples, violations, anomalies
+
+    def _publish_scan(
+        self,
+        device_id: str,
+        samples: list[MetricSample],
+        violations: list[tuple[str, float, ThresholdRule, Severity]],
+        anomalies: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Raise alerts and log a scan's results, returning the health report."""
+        now = samples[0].timestamp if samples else time.time()
+        self._log_collected(device_id, samples)
+        alerts = [
+            self._make_alert(device_id, metric_name, value, rule, severity, now)
+            for metric_name, value, rule, severity in violations
+        ]
+        self._log_alerts(alerts)
+        for anomaly in anomalies:
+            self._log_action("anomaly_detected", anomaly)
 
         report = {
             "device_id": device_id,
-            "timestamp": time.time(),
-            "metrics": {s.metric_name: s.value for s in samples},
+            "timestamp": now,
+            "metrics": {s.metric_name: round(s.value, 3) for s in samples},
             "alerts": [
                 {
                     "alert_id": a.alert_id,
                     "severity": a.severity.value,
                     "metric": a.metric_name,
-                    "value": a.current_value,
-                    "message": a.message,
+                    "value": round(a.current_value, 3),
+                    "message": a.render_message(),
                 }
                 for a in alerts
             ],
@@ -318,21 +661,55 @@ class MonitorAgent(BaseAgent):
 
         return report
 
+    def check_device(self, device_id: str) -> dict[str, Any]:
+        """
+        Full health check: collect metrics, evaluate thresholds, detect anomalies.
+
+        Returns a complete health report for the device.
+        """
+        if device_id not in self._mock_metrics:
+            self.setup_mock_device(device_id)
+        return self._publish_scan(device_id, *self._scan_device(device_id))
+
+    def check_fleet(
+        self, device_ids: Iterable[str], max_workers: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Health-check many devices, scanning them on a thread pool.
+
+        Each worker only reads and appends its own device's history. Alerts,
+        indices and the action log are updated on the calling thread as
+        results come back, in ``device_ids`` order, so no locking is needed
+        around them and alert IDs are assigned deterministically.
+        """
+        device_ids = list(dict.fromkeys(device_ids))
+        for device_id in device_ids:
+            if device_id not in self._mock_metrics:
+                self.setup_mock_device(device_id)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            scans = pool.map(self._scan_device, device_ids)
+            return {
+                device_id: self._publish_scan(device_id, *scan)
+                for device_id, scan in zip(device_ids, scans, strict=True)
+            }
+
     def get_active_alerts(self, severity: Severity | None = None) -> list[Alert]:
         """Get all unacknowledged alerts, optionally filtered by severity."""
-        alerts = [a for a in self.alerts if not a.acknowledged]
         if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-        return alerts
+            return list(self._active_by_severity.get(severity, {}).values())
+        return list(self._active.values())
 
     def acknowledge_alert(self, alert_id: str) -> bool:
         """Acknowledge an alert by ID."""
-        for alert in self.alerts:
-            if alert.alert_id == alert_id:
-                alert.acknowledged = True
-                self._log_action("alert_acknowledged", {"alert_id": alert_id})
-                return True
-        return False
+        alert = self._alerts_by_id.get(alert_id)
+        if alert is None:
+            return False
+        alert.acknowledged = True
+        self._active.pop(alert_id, None)
+        self._active_by_severity[alert.severity].pop(alert_id, None)
+        self._log_action("alert_acknowledged", {"alert_id": alert_id})
+        return True
 
     # Message handlers
     def _handle_collect_metrics(self, message: dict[str, Any]) -> dict[str, Any]:
@@ -342,7 +719,7 @@ class MonitorAgent(BaseAgent):
 
     def _handle_add_rule(self, message: dict[str, Any]) -> dict[str, Any]:
         rule = ThresholdRule(**message.get("rule", {}))
-        self.rules.append(rule)
+        self.add_rule(rule)
         return {"type": "rule_added", "metric": rule.metric_name}
 
     def _handle_get_alerts(self, message: dict[str, Any]) -> dict[str, Any]:
@@ -357,7 +734,7 @@ class MonitorAgent(BaseAgent):
                     "alert_id": a.alert_id,
                     "severity": a.severity.value,
                     "device_id": a.device_id,
-                    "message": a.message,
+                    "message": a.render_message(),
                 }
                 for a in alerts
             ],
@@ -12,13 +12,30 @@ Every plan includes:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import graphlib
+import itertools
 import time
-import uuid
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Iterable, Protocol
 
 from agentops.agents.base import BaseAgent
+from agentops.ids import short_hex
+from agentops.serialization import dumps, loads
+from agentops.snapshots import SnapshotStore
+
+# Plans kept in memory in front of a snapshot store
+DEFAULT_PLAN_CACHE_SIZE = 256
+
+# Approval decisions remembered for await_approval(); older ones are
+# rebuilt from the plan itself
+MAX_DECISIONS = 1024
+
+# Where step-level audit entries go: _log_action, or an ActionBatch's add
+LogFn = Callable[[str, dict[str, Any]], None]
 
 
 class RemediationStatus(str, Enum):
@@ -41,7 +58,7 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"  # destructive, multi-device
 
 
-@dataclass
+@dataclass(slots=True)
 class RemediationStep:
     """A single atomic remediation step."""
     step_id: str
@@ -55,9 +72,10 @@ class RemediationStep:
     requires_approval: bool = False
     executed: bool = False
     result: str = ""
+    dependencies: list[str] = field(default_factory=list)  # step_ids this step builds on
 
 
-@dataclass
+@dataclass(slots=True)
 class RemediationPlan:
     """Complete remediation plan with steps, rollback, and approval."""
     plan_id: str
@@ -78,6 +96,116 @@ class RemediationPlan:
     rollback_triggered: bool = False
 
 
+class BatchExecutor(Protocol):
+    """Runs all of a plan's steps for one target in a single session."""
+
+    def execute_batch(self, target: str, steps: list[RemediationStep]) -> list[str]:
+        """Execute ``steps`` in order on ``target``, returning one result per step."""
+        ...
+
+
+class SimulatedExecutor:
+    """Mock executor: every step succeeds without touching a device."""
+
+    def execute_batch(self, target: str, steps: list[RemediationStep]) -> list[str]:
+        return [f"Simulated: {step.action} on {target} — SUCCESS" for step in steps]
+
+
+def group_steps_by_target(steps: list[RemediationStep]) -> list[tuple[str, list[RemediationStep]]]:
+    """
+    Group steps per target, in order of each target's first step.
+
+    Step order within a target is preserved; steps for different targets
+    are assumed independent of each other.
+    """
+    groups: dict[str, list[RemediationStep]] = {}
+    for step in sorted(steps, key=lambda s: s.order):
+        groups.setdefault(step.target, []).append(step)
+    return list(groups.items())
+
+
+def _plan_summary(plan: RemediationPlan) -> dict[str, Any]:
+    """Human-readable summary of a plan, as served by the approvals API."""
+    return {
+        "plan_id": plan.plan_id,
+        "incident_id": plan.incident_id,
+        "description": plan.description,
+        "risk_level": plan.risk_level.value,
+        "status": plan.status.value,
+        "steps": [
+            {
+                "order": s.order,
+                "action": s.action,
+                "target": s.target,
+                "description": s.params.get("description", ""),
+                "rollback": s.rollback_action,
+                "executed": s.executed,
+            }
+            for s in plan.steps
+        ],
+        "blast_radius": plan.blast_radius,
+        "estimated_duration": f"{plan.estimated_duration_seconds}s",
+        "approved_by": plan.approved_by,
+    }
+
+
+def rollback_waves(steps: list[RemediationStep]) -> list[list[RemediationStep]]:
+    """
+    Order steps for rollback as waves of mutually independent steps.
+
+    A step is undone only after every step that depends on it, so each
+    wave can run concurrently once the previous one finished. Plans with
+    no recorded dependencies, or with a dependency cycle, fall back to
+    strict reverse order, one step per wave.
+    """
+    by_id = {step.step_id: step for step in steps}
+    if not any(step.dependencies for step in steps):
+        return [[step] for step in reversed(steps)]
+
+    # Reverse graph: a step's predecessors are the steps depending on it
+    sorter: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter()
+    for step in steps:
+        sorter.add(step.step_id)
+        for dep in step.dependencies:
+            if dep in by_id:
+                sorter.add(dep, step.step_id)
+    try:
+        sorter.prepare()
+    except graphlib.CycleError:
+        return [[step] for step in reversed(steps)]
+
+    waves = []
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        waves.append(sorted((by_id[i] for i in ready), key=lambda s: -s.order))
+        sorter.done(*ready)
+    return waves
+
+
+def plan_to_dict(plan: RemediationPlan) -> dict[str, Any]:
+    """Snapshot a plan, including its steps, as JSON-ready data."""
+    return asdict(plan)
+
+
+def plan_from_dict(data: dict[str, Any]) -> RemediationPlan:
+    """Rebuild a plan from :func:`plan_to_dict` output."""
+    data = dict(data)
+    data["risk_level"] = RiskLevel(data["risk_level"])
+    data["status"] = RemediationStatus(data["status"])
+    data["steps"] = [RemediationStep(**step) for step in data.get("steps", [])]
+    return RemediationPlan(**data)
+
+
+@dataclass(slots=True)
+class ApprovalDecision:
+    """The human (or policy) decision that resolves a plan's approval gate."""
+    plan_id: str
+    approved: bool
+    decided_by: str
+    reason: str = ""
+    decided_at: float = field(default_factory=time.time)
+
+
 # Remediation templates for each incident type
 REMEDIATION_TEMPLATES: dict[str, dict[str, Any]] = {
     "cpu_spike": {
@@ -166,11 +294,13 @@ REMEDIATION_TEMPLATES: dict[str, dict[str, Any]] = {
                 "action": "activate_failover",
                 "description": "Activate backup path if available",
                 "rollback": "deactivate_failover",
+                "depends_on": ["check_physical_layer"],
             },
             {
                 "action": "verify_connectivity",
                 "description": "Verify end-to-end connectivity restored",
                 "rollback": "none",
+                "depends_on": ["bounce_interface", "activate_failover"],
             },
         ],
     },
@@ -203,6 +333,62 @@ REMEDIATION_TEMPLATES: dict[str, dict[str, Any]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A remediation template parsed once into step prototypes."""
+    description: str
+    risk_level: RiskLevel
+    steps: tuple[RemediationStep, ...]
+    # Per step, the indices of the earlier steps it depends on
+    dependencies: tuple[tuple[int, ...], ...] = ()
+
+
+def compile_template(template: dict[str, Any]) -> CompiledTemplate:
+    """
+    Turn a REMEDIATION_TEMPLATES entry into a CompiledTemplate.
+
+    Prototype steps carry everything but the per-plan fields (step_id,
+    target, dependencies), with ``order`` and ``requires_approval``
+    already resolved. A step depends on the actions listed in its
+    ``depends_on``, or on the previous step if it names none.
+    """
+    risk_level = RiskLevel(template["risk_level"])
+    index_by_action = {t["action"]: i for i, t in enumerate(template["steps"])}
+    dependencies = tuple(
+        tuple(index_by_action[a] for a in step_tmpl["depends_on"])
+        if "depends_on" in step_tmpl else ((i - 1,) if i else ())
+        for i, step_tmpl in enumerate(template["steps"])
+    )
+    gated = risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL)
+    steps = tuple(
+        RemediationStep(
+            step_id="",
+            order=i + 1,
+            action=step_tmpl["action"],
+            target="",
+            params={"description": step_tmpl["description"]},
+            rollback_action=step_tmpl.get("rollback", "none"),
+            requires_approval=gated and i == 0,
+        )
+        for i, step_tmpl in enumerate(template["steps"])
+    )
+    return CompiledTemplate(template["description"], risk_level, steps, dependencies)
+
+
+_COMPILED_TEMPLATES: dict[str, CompiledTemplate] = {
+    name: compile_template(template) for name, template in REMEDIATION_TEMPLATES.items()
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _escalation_template(incident_type: str) -> CompiledTemplate:
+    return compile_template({
+        "description": f"Manual remediation required for {incident_type}",
+        "risk_level": "high",
+        "steps": [{"action": "escalate", "description": "Escalate to on-call", "rollback": "none"}],
+    })
+
+
 class RemediatorAgent(BaseAgent):
     """
     Remediation agent that generates, manages, and executes fix plans.
@@ -212,9 +398,19 @@ class RemediatorAgent(BaseAgent):
     - Human approval required before execution (HITL gate)
     - Blast radius is assessed and bounded
     - All actions are logged for audit
+
+    With a SnapshotStore, every plan is persisted on each status change and
+    ``plans`` becomes an LRU cache of the most recently used plans, so
+    pending approvals survive a restart. A plan evicted from the cache is
+    reloaded from the store as a new object.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        store: SnapshotStore | None = None,
+        cache_size: int = DEFAULT_PLAN_CACHE_SIZE,
+        executor: BatchExecutor | None = None,
+    ) -> None:
         super().__init__(
             name="RemediatorAgent",
             description="Generates remediation plans with rollback and HITL approval",
@@ -226,11 +422,22 @@ class RemediatorAgent(BaseAgent):
                 "change_execution",
             ],
         )
-        self.plans: dict[str, RemediationPlan] = {}
+        self.plans: OrderedDict[str, RemediationPlan] = OrderedDict()
+        self._store = store
+        self._cache_size = cache_size
+        # IDs of plans awaiting approval, in creation order (dict as ordered set)
+        self._awaiting: dict[str, None] = {}
+        self.executor: BatchExecutor = executor or SimulatedExecutor()
+        self._step_seq = itertools.count(1)
         self._max_blast_radius = 10  # Safety limit
+        # Approval gate: recent decisions (oldest first), and one future per
+        # coroutine suspended in await_approval() on a plan not yet decided
+        self._decisions: OrderedDict[str, ApprovalDecision] = OrderedDict()
+        self._pending: dict[str, list[asyncio.Future[ApprovalDecision]]] = {}
 
         self.register_handler("generate_plan", self._handle_generate_plan)
         self.register_handler("approve_plan", self._handle_approve_plan)
+        self.register_handler("reject_plan", self._handle_reject_plan)
         self.register_handler("execute_plan", self._handle_execute_plan)
         self.register_handler("rollback_plan", self._handle_rollback_plan)
 
@@ -252,27 +459,23 @@ class RemediatorAgent(BaseAgent):
             "incident_type": incident_type,
         })
 
-        template = REMEDIATION_TEMPLATES.get(incident_type, {
-            "description": f"Manual remediation required for {incident_type}",
-            "risk_level": "high",
-            "steps": [{"action": "escalate", "description": "Escalate to on-call", "rollback": "none"}],
-        })
-
-        risk_level = RiskLevel(template["risk_level"])
+        template = _COMPILED_TEMPLATES.get(incident_type) or _escalation_template(incident_type)
+        risk_level = template.risk_level
 
-        # Build ordered remediation steps
-        steps = []
-        for i, step_tmpl in enumerate(template["steps"]):
-            step = RemediationStep(
-                step_id=f"STEP-{uuid.uuid4().hex[:6]}",
-                order=i + 1,
-                action=step_tmpl["action"],
+        # Stamp the prebuilt prototypes; only IDs and the target vary per plan.
+        # Dict fields are copied so plans never share mutable state.
+        steps = [
+            replace(
+                proto,
+                step_id=self._next_id("STEP", self._step_seq),
                 target=device_id,
-                params={"description": step_tmpl["description"]},
-                rollback_action=step_tmpl.get("rollback", "none"),
-                requires_approval=(risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL) and i == 0),
+                params=dict(proto.params),
+                rollback_params={},
             )
-            steps.append(step)
+            for proto in template.steps
+        ]
+        for step, deps in zip(steps, template.dependencies, strict=True):
+            step.dependencies = [steps[i].step_id for i in deps]
 
         # Assess blast radius
         blast = {
@@ -283,10 +486,10 @@ class RemediatorAgent(BaseAgent):
         }
 
         plan = RemediationPlan(
-            plan_id=f"REM-{uuid.uuid4().hex[:8]}",
+            plan_id=f"REM-{short_hex(8)}",
             incident_id=incident_id,
             diagnosis_report_id=diagnosis_report_id,
-            description=template["description"],
+            description=template.description,
             risk_level=risk_level,
             status=RemediationStatus.AWAITING_APPROVAL,
             steps=steps,
@@ -302,13 +505,18 @@ class RemediatorAgent(BaseAgent):
         # Reject if blast radius exceeds limits
         if blast_radius > self._max_blast_radius:
             plan.status = RemediationStatus.REJECTED
+            self._decide(ApprovalDecision(
+                plan.plan_id, approved=False, decided_by="blast-radius-limit",
+                reason=f"blast radius {blast_radius} exceeds {self._max_blast_radius}",
+            ))
             self._log_action("plan_rejected_blast_radius", {
                 "plan_id": plan.plan_id,
                 "blast_radius": blast_radius,
                 "limit": self._max_blast_radius,
             })
 
-        self.plans[plan.plan_id] = plan
+        self._remember(plan)
+        self._persist(plan)
         self.complete_task(task_id, {"plan_id": plan.plan_id, "status": plan.status.value})
 
         self._log_action("plan_generated", {
@@ -322,15 +530,19 @@ class RemediatorAgent(BaseAgent):
 
     def approve_plan(self, plan_id: str, approved_by: str = "operator") -> RemediationPlan:
         """Approve a remediation plan for execution (HITL gate)."""
-        plan = self.plans.get(plan_id)
+        plan = self._load_plan(plan_id)
         if not plan:
             raise KeyError(f"Unknown plan: {plan_id}")
-        if plan.status != RemediationStatus.AWAITING_APPROVAL:
+        if plan.status is not RemediationStatus.AWAITING_APPROVAL:
             raise ValueError(f"Plan {plan_id} is not awaiting approval (status: {plan.status.value})")
 
         plan.status = RemediationStatus.APPROVED
         plan.approved_at = time.time()
         plan.approved_by = approved_by
+        self._persist(plan)
+        self._decide(ApprovalDecision(
+            plan_id, approved=True, decided_by=approved_by, decided_at=plan.approved_at,
+        ))
 
         self._log_action("plan_approved", {
             "plan_id": plan_id,
@@ -341,83 +553,238 @@ class RemediatorAgent(BaseAgent):
 
     def reject_plan(self, plan_id: str, reason: str = "") -> RemediationPlan:
         """Reject a remediation plan."""
-        plan = self.plans.get(plan_id)
+        plan = self._load_plan(plan_id)
         if not plan:
             raise KeyError(f"Unknown plan: {plan_id}")
 
         plan.status = RemediationStatus.REJECTED
+        self._persist(plan)
+        self._decide(ApprovalDecision(
+            plan_id, approved=False, decided_by="operator", reason=reason,
+        ))
         self._log_action("plan_rejected", {"plan_id": plan_id, "reason": reason})
         return plan
 
-    def execute_plan(self, plan_id: str) -> RemediationPlan:
+    def _decide(self, decision: ApprovalDecision) -> None:
+        """Record a decision and wake any coroutine awaiting it."""
+        self._decisions[decision.plan_id] = decision
+        self._decisions.move_to_end(decision.plan_id)
+        while len(self._decisions) > MAX_DECISIONS:
+            self._decisions.popitem(last=False)
+        for future in self._pending.pop(decision.plan_id, ()):
+            loop = future.get_loop()
+            # A waiter whose loop already closed has nobody left to wake
+            if not future.done() and not loop.is_closed():
+                # Decisions may arrive from another thread (e.g. an API request)
+                loop.call_soon_threadsafe(_resolve_future, future, decision)
+
+    async def await_approval(
+        self, plan_id: str, timeout: float | None = None,
+    ) -> ApprovalDecision:
         """
-        Execute an approved remediation plan.
+        Suspend until a plan's approval gate is decided, without blocking.
 
-        Simulates step-by-step execution with success/failure outcomes.
-        All steps are logged for audit trail.
+        approve_plan() / reject_plan() resolve the wait from any caller, so
+        the agent keeps serving other incidents while a human decides.
+        Raises TimeoutError if no decision arrives within ``timeout``
+        seconds; the plan stays awaiting approval and can be awaited again.
         """
-        plan = self.plans.get(plan_id)
+        plan = self._load_plan(plan_id)
+        if plan is None:
+            raise KeyError(f"Unknown plan: {plan_id}")
+        decision = self._decisions.get(plan_id)
+        if decision is None and plan.status is not RemediationStatus.AWAITING_APPROVAL:
+            # Decided before a restart: rebuild the decision from the snapshot
+            decision = ApprovalDecision(
+                plan_id,
+                approved=plan.approved_by is not None,
+                decided_by=plan.approved_by or "unknown",
+                decided_at=plan.approved_at or plan.created_at,
+            )
+        if decision is not None:
+            return decision
+
+        # One future per waiter: waiters may run on different event loops
+        future: asyncio.Future[ApprovalDecision] = asyncio.get_running_loop().create_future()
+        waiters = self._pending.setdefault(plan_id, [])
+        waiters.append(future)
+        try:
+            # A decision from another thread may have landed before the future was
+            # registered; _decide would then have had nothing to wake
+            decision = self._decisions.get(plan_id)
+            if decision is not None:
+                return decision
+            async with asyncio.timeout(timeout):
+                return await future
+        finally:
+            # Timed out, cancelled or decided: drop this waiter, and the
+            # plan's entry once the last one leaves
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters and self._pending.get(plan_id) is waiters:
+                del self._pending[plan_id]
+
+    def _begin_execution(self, plan_id: str) -> tuple[RemediationPlan, str, int]:
+        """Mark a plan EXECUTING; returns it with its task ID and monotonic start."""
+        plan = self._load_plan(plan_id)
         if not plan:
             raise KeyError(f"Unknown plan: {plan_id}")
-        if plan.status != RemediationStatus.APPROVED:
+        if plan.status is not RemediationStatus.APPROVED:
             raise ValueError(f"Plan {plan_id} not approved (status: {plan.status.value})")
 
         plan.status = RemediationStatus.EXECUTING
         plan.executed_at = time.time()
+        self._persist(plan)
 
         task_id = self.create_task("execute_plan", {"plan_id": plan_id})
+        return plan, task_id, time.monotonic_ns()
 
-        for step in plan.steps:
-            self._log_action("step_executing", {
-                "plan_id": plan_id,
-                "step_id": step.step_id,
-                "action": step.action,
-            })
+    def _log_batch_start(
+        self, log: LogFn, plan_id: str, target: str, steps: list[RemediationStep],
+    ) -> None:
+        log("batch_executing", {
+            "plan_id": plan_id,
+            "target": target,
+            "step_ids": [step.step_id for step in steps],
+        })
 
-            # Simulate execution (all steps succeed in mock mode)
+    def _record_batch(
+        self,
+        log: LogFn,
+        plan_id: str,
+        target: str,
+        steps: list[RemediationStep],
+        results: list[str],
+    ) -> None:
+        for step, result in zip(steps, results, strict=True):
             step.executed = True
-            step.result = f"Simulated: {step.action} on {step.target} — SUCCESS"
+            step.result = result
 
-            self._log_action("step_completed", {
-                "plan_id": plan_id,
-                "step_id": step.step_id,
-                "result": step.result,
-            })
+        log("batch_completed", {
+            "plan_id": plan_id,
+            "target": target,
+            "results": results,
+        })
 
+    def _finish_execution(
+        self, plan: RemediationPlan, task_id: str, start_ns: int,
+    ) -> RemediationPlan:
         plan.status = RemediationStatus.COMPLETED
         plan.completed_at = time.time()
+        self._persist(plan)
 
-        self.complete_task(task_id, {"plan_id": plan_id, "status": "completed"})
+        self.complete_task(task_id, {"plan_id": plan.plan_id, "status": "completed"})
         self._log_action("plan_executed", {
-            "plan_id": plan_id,
-            "duration": plan.completed_at - plan.executed_at,
+            "plan_id": plan.plan_id,
+            # Wall-clock stamps are for display; NTP steps can skew their difference
+            "duration": (time.monotonic_ns() - start_ns) / 1e9,
         })
 
         return plan
 
+    def _fail_execution(self, plan: RemediationPlan, task_id: str, error: BaseException) -> None:
+        """Mark a plan FAILED after its executor raised or returned bad results."""
+        plan.status = RemediationStatus.FAILED
+        plan.completed_at = time.time()
+        self._persist(plan)
+
+        self.fail_task(task_id, str(error))
+        self._log_action("plan_failed", {
+            "plan_id": plan.plan_id,
+            "error": f"{type(error).__name__}: {error}",
+        })
+
+    def execute_plan(self, plan_id: str) -> RemediationPlan:
+        """
+        Execute an approved remediation plan.
+
+        Steps are grouped by target and each group is handed to the
+        executor as one batch. Every batch is logged for audit trail; the
+        entries are appended to the action log together once the loop ends.
+        If the executor raises, or returns the wrong number of results, the
+        plan is marked FAILED and the error re-raised; batches after the
+        failing one are not run.
+        """
+        plan, task_id, start_ns = self._begin_execution(plan_id)
+
+        # One executor session per target instead of one round-trip per step
+        try:
+            with self.log_batch() as batch:
+                for target, steps in group_steps_by_target(plan.steps):
+                    self._log_batch_start(batch.add, plan_id, target, steps)
+                    results = self.executor.execute_batch(target, steps)
+                    self._record_batch(batch.add, plan_id, target, steps, results)
+        except Exception as exc:
+            self._fail_execution(plan, task_id, exc)
+            raise
+
+        return self._finish_execution(plan, task_id, start_ns)
+
+    async def execute_plan_async(self, plan_id: str) -> RemediationPlan:
+        """
+        Execute an approved plan with target groups running concurrently.
+
+        Steps for the same target still run in order within one batch;
+        at most ``_max_blast_radius`` targets are in flight at a time. The
+        executor's ``execute_batch_async`` is used when it has one,
+        otherwise the blocking ``execute_batch`` runs in a worker thread.
+        Batches are logged as they start and finish, so progress is visible
+        while others are still in flight. A failing batch does not cancel
+        the others (a batch in a worker thread can't be stopped anyway):
+        every batch runs to completion and is recorded, then the plan is
+        marked FAILED and the first error re-raised.
+        """
+        plan, task_id, start_ns = self._begin_execution(plan_id)
+        limit = asyncio.Semaphore(self._max_blast_radius)
+        run_async = getattr(self.executor, "execute_batch_async", None)
+
+        async def run_group(target: str, steps: list[RemediationStep]) -> None:
+            async with limit:
+                self._log_batch_start(self._log_action, plan_id, target, steps)
+                if run_async is not None:
+                    results = await run_async(target, steps)
+                else:
+                    results = await asyncio.to_thread(self.executor.execute_batch, target, steps)
+                self._record_batch(self._log_action, plan_id, target, steps, results)
+
+        outcomes = await asyncio.gather(
+            *(run_group(target, steps) for target, steps in group_steps_by_target(plan.steps)),
+            return_exceptions=True,
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            self._fail_execution(plan, task_id, errors[0])
+            raise errors[0]
+
+        return self._finish_execution(plan, task_id, start_ns)
+
     def rollback_plan(self, plan_id: str, reason: str = "verification_failed") -> RemediationPlan:
         """
         Roll back an executed remediation plan.
 
-        Executes rollback actions in reverse order for all completed steps.
+        Executes rollback actions for all completed steps, undoing each
+        step only after every step that depends on it (see rollback_waves).
         """
-        plan = self.plans.get(plan_id)
+        plan = self._load_plan(plan_id)
         if not plan:
             raise KeyError(f"Unknown plan: {plan_id}")
 
         plan.rollback_triggered = True
 
-        # Execute rollback steps in reverse
-        for step in reversed(plan.steps):
-            if step.executed and step.rollback_action != "none":
-                self._log_action("rollback_step", {
-                    "plan_id": plan_id,
-                    "step_id": step.step_id,
-                    "rollback_action": step.rollback_action,
-                })
-                step.result = f"ROLLED BACK: {step.rollback_action}"
+        with self.log_batch() as batch:
+            for wave, steps in enumerate(rollback_waves(plan.steps)):
+                for step in steps:
+                    if step.executed and step.rollback_action != "none":
+                        batch.add("rollback_step", {
+                            "plan_id": plan_id,
+                            "step_id": step.step_id,
+                            "rollback_action": step.rollback_action,
+                            "wave": wave,
+                        })
+                        step.result = f"ROLLED BACK: {step.rollback_action}"
 
         plan.status = RemediationStatus.ROLLED_BACK
+        self._persist(plan)
         self._log_action("plan_rolled_back", {
             "plan_id": plan_id,
             "reason": reason,
@@ -425,41 +792,66 @@ class RemediatorAgent(BaseAgent):
 
         return plan
 
+    def _remember(self, plan: RemediationPlan) -> None:
+        """Put a plan in the in-memory cache, evicting the LRU one if bounded."""
+        self.plans[plan.plan_id] = plan
+        if self._store is not None:
+            self.plans.move_to_end(plan.plan_id)
+            while len(self.plans) > self._cache_size:
+                self.plans.popitem(last=False)
+
+    def _load_plan(self, plan_id: str) -> RemediationPlan | None:
+        """Get a plan from the cache, falling back to the snapshot store."""
+        plan = self.plans.get(plan_id)
+        if plan is not None:
+            if self._store is not None:
+                self.plans.move_to_end(plan_id)
+            return plan
+        if self._store is None:
+            return None
+        blob = self._store.load(plan_id)
+        if blob is None:
+            return None
+        plan = plan_from_dict(loads(blob))
+        self._remember(plan)
+        return plan
+
+    def _persist(self, plan: RemediationPlan) -> None:
+        """Record a plan's new state in the pending index and snapshot store."""
+        if plan.status is RemediationStatus.AWAITING_APPROVAL:
+            self._awaiting[plan.plan_id] = None
+        else:
+            self._awaiting.pop(plan.plan_id, None)
+        if self._store is not None:
+            self._store.save(plan.plan_id, plan.status.value, dumps(plan_to_dict(plan)))
+
     def get_plan(self, plan_id: str) -> RemediationPlan | None:
         """Get a plan by ID."""
-        return self.plans.get(plan_id)
+        return self._load_plan(plan_id)
 
     def get_pending_approvals(self) -> list[RemediationPlan]:
         """Get all plans awaiting approval."""
-        return [p for p in self.plans.values() if p.status == RemediationStatus.AWAITING_APPROVAL]
+        if self._store is not None:
+            status = RemediationStatus.AWAITING_APPROVAL.value
+            plans = (self._load_plan(pid) for pid in self._store.keys(status))
+            return [p for p in plans if p is not None]
+        return [self.plans[pid] for pid in self._awaiting]
 
     def get_plan_summary(self, plan_id: str) -> dict[str, Any]:
         """Get a human-readable plan summary."""
-        plan = self.plans.get(plan_id)
+        plan = self._load_plan(plan_id)
         if not plan:
             return {"error": f"Unknown plan: {plan_id}"}
+        return _plan_summary(plan)
 
-        return {
-            "plan_id": plan.plan_id,
-            "incident_id": plan.incident_id,
-            "description": plan.description,
-            "risk_level": plan.risk_level.value,
-            "status": plan.status.value,
-            "steps": [
-                {
-                    "order": s.order,
-                    "action": s.action,
-                    "target": s.target,
-                    "description": s.params.get("description", ""),
-                    "rollback": s.rollback_action,
-                    "executed": s.executed,
-                }
-                for s in plan.steps
-            ],
-            "blast_radius": plan.blast_radius,
-            "estimated_duration": f"{plan.estimated_duration_seconds}s",
-            "approved_by": plan.approved_by,
-        }
+    def get_plan_summaries(self, plans: Iterable[RemediationPlan]) -> list[dict[str, Any]]:
+        """
+        Summarize plans already in hand, e.g. from get_pending_approvals().
+
+        Skips the per-ID lookup (and, with a snapshot store, the reload)
+        that calling get_plan_summary for each plan would repeat.
+        """
+        return list(map(_plan_summary, plans))
 
     # Message handlers
     def _handle_generate_plan(self, message: dict[str, Any]) -> dict[str, Any]:
@@ -479,6 +871,13 @@ class RemediatorAgent(BaseAgent):
         )
         return {"type": "plan_approved", "plan_id": plan.plan_id}
 
+    def _handle_reject_plan(self, message: dict[str, Any]) -> dict[str, Any]:
+        plan = self.reject_plan(
+            plan_id=message["plan_id"],
+            reason=message.get("reason", ""),
+        )
+        return {"type": "plan_rejected", "plan_id": plan.plan_id}
+
     def _handle_execute_plan(self, message: dict[str, Any]) -> dict[str, Any]:
         plan = self.execute_plan(plan_id=message["plan_id"])
         return {"type": "plan_executed", "plan_id": plan.plan_id, "status": plan.status.value}
@@ -489,3 +888,8 @@ class RemediatorAgent(BaseAgent):
             reason=message.get("reason", "manual_rollback"),
         )
         return {"type": "plan_rolled_back", "plan_id": plan.plan_id}
+
+
+def _resolve_future(future: asyncio.Future[ApprovalDecision], decision: ApprovalDecision) -> None:
+    if not future.done():
+        future.set_result(decision)
@@ -10,13 +10,16 @@ After remediation is executed, the VerifierAgent confirms the fix worked:
 
 from __future__ import annotations
 
+import itertools
 import time
-import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import partial
+from operator import gt, lt
+from typing import Any, Callable
 
 from agentops.agents.base import BaseAgent
+from agentops.ids import short_hex
 
 
 class VerificationResult(str, Enum):
@@ -28,27 +31,60 @@ class VerificationResult(str, Enum):
     TIMED_OUT = "timed_out"
 
 
-@dataclass
+def _sla_comparator(comparison: str, target: float) -> Callable[[float], bool]:
+    """Build the compliance test for one SLA; unknown comparisons always comply."""
+    if comparison == "lt":
+        return partial(gt, target)  # value < target
+    if comparison == "gt":
+        return partial(lt, target)  # value > target
+    if comparison == "eq":
+        return lambda value: abs(value - target) < 0.01
+    return lambda value: True
+
+
+@dataclass(slots=True)
 class SLATarget:
-    """An SLA target for a metric."""
+    """
+    An SLA target for a metric.
+
+    The compliance test is built once from ``comparison`` and
+    ``target_value`` at construction, so treat targets as immutable.
+    """
     metric_name: str
     target_value: float
     comparison: str = "lt"  # lt = value must be less than target
     description: str = ""
+    is_compliant: Callable[[float], bool] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.is_compliant = _sla_comparator(self.comparison, self.target_value)
 
-@dataclass
+
+@dataclass(slots=True)
 class VerificationCheck:
-    """A single verification check result."""
+    """
+    A single verification check result.
+
+    Most checks are only ever counted, so the human-readable description
+    is kept as a format string plus arguments and rendered on first read.
+    """
     check_id: str
     check_type: str  # metric_comparison, sla_check, connectivity, custom
-    description: str
     result: VerificationResult
     details: dict[str, Any] = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
+    description_format: str = ""
+    description_args: tuple[Any, ...] = ()
+    _description: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def description(self) -> str:
+        if self._description is None:
+            self._description = self.description_format.format(*self.description_args)
+        return self._description
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationReport:
     """Complete verification report for a remediation."""
     report_id: str
@@ -59,10 +95,43 @@ class VerificationReport:
     checks: list[VerificationCheck]
     pre_metrics: dict[str, float]
     post_metrics: dict[str, float]
-    improvement: dict[str, float]  # metric_name -> percent improvement
+    improvement: dict[str, float]  # metric_name -> percent change, unrounded
     sla_compliance: dict[str, bool]
     duration_seconds: float
     rollback_recommended: bool
+    # Totals over every check run, including any not kept in ``checks``
+    checks_passed: int = 0
+    checks_failed: int = 0
+
+
+def _overall_result(passed: int, failed: int) -> VerificationResult:
+    """Verdict for a tally: DEGRADED while at most a third of the checks failed."""
+    if failed == 0:
+        return VerificationResult.PASSED
+    if failed <= (passed + failed) // 3:
+        return VerificationResult.DEGRADED
+    return VerificationResult.FAILED
+
+
+class _CheckTally:
+    """Counts check outcomes and decides which checks are kept in the report."""
+
+    __slots__ = ("checks", "passed", "failed", "_keep_passed", "_max_failed")
+
+    def __init__(self, keep_passed: bool, max_failed: int | None) -> None:
+        self.checks: list[VerificationCheck] = []
+        self.passed = 0
+        self.failed = 0
+        self._keep_passed = keep_passed
+        self._max_failed = max_failed
+
+    def keep(self, passed: bool) -> bool:
+        """Count one outcome; True if its VerificationCheck should be built."""
+        if passed:
+            self.passed += 1
+            return self._keep_passed
+        self.failed += 1
+        return self._max_failed is None or self.failed <= self._max_failed
 
 
 # Default SLA targets
@@ -77,6 +146,24 @@ DEFAULT_SLAS = [
 ]
 
 
+# SLAs checked before anything else; once their failures settle a FAILED
+# result, the remaining checks are skipped
+CRITICAL_SLAS = frozenset({"link_state", "cpu_percent"})
+
+
+# For most metrics lower is better (cpu, mem, disk, errors, latency);
+# for these, higher is better
+HIGHER_IS_BETTER = frozenset({"link_state", "bgp_prefixes"})
+
+
+def _percent_change(pre: float, post: float) -> float:
+    return (post - pre) / abs(pre) * 100 if pre != 0 else 0.0
+
+
+def _improved(metric_name: str, pre: float, post: float) -> bool:
+    return post >= pre if metric_name in HIGHER_IS_BETTER else post <= pre
+
+
 class VerifierAgent(BaseAgent):
     """
     Post-remediation verification agent.
@@ -86,7 +173,13 @@ class VerifierAgent(BaseAgent):
     the fix didn't improve things within the configured window.
     """
 
-    def __init__(self, verification_window_seconds: int = 300) -> None:
+    def __init__(
+        self,
+        verification_window_seconds: int = 300,
+        sla_fail_counts: dict[str, int] | None = None,
+        keep_passed_checks: bool = True,
+        max_failed_checks: int | None = None,
+    ) -> None:
         super().__init__(
             name="VerifierAgent",
             description="Post-fix validation, metric comparison, and SLA compliance",
@@ -98,8 +191,19 @@ class VerifierAgent(BaseAgent):
             ],
         )
         self.sla_targets = list(DEFAULT_SLAS)
+        self.critical_slas = set(CRITICAL_SLAS)
+        # metric_name -> SLA failures seen; orders the critical checks so the
+        # likeliest failure is tried first. Pass a saved copy to keep the
+        # learned order across restarts.
+        self.sla_fail_counts: dict[str, int] = dict(sla_fail_counts or {})
+        # Report size bounds for metric floods: passing checks can be counted
+        # without being kept, and kept failures capped
+        self.keep_passed_checks = keep_passed_checks
+        self.max_failed_checks = max_failed_checks
         self.verification_window = verification_window_seconds
-        self.reports: list[VerificationReport] = []
+        # report_id -> report, in creation order
+        self.reports: dict[str, VerificationReport] = {}
+        self._check_seq = itertools.count(1)
 
         self.register_handler("verify", self._handle_verify)
         self.register_handler("set_sla", self._handle_set_sla)
@@ -117,114 +221,65 @@ class VerifierAgent(BaseAgent):
         Compares pre/post metrics, checks SLA compliance, and determines
         whether the fix should be kept or rolled back.
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         task_id = self.create_task("verification", {
             "plan_id": plan_id,
             "incident_id": incident_id,
         })
 
-        checks = []
-
-        # 1. Metric comparison checks
-        improvement = {}
-        for metric_name in pre_metrics:
-            if metric_name in post_metrics:
-                pre_val = pre_metrics[metric_name]
-                post_val = post_metrics[metric_name]
-
-                if pre_val != 0:
-                    pct_change = ((post_val - pre_val) / abs(pre_val)) * 100
-                else:
-                    pct_change = 0.0
-
-                improvement[metric_name] = round(pct_change, 2)
-
-                # Determine if this metric improved
-                # For most metrics, lower is better (cpu, mem, disk, errors, latency)
-                # For link_state and bgp_prefixes, higher is better
-                higher_is_better = metric_name in ("link_state", "bgp_prefixes")
-
-                if higher_is_better:
-                    improved = post_val >= pre_val
-                else:
-                    improved = post_val <= pre_val
-
-                result = VerificationResult.PASSED if improved else VerificationResult.FAILED
-
-                checks.append(VerificationCheck(
-                    check_id=f"CHK-{uuid.uuid4().hex[:6]}",
-                    check_type="metric_comparison",
-                    description=f"{metric_name}: {pre_val:.2f} -> {post_val:.2f} ({pct_change:+.1f}%)",
-                    result=result,
-                    details={
-                        "metric": metric_name,
-                        "pre_value": pre_val,
-                        "post_value": post_val,
-                        "percent_change": pct_change,
-                        "improved": improved,
-                    },
-                ))
+        tally = _CheckTally(self.keep_passed_checks, self.max_failed_checks)
+        improvement: dict[str, float] = {}
+        sla_compliance: dict[str, bool] = {}
+
+        # 1. Critical SLAs first, most often failed first. Once their
+        # failures mean FAILED even if every later check passed, the later
+        # checks are skipped; the verdict is the same as a full run's
+        fail_counts = self.sla_fail_counts
+        critical = sorted(
+            (s for s in self.sla_targets if s.metric_name in self.critical_slas),
+            key=lambda s: -fail_counts.get(s.metric_name, 0),
+        )
+        normal = [s for s in self.sla_targets if s.metric_name not in self.critical_slas]
+        later_checks = (
+            sum(k in post_metrics for k in pre_metrics)
+            + sum(s.metric_name in post_metrics for s in normal)
+        )
+        short_circuited = self._check_slas(
+            critical, post_metrics, tally, sla_compliance, settle_before=later_checks,
+        )
 
-        # 2. SLA compliance checks
-        sla_compliance = {}
-        for sla in self.sla_targets:
-            if sla.metric_name in post_metrics:
-                post_val = post_metrics[sla.metric_name]
-                if sla.comparison == "lt":
-                    compliant = post_val < sla.target_value
-                elif sla.comparison == "gt":
-                    compliant = post_val > sla.target_value
-                elif sla.comparison == "eq":
-                    compliant = abs(post_val - sla.target_value) < 0.01
-                else:
-                    compliant = True
-
-                sla_compliance[sla.metric_name] = compliant
-
-                checks.append(VerificationCheck(
-                    check_id=f"CHK-{uuid.uuid4().hex[:6]}",
-                    check_type="sla_check",
-                    description=f"SLA: {sla.description} — {'PASS' if compliant else 'FAIL'}",
-                    result=VerificationResult.PASSED if compliant else VerificationResult.FAILED,
-                    details={
-                        "sla_metric": sla.metric_name,
-                        "target": sla.target_value,
-                        "actual": post_val,
-                        "compliant": compliant,
-                    },
-                ))
+        if not short_circuited:
+            # 2. Metric comparison checks
+            self._compare_metrics(pre_metrics, post_metrics, tally, improvement)
+            # 3. Remaining SLA compliance checks
+            self._check_slas(normal, post_metrics, tally, sla_compliance)
 
-        # 3. Determine overall result
-        failed_checks = [c for c in checks if c.result == VerificationResult.FAILED]
+        # 4. Determine overall result
         failed_slas = [m for m, compliant in sla_compliance.items() if not compliant]
+        overall_result = _overall_result(tally.passed, tally.failed)
 
-        if len(failed_checks) == 0:
-            overall_result = VerificationResult.PASSED
-        elif len(failed_checks) <= len(checks) // 3:
-            overall_result = VerificationResult.DEGRADED
-        else:
-            overall_result = VerificationResult.FAILED
-
-        rollback_recommended = overall_result == VerificationResult.FAILED
+        rollback_recommended = overall_result is VerificationResult.FAILED
 
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_ns) / 1e9
 
         report = VerificationReport(
-            report_id=f"VER-{uuid.uuid4().hex[:8]}",
+            report_id=f"VER-{short_hex(8)}",
             plan_id=plan_id,
             incident_id=incident_id,
             timestamp=time.time(),
             overall_result=overall_result,
-            checks=checks,
+            checks=tally.checks,
             pre_metrics=pre_metrics,
             post_metrics=post_metrics,
             improvement=improvement,
             sla_compliance=sla_compliance,
             duration_seconds=round(duration, 3),
             rollback_recommended=rollback_recommended,
+            checks_passed=tally.passed,
+            checks_failed=tally.failed,
         )
 
-        self.reports.append(report)
+        self.reports[report.report_id] = report
 
         self.complete_task(task_id, {
             "report_id": report.report_id,
@@ -235,35 +290,119 @@ class VerifierAgent(BaseAgent):
         self._log_action("verification_complete", {
             "report_id": report.report_id,
             "result": overall_result.value,
-            "checks_passed": len(checks) - len(failed_checks),
-            "checks_failed": len(failed_checks),
+            "checks_passed": tally.passed,
+            "checks_failed": tally.failed,
             "sla_failures": failed_slas,
+            "short_circuited": short_circuited,
             "rollback_recommended": rollback_recommended,
         })
 
         return report
 
+    def _compare_metrics(
+        self,
+        pre_metrics: dict[str, float],
+        post_metrics: dict[str, float],
+        tally: _CheckTally,
+        improvement: dict[str, float],
+    ) -> None:
+        """Tally one comparison check per common metric, computed column-wise."""
+        keys = [k for k in pre_metrics if k in post_metrics]
+        pre = list(map(pre_metrics.__getitem__, keys))
+        post = list(map(post_metrics.__getitem__, keys))
+        pct = list(map(_percent_change, pre, post))
+        improved = list(map(_improved, keys, pre, post))
+
+        improvement.update(zip(keys, pct, strict=True))
+        tally.checks.extend(
+            VerificationCheck(
+                check_id=self._next_id("CHK", self._check_seq),
+                check_type="metric_comparison",
+                result=VerificationResult.PASSED if ok else VerificationResult.FAILED,
+                details={
+                    "metric": metric_name,
+                    "pre_value": pre_val,
+                    "post_value": post_val,
+                    "percent_change": pct_change,
+                    "improved": ok,
+                },
+                description_format="{}: {:.2f} -> {:.2f} ({:+.1f}%)",
+                description_args=(metric_name, pre_val, post_val, pct_change),
+            )
+            for metric_name, pre_val, post_val, pct_change, ok
+            in zip(keys, pre, post, pct, improved, strict=True)
+            if tally.keep(ok)
+        )
+
+    def _check_slas(
+        self,
+        slas: list[SLATarget],
+        post_metrics: dict[str, float],
+        tally: _CheckTally,
+        sla_compliance: dict[str, bool],
+        settle_before: int | None = None,
+    ) -> bool:
+        """
+        Tally one check per SLA with a post value.
+
+        ``settle_before`` is the number of checks that would still run after
+        these. When given, checking stops as soon as the failures so far
+        mean FAILED even if every remaining check passed, and True is
+        returned; otherwise the result is False.
+        """
+        fail_counts = self.sla_fail_counts
+        present = [sla for sla in slas if sla.metric_name in post_metrics]
+        for i, sla in enumerate(present):
+            post_val = post_metrics[sla.metric_name]
+            compliant = sla.is_compliant(post_val)
+            sla_compliance[sla.metric_name] = compliant
+            if not compliant:
+                fail_counts[sla.metric_name] = fail_counts.get(sla.metric_name, 0) + 1
+
+            if tally.keep(compliant):
+                tally.checks.append(VerificationCheck(
+                    check_id=self._next_id("CHK", self._check_seq),
+                    check_type="sla_check",
+                    result=VerificationResult.PASSED if compliant else VerificationResult.FAILED,
+                    details={
+                        "sla_metric": sla.metric_name,
+                        "target": sla.target_value,
+                        "actual": post_val,
+                        "compliant": compliant,
+                    },
+                    description_format="SLA: {} — {}",
+                    description_args=(sla.description, "PASS" if compliant else "FAIL"),
+                ))
+            if settle_before is not None and not compliant:
+                # Best case for the rest: every unchecked SLA and later check passes
+                best_passed = tally.passed + len(present) - i - 1 + settle_before
+                if _overall_result(best_passed, tally.failed) is VerificationResult.FAILED:
+                    return True
+        return False
+
     def get_verification_summary(self, report_id: str) -> dict[str, Any]:
         """Get human-readable verification summary."""
-        for report in self.reports:
-            if report.report_id == report_id:
-                return {
-                    "report_id": report.report_id,
-                    "plan_id": report.plan_id,
-                    "overall_result": report.overall_result.value,
-                    "checks": [
-                        {
-                            "type": c.check_type,
-                            "description": c.description,
-                            "result": c.result.value,
-                        }
-                        for c in report.checks
-                    ],
-                    "improvement": report.improvement,
-                    "sla_compliance": report.sla_compliance,
-                    "rollback_recommended": report.rollback_recommended,
+        report = self.reports.get(report_id)
+        if report is None:
+            return {"error": f"Report {report_id} not found"}
+        return {
+            "report_id": report.report_id,
+            "plan_id": report.plan_id,
+            "overall_result": report.overall_result.value,
+            "checks_passed": report.checks_passed,
+            "checks_failed": report.checks_failed,
+            "checks": [
+                {
+                    "type": c.check_type,
+                    "description": c.description,
+                    "result": c.result.value,
                 }
-        return {"error": f"Report {report_id} not found"}
+                for c in report.checks
+            ],
+            "improvement": {m: round(v, 2) for m, v in report.improvement.items()},
+            "sla_compliance": report.sla_compliance,
+            "rollback_recommended": report.rollback_recommended,
+        }
 
     # Message handlers
     def _handle_verify(self, message: dict[str, Any]) -> dict[str, Any]:
@@ -0,0 +1,67 @@
+"""
+Response caching for read-only views over orchestrator state.
+
+Dashboards and pollers hit the status views every second or so, and each
+hit re-serializes the whole platform state even when nothing changed.
+``cached_view`` keeps the rendered body of a view and replays it while
+the orchestrator's ``state_version`` is unchanged and the entry is younger
+than its TTL. The TTL bounds staleness of values that move without a
+state change, such as agent uptime.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any, Callable
+
+from flask import current_app, make_response
+
+from agentops.orchestrator.engine import Orchestrator
+
+# Default lifetime of a cached response, in seconds
+DEFAULT_TTL_SECONDS = 1.0
+
+
+def cached_view(
+    get_orchestrator: Callable[[], Orchestrator],
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a view's response per orchestrator state version.
+
+    Only for views without arguments whose output depends solely on the
+    orchestrator. The entry is also keyed on the orchestrator object, so
+    a new app with a new orchestrator never sees another's responses.
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        # (orchestrator, state_version, expires_at, body, status, mimetype);
+        # replaced as a whole so concurrent requests never see a torn entry
+        entry: list[tuple[Any, ...] | None] = [None]
+
+        @functools.wraps(view)
+        def wrapper() -> Any:
+            orch = get_orchestrator()
+            now = time.monotonic()
+            cached = entry[0]
+            if (
+                cached is not None
+                and cached[0] is orch
+                and cached[1] == orch.state_version
+                and now < cached[2]
+            ):
+                return current_app.response_class(
+                    cached[3], status=cached[4], mimetype=cached[5]
+                )
+
+            version = orch.state_version  # read first: a change mid-render misses next time
+            response = make_response(view())
+            entry[0] = (
+                orch, version, now + ttl_seconds,
+                response.get_data(), response.status_code, response.mimetype,
+            )
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,59 @@
+"""
+Server-Sent Events stream of orchestrator status.
+
+Pollers re-request the status every second or so, paying a full
+serialization per client per poll. ``status_event_response`` instead
+keeps one response open per client that sleeps until the orchestrator's
+``state_version`` changes, and each change is encoded once no matter how
+many clients are listening. Under a threaded WSGI server each open stream
+holds one worker thread.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator
+
+from flask import Response, current_app
+
+from agentops.api.json_provider import encode_json
+from agentops.orchestrator.engine import Orchestrator
+
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_SECONDS = 15.0
+
+# Last status event encoded, shared by every stream:
+# (orchestrator, state_version, event bytes)
+_last_event: tuple[Orchestrator, int, bytes] | None = None
+
+
+def status_event_response(orch: Orchestrator) -> Response:
+    """Build a streamed ``text/event-stream`` response for ``orch``."""
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return current_app.response_class(
+        _status_events(orch, encode_json),
+        mimetype="text/event-stream",
+        headers=headers,
+    )
+
+
+def _status_events(orch: Orchestrator, encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+    sent = None
+    while True:
+        version = orch.state_version
+        if version != sent:
+            yield _status_event(orch, version, encode)
+            sent = version
+        else:
+            yield b": keepalive\n\n"
+        orch.wait_for_change(sent, KEEPALIVE_SECONDS)
+
+
+def _status_event(orch: Orchestrator, version: int, encode: Callable[[Any], bytes]) -> bytes:
+    """Encode a status event, reusing the last one if the version matches."""
+    global _last_event
+    cached = _last_event
+    if cached is not None and cached[0] is orch and cached[1] == version:
+        return cached[2]
+    event = b"id: %d\ndata: %b\n\n" % (version, encode(orch.get_status()))
+    _last_event = (orch, version, event)
+    return event
@@ -2,24 +2,75 @@
 REST API — submit incidents, query agent status, approve/reject changes, view audit log.
 
 Provides a Flask-based REST API for interacting with the AgentOps platform
-programmatically.
+programmatically. Responses are compact JSON with keys in insertion order
+(see FastJSONProvider).
 """
 
 from __future__ import annotations
 
-import json
 import time
-from typing import Any
+from itertools import islice
+from typing import Any, Callable, Iterator, TypeVar
 
-from flask import Blueprint, Flask, jsonify, request
+from flask import Blueprint, Flask, current_app, jsonify, request
+from pydantic import BaseModel, ValidationError
 
+from agentops.api.caching import cached_view
+from agentops.api.compression import enable_compression
+from agentops.api.events import status_event_response
+from agentops.api.json_provider import FastJSONProvider, encode_json
 from agentops.orchestrator.engine import Orchestrator
+from agentops.serialization import dumps
 
 api_bp = Blueprint("api", __name__, url_prefix="/api/v1")
 
 # Module-level orchestrator reference (set during app creation)
 _orchestrator: Orchestrator | None = None
 
+_Body = TypeVar("_Body", bound=BaseModel)
+
+# The API index never changes, so it is encoded once at import
+_INDEX_JSON = dumps({
+    "name": "AgentOps API",
+    "version": "0.1.0",
+    "endpoints": [
+        "/api/v1/health",
+        "/api/v1/status",
+        "/api/v1/events",
+        "/api/v1/incidents",
+        "/api/v1/agents",
+        "/api/v1/approvals",
+        "/api/v1/audit",
+    ],
+})
+
+# Entries encoded per chunk of a streamed response
+STREAM_CHUNK_SIZE = 64
+
+
+class IncidentRequest(BaseModel):
+    """Body of ``POST /incidents``; every field is optional."""
+    device_id: str = "unknown"
+    description: str = "Incident submitted via API"
+    scenario: str = "unknown"
+
+
+class ApprovalRequest(BaseModel):
+    """Body of ``POST /incidents/<id>/approve``."""
+    approved_by: str = "api-user"
+
+
+def _parse_body(model: type[_Body]) -> _Body:
+    """
+    Validate the JSON body; only an empty body means all defaults.
+
+    A body that isn't JSON is rejected by Flask with 400 (415 for a
+    non-JSON content type); JSON that doesn't fit the model gets 422.
+    """
+    if not request.get_data():
+        return model()
+    return model.model_validate(request.get_json())
+
 
 def set_orchestrator(orch: Orchestrator) -> None:
     """Set the orchestrator instance for the API."""
@@ -34,30 +85,44 @@ def get_orchestrator() -> Orchestrator:
     return _orchestrator
 
 
+@api_bp.errorhandler(ValidationError)
+def invalid_body(error: ValidationError) -> tuple[Any, int]:
+    """Reject a malformed request body with the offending fields."""
+    return jsonify({
+        "error": "Invalid request body",
+        "details": error.errors(include_url=False, include_context=False),
+    }), 422
+
+
 @api_bp.route("/health", methods=["GET"])
 def health_check() -> tuple[Any, int]:
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "timestamp": time.time()}), 200
+    # Only the timestamp varies; float repr is valid JSON
+    body = b'{"status":"healthy","timestamp":%b}' % repr(time.time()).encode()
+    return current_app.response_class(body, mimetype="application/json"), 200
 
 
 @api_bp.route("/status", methods=["GET"])
+@cached_view(get_orchestrator)
 def platform_status() -> tuple[Any, int]:
     """Get platform status including all agents."""
     orch = get_orchestrator()
     return jsonify(orch.get_status()), 200
 
 
+@api_bp.route("/events", methods=["GET"])
+def status_events() -> tuple[Any, int]:
+    """Stream platform status as Server-Sent Events, one per change."""
+    return status_event_response(get_orchestrator()), 200
+
+
 @api_bp.route("/incidents", methods=["POST"])
 def submit_incident() -> tuple[Any, int]:
     """Submit a new incident for automated resolution."""
-    data = request.get_json() or {}
+    body = _parse_body(IncidentRequest)
     orch = get_orchestrator()
 
-    device_id = data.get("device_id", "unknown")
-    description = data.get("description", "Incident submitted via API")
-    scenario = data.get("scenario", "unknown")
-
-    incident = orch.submit_incident(device_id, description, scenario)
+    incident = orch.submit_incident(body.device_id, body.description, body.scenario)
 
     return jsonify({
         "incident_id": incident.incident_id,
@@ -106,11 +171,10 @@ def process_incident(incident_id: str) -> tuple[Any, int]:
 @api_bp.route("/incidents/<incident_id>/approve", methods=["POST"])
 def approve_incident(incident_id: str) -> tuple[Any, int]:
     """Approve an incident's remediation plan."""
-    data = request.get_json() or {}
+    approved_by = _parse_body(ApprovalRequest).approved_by
     orch = get_orchestrator()
 
     try:
-        approved_by = data.get("approved_by", "api-user")
         incident = orch.approve_incident(incident_id, approved_by)
         return jsonify({
             "incident_id": incident.incident_id,
@@ -134,6 +198,7 @@ def get_timeline(incident_id: str) -> tuple[Any, int]:
 
 
 @api_bp.route("/agents", methods=["GET"])
+@cached_view(get_orchestrator)
 def list_agents() -> tuple[Any, int]:
     """List all registered agents and their status."""
     orch = get_orchestrator()
@@ -153,31 +218,43 @@ def list_agents() -> tuple[Any, int]:
 def list_pending_approvals() -> tuple[Any, int]:
     """List all pending approval requests."""
     orch = get_orchestrator()
-    pending = orch.remediator.get_pending_approvals()
-    return jsonify({
-        "pending": [
-            orch.remediator.get_plan_summary(p.plan_id)
-            for p in pending
-        ],
-    }), 200
+    pending = orch.pending_approvals()
+    return jsonify({"pending": orch.remediator.get_plan_summaries(pending)}), 200
 
 
 @api_bp.route("/audit", methods=["GET"])
 def audit_log() -> tuple[Any, int]:
-    """View the combined audit log from all agents."""
+    """View the most recent actions across all agents, newest first."""
     orch = get_orchestrator()
-    audit = []
-    for agent in orch._agents:
-        for entry in agent.get_action_log()[-50:]:  # Last 50 per agent
-            audit.append(entry)
-    audit.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
-    return jsonify({"audit_log": audit[:200]}), 200
+    body = _stream_json_array("audit_log", orch.iter_audit_log(), encode_json)
+    return current_app.response_class(body, mimetype="application/json"), 200
+
+
+def _stream_json_array(
+    key: str, items: Iterator[Any], encode: Callable[[Any], bytes],
+) -> Iterator[bytes]:
+    """
+    Encode ``{key: [items...]}`` incrementally, a chunk of items at a time.
+
+    Only one chunk is ever held encoded, and the client gets the first
+    bytes before the last item is encoded. Runs after the view returns,
+    outside the app context, so ``encode`` is passed in.
+    """
+    yield b'{"' + key.encode() + b'":['
+    separator = b""
+    while chunk := list(islice(items, STREAM_CHUNK_SIZE)):
+        yield separator + b",".join(map(encode, chunk))
+        separator = b","
+    yield b"]}"
 
 
 def create_api_app(auto_approve: bool = False) -> Flask:
     """Create and configure the Flask API application."""
     app = Flask(__name__)
-    app.config["JSON_SORT_KEYS"] = False
+    # Flask >= 2.3 ignores JSON_SORT_KEYS / JSONIFY_PRETTYPRINT_REGULAR;
+    # ordering and compactness are set on the provider instead
+    app.json = FastJSONProvider(app)
+    enable_compression(app)
 
     orch = Orchestrator(auto_approve=auto_approve)
     set_orchestrator(orch)
@@ -186,17 +263,6 @@ def create_api_app(auto_approve: bool = False) -> Flask:
 
     @app.route("/")
     def index() -> tuple[Any, int]:
-        return jsonify({
-            "name": "AgentOps API",
-            "version": "0.1.0",
-            "endpoints": [
-                "/api/v1/health",
-                "/api/v1/status",
-                "/api/v1/incidents",
-                "/api/v1/agents",
-                "/api/v1/approvals",
-                "/api/v1/audit",
-            ],
-        }), 200
+        return current_app.response_class(_INDEX_JSON, mimetype="application/json"), 200
 
     return app
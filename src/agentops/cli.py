@@ -12,8 +12,10 @@ Commands:
 
 from __future__ import annotations
 
-import json
+import functools
+import sys
 import time
+from typing import Any
 
 import click
 from rich.console import Console
@@ -21,9 +23,84 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
+from agentops.agents.base import format_details
 from agentops.orchestrator.engine import Orchestrator, IncidentStatus
+from agentops.serialization import dumps
 
-console = Console()
+
+def _make_console() -> Console:
+    """
+    Console for the current stdout.
+
+    When output is piped or captured, syntax highlighting (a regex pass
+    over every printed string), color and emoji are switched off. Markup
+    stays on so tags are stripped rather than printed literally.
+    """
+    if sys.stdout.isatty():
+        return Console()
+    return Console(highlight=False, no_color=True, emoji=False)
+
+
+console = _make_console()
+
+
+# Worker threads for the API and dashboard servers. Each open
+# /events stream holds one thread for as long as the client listens.
+DEFAULT_SERVER_THREADS = 16
+
+
+def _serve(app: Any, host: str, port: int, threads: int) -> None:
+    """
+    Serve a Flask app with waitress when installed, else Flask's server.
+
+    Always one process: the orchestrator lives in process memory, so
+    multiple worker processes would each hold their own incidents and
+    approvals. Concurrency comes from threads instead.
+    """
+    try:
+        from waitress import serve
+    except ImportError:
+        console.print(
+            "[yellow]waitress not installed (pip install agentops[serve]); "
+            "using Flask's development server[/yellow]"
+        )
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+    serve(app, host=host, port=port, threads=threads)
+
+
+@functools.lru_cache(maxsize=1)
+def _api_client() -> Any:
+    """
+    HTTP client shared by every CLI call to a running API server.
+
+    Keeps connections alive in a pool, so a command that makes several
+    requests (approve --all) pays the TCP/TLS handshake once.
+    """
+    import httpx
+
+    return httpx.Client(
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
+def _api_request(api_url: str, method: str, path: str, **kwargs: Any) -> Any:
+    """Call the API at ``api_url`` and return the decoded JSON body."""
+    import httpx
+
+    try:
+        url = api_url.rstrip("/") + "/api/v1" + path
+        response = _api_client().request(method, url, **kwargs)
+        return response.raise_for_status().json()
+    except httpx.HTTPError as e:
+        raise click.ClickException(f"API request to {api_url} failed: {e}") from e
+
+
+@functools.lru_cache(maxsize=2)
+def _get_orchestrator(auto_approve: bool = False) -> Orchestrator:
+    """Shared orchestrator per approval mode, built on first use."""
+    return Orchestrator(auto_approve=auto_approve)
 
 
 @click.group()
@@ -42,7 +119,8 @@ def cli() -> None:
 @click.option("--host", default="0.0.0.0", help="API server host")
 @click.option("--port", default=8080, help="API server port")
 @click.option("--auto-approve", is_flag=True, help="Auto-approve all remediation plans")
-def start(host: str, port: int, auto_approve: bool) -> None:
+@click.option("--threads", default=DEFAULT_SERVER_THREADS, help="Server worker threads")
+def start(host: str, port: int, auto_approve: bool, threads: int) -> None:
     """Start the AgentOps API server."""
     from agentops.api.routes import create_api_app
 
@@ -56,7 +134,7 @@ def start(host: str, port: int, auto_approve: bool) -> None:
     ))
 
     app = create_api_app(auto_approve=auto_approve)
-    app.run(host=host, port=port, debug=False)
+    _serve(app, host, port, threads)
 
 
 @cli.command("simulate-incident")
@@ -90,7 +168,7 @@ def simulate_incident(device: str, scenario: str, auto_approve: bool) -> None:
         border_style="red",
     ))
 
-    orch = Orchestrator(auto_approve=auto_approve)
+    orch = _get_orchestrator(auto_approve)
 
     # Submit
     console.print("\n[bold]Stage 1: Incident Detection[/bold]")
@@ -109,24 +187,31 @@ def simulate_incident(device: str, scenario: str, auto_approve: bool) -> None:
     # Display timeline
     console.print(f"\n[bold]Pipeline Result: [{_status_color(incident.status)}]{incident.status.value}[/{_status_color(incident.status)}][/bold]")
 
-    console.print("\n[bold]Incident Timeline:[/bold]")
+    # One print per block rather than per line amortizes Rich's render setup
+    lines = ["\n[bold]Incident Timeline:[/bold]"]
     for event in incident.timeline:
-        color = "green" if "complete" in event["event"] or "resolved" in event["event"] else "cyan"
-        details = event.get("details", {})
+        color = "green" if "complete" in event.event or "resolved" in event.event else "cyan"
         detail_str = ""
-        if details:
-            detail_str = " — " + ", ".join(f"{k}={v}" for k, v in list(details.items())[:3])
-        console.print(f"  [{color}]●[/{color}] {event['event']}{detail_str}")
+        if event.details:
+            detail_str = " — " + format_details(event.details)
+        lines.append(f"  [{color}]●[/{color}] {event.event}{detail_str}")
+    console.print("\n".join(lines))
 
     # Display remediation plan if generated
     if incident.remediation_plan:
         plan = incident.remediation_plan
-        console.print(f"\n[bold]Remediation Plan: {plan.plan_id}[/bold]")
-        console.print(f"  Risk Level: [{_risk_color(plan.risk_level.value)}]{plan.risk_level.value}[/{_risk_color(plan.risk_level.value)}]")
-        console.print(f"  Status: {plan.status.value}")
+        risk = plan.risk_level.value
+        risk_color = _risk_color(risk)
+        lines = [
+            f"\n[bold]Remediation Plan: {plan.plan_id}[/bold]",
+            f"  Risk Level: [{risk_color}]{risk}[/{risk_color}]",
+            f"  Status: {plan.status.value}",
+        ]
         for step in plan.steps:
             mark = "[green]✓[/green]" if step.executed else "○"
-            console.print(f"  {mark} Step {step.order}: {step.action} ({step.params.get('description', '')})")
+            description = step.params.get("description", "")
+            lines.append(f"  {mark} Step {step.order}: {step.action} ({description})")
+        console.print("\n".join(lines))
 
     # Verification result
     if incident.verification_report:
@@ -148,42 +233,101 @@ def simulate_incident(device: str, scenario: str, auto_approve: bool) -> None:
 @cli.command()
 @click.argument("plan_id", required=False)
 @click.option("--all", "approve_all", is_flag=True, help="Approve all pending plans")
-def approve(plan_id: str | None, approve_all: bool) -> None:
+@click.option(
+    "--api-url", default=None,
+    help="API server to approve on, e.g. http://127.0.0.1:8080",
+)
+def approve(plan_id: str | None, approve_all: bool, api_url: str | None) -> None:
     """Approve a pending remediation plan."""
-    console.print("[yellow]Approval requires a running API server. Use the API endpoint:[/yellow]")
-    console.print("  POST /api/v1/incidents/<incident_id>/approve")
-    console.print("\nOr use --auto-approve with simulate-incident for demo purposes.")
+    if not api_url:
+        console.print(
+            "[yellow]Approval requires a running API server. "
+            "Pass --api-url or use the endpoint:[/yellow]"
+        )
+        console.print("  POST /api/v1/incidents/<incident_id>/approve")
+        console.print("\nOr use --auto-approve with simulate-incident for demo purposes.")
+        return
+    if not plan_id and not approve_all:
+        raise click.UsageError("Give a PLAN_ID or --all")
+
+    pending = _api_request(api_url, "GET", "/approvals")["pending"]
+    if not approve_all:
+        pending = [p for p in pending if p["plan_id"] == plan_id]
+        if not pending:
+            raise click.ClickException(f"No pending plan {plan_id}")
+
+    for plan in pending:
+        result = _api_request(
+            api_url, "POST", f"/incidents/{plan['incident_id']}/approve",
+            json={"approved_by": "cli-user"},
+        )
+        console.print(
+            f"  Approved {plan['plan_id']}: incident {result['incident_id']} is {result['status']}"
+        )
 
 
 @cli.command()
-def status() -> None:
+@click.option(
+    "--api-url", default=None,
+    help="Read status from a running API server, e.g. http://127.0.0.1:8080",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+def status(api_url: str | None, as_json: bool) -> None:
     """Show platform and agent status."""
-    orch = Orchestrator()
+    if api_url:
+        agents, platform = _fetch_api_status(api_url)
+    else:
+        orch = _get_orchestrator()
+        agents = [
+            _agent_row(a.name, a.state.value, a.card.capabilities) for a in orch._agents
+        ]
+        platform = orch.get_status()
+
+    if as_json:
+        # Encoded bytes straight to stdout; no Rich markup or highlighting pass
+        click.echo(dumps({"agents": agents, "status": platform}))
+        return
 
     table = Table(title="Agent Status", border_style="cyan")
     table.add_column("Agent", style="bold")
     table.add_column("State")
     table.add_column("Capabilities")
 
-    for agent in orch._agents:
-        state = agent.state.value
+    for agent in agents:
+        state = agent["state"]
         color = "green" if state == "active" else "yellow"
         table.add_row(
-            agent.name,
+            agent["name"],
             f"[{color}]{state}[/{color}]",
-            ", ".join(agent.card.capabilities[:2]),
+            ", ".join(agent["capabilities"][:2]),
         )
 
     console.print(table)
 
-    console.print(f"\n  Protocol stats: {orch.protocol.get_stats()}")
-    console.print(f"  Incidents: {len(orch.incidents)}")
+    console.print(f"\n  Protocol stats: {platform['protocol']}")
+    console.print(f"  Incidents: {platform['incidents']['total']}")
+
+
+def _agent_row(name: str, state: str, capabilities: list[str]) -> dict[str, Any]:
+    """One agent in ``status`` output; the same shape for local and API sources."""
+    return {"name": name, "state": state, "capabilities": capabilities}
+
+
+def _fetch_api_status(api_url: str) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Read agents and platform status from a running API server."""
+    agents = [
+        _agent_row(a["name"], a["state"], a["capabilities"])
+        for a in _api_request(api_url, "GET", "/agents")["agents"]
+    ]
+    platform = _api_request(api_url, "GET", "/status")
+    return agents, platform
 
 
 @cli.command()
 @click.option("--host", default="0.0.0.0", help="Dashboard host")
 @click.option("--port", default=8888, help="Dashboard port")
-def dashboard(host: str, port: int) -> None:
+@click.option("--threads", default=DEFAULT_SERVER_THREADS, help="Server worker threads")
+def dashboard(host: str, port: int, threads: int) -> None:
     """Start the web dashboard."""
     from agentops.dashboard.app import create_dashboard_app
 
@@ -196,7 +340,7 @@ def dashboard(host: str, port: int) -> None:
     ))
 
     app = create_dashboard_app()
-    app.run(host=host, port=port, debug=False)
+    _serve(app, host, port, threads)
 
 
 @cli.command()
@@ -231,32 +375,37 @@ def demo(scenario: str) -> None:
         border_style="cyan",
     ))
 
-    orch = Orchestrator(auto_approve=True)
+    orch = _get_orchestrator(True)
 
     results = []
     for name, (device, scen, desc) in run_scenarios:
-        console.print(f"\n{'='*60}")
-        console.print(f"[bold yellow]Scenario: {name}[/bold yellow]")
-        console.print(f"Device: {device} | Description: {desc}")
-        console.print(f"{'='*60}")
+        console.print(
+            f"\n{'='*60}\n"
+            f"[bold yellow]Scenario: {name}[/bold yellow]\n"
+            f"Device: {device} | Description: {desc}\n"
+            f"{'='*60}"
+        )
 
         incident = orch.submit_incident(device, desc, scen)
         incident = orch.process_incident(incident.incident_id)
 
         status_color = _status_color(incident.status)
-        console.print(f"\n  Result: [{status_color}]{incident.status.value.upper()}[/{status_color}]")
+        lines = [f"\n  Result: [{status_color}]{incident.status.value.upper()}[/{status_color}]"]
 
-        if incident.diagnosis_report and incident.diagnosis_report.primary_hypothesis:
-            console.print(f"  Root Cause: {incident.diagnosis_report.primary_hypothesis.description}")
-            console.print(f"  Confidence: {incident.diagnosis_report.confidence_level}")
+        report = incident.diagnosis_report
+        if report and report.primary_hypothesis:
+            lines.append(f"  Root Cause: {report.primary_hypothesis.description}")
+            lines.append(f"  Confidence: {report.confidence_level}")
 
-        if incident.remediation_plan:
-            console.print(f"  Plan: {incident.remediation_plan.plan_id} ({incident.remediation_plan.risk_level.value} risk)")
+        plan = incident.remediation_plan
+        if plan:
+            lines.append(f"  Plan: {plan.plan_id} ({plan.risk_level.value} risk)")
 
         if incident.verification_report:
-            console.print(f"  Verification: {incident.verification_report.overall_result.value}")
+            lines.append(f"  Verification: {incident.verification_report.overall_result.value}")
 
-        console.print(f"  Timeline events: {len(incident.timeline)}")
+        lines.append(f"  Timeline events: {len(incident.timeline)}")
+        console.print("\n".join(lines))
 
         results.append({
             "scenario": name,
@@ -282,21 +431,25 @@ def demo(scenario: str) -> None:
     console.print()
 
 
+# Rich colors per incident status and risk level
+_STATUS_COLORS: dict[IncidentStatus, str] = {
+    IncidentStatus.RESOLVED: "green",
+    IncidentStatus.ROLLED_BACK: "red",
+    IncidentStatus.AWAITING_APPROVAL: "yellow",
+    IncidentStatus.FAILED: "red",
+    IncidentStatus.ESCALATED: "magenta",
+}
+_RISK_COLORS = {"low": "green", "medium": "yellow", "high": "red", "critical": "bold red"}
+
+
 def _status_color(status: IncidentStatus) -> str:
     """Get Rich color for an incident status."""
-    colors = {
-        IncidentStatus.RESOLVED: "green",
-        IncidentStatus.ROLLED_BACK: "red",
-        IncidentStatus.AWAITING_APPROVAL: "yellow",
-        IncidentStatus.FAILED: "red",
-        IncidentStatus.ESCALATED: "magenta",
-    }
-    return colors.get(status, "cyan")
+    return _STATUS_COLORS.get(status, "cyan")
 
 
 def _risk_color(risk: str) -> str:
     """Get Rich color for a risk level."""
-    return {"low": "green", "medium": "yellow", "high": "red", "critical": "bold red"}.get(risk, "white")
+    return _RISK_COLORS.get(risk, "white")
 
 
 if __name__ == "__main__":
@@ -14,12 +14,27 @@ from __future__ import annotations
 import time
 from typing import Any
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, jsonify, request
 
+from agentops.agents.base import format_details
+from agentops.api.caching import cached_view
+from agentops.api.compression import enable_compression
+from agentops.api.events import status_event_response
+from agentops.api.json_provider import FastJSONProvider
 from agentops.orchestrator.engine import Orchestrator, IncidentStatus
 
-# Dashboard HTML template (embedded for single-file deployment)
-DASHBOARD_HTML = """
+# Incidents listed on the dashboard, most recent last
+RECENT_INCIDENTS = 10
+
+# CSS class per incident status; anything else renders as "detecting"
+_STATUS_CLASS: dict[IncidentStatus, str] = {
+    IncidentStatus.RESOLVED: "resolved",
+    IncidentStatus.AWAITING_APPROVAL: "awaiting",
+}
+
+# Dashboard page (embedded for single-file deployment). Only the body is a
+# template; the stylesheet head and the script tail are sent verbatim.
+_DASHBOARD_HEAD = b"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -64,6 +79,9 @@ DASHBOARD_HTML = """
     </style>
 </head>
 <body>
+"""
+
+DASHBOARD_BODY_HTML = """
     <div class="header">
         <h1>AgentOps</h1>
         <div>
@@ -148,8 +166,22 @@ DASHBOARD_HTML = """
             </table>
         </div>
 
-        <p class="refresh-note">Refresh page to update. AgentOps v0.1.0 | Safety-First Multi-Agent Infrastructure Remediation</p>
+        <p class="refresh-note">
+            Updates live. AgentOps v0.1.0 | Safety-First Multi-Agent Infrastructure Remediation
+        </p>
     </div>
+"""
+
+_DASHBOARD_TAIL = b"""
+    <script>
+        // Reload when the platform state changes instead of polling
+        const events = new EventSource("/api/events");
+        let seen = null;
+        events.onmessage = (e) => {
+            if (seen !== null && e.lastEventId !== seen) location.reload();
+            seen = e.lastEventId;
+        };
+    </script>
 </body>
 </html>
 """
@@ -163,9 +195,15 @@ def create_dashboard_app(auto_approve: bool = False) -> Flask:
     global _dashboard_orchestrator
 
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    enable_compression(app)
     _dashboard_orchestrator = Orchestrator(auto_approve=auto_approve)
+    # Compiled once; render_template_string re-parses the source per request.
+    # The template uses only the variables passed below, no request context.
+    dashboard_template = app.jinja_env.from_string(DASHBOARD_BODY_HTML)
 
     @app.route("/")
+    @cached_view(lambda: _dashboard_orchestrator)
     def index():
         orch = _dashboard_orchestrator
 
@@ -175,25 +213,20 @@ def create_dashboard_app(auto_approve: bool = False) -> Flask:
         ]
 
         incidents = []
-        for inc in list(orch.incidents.values())[-10:]:
-            status_class = "detecting"
-            if inc.status == IncidentStatus.RESOLVED:
-                status_class = "resolved"
-            elif inc.status == IncidentStatus.AWAITING_APPROVAL:
-                status_class = "awaiting"
+        for inc in orch.recent_incidents(RECENT_INCIDENTS):
             incidents.append({
                 "incident_id": inc.incident_id,
                 "device_id": inc.device_id,
                 "description": inc.description,
                 "status": inc.status.value,
-                "status_class": status_class,
+                "status_class": _STATUS_CLASS.get(inc.status, "detecting"),
             })
 
         audit_log = []
         for agent in orch._agents:
-            for entry in agent.get_action_log()[-10:]:
+            for entry in agent.get_action_log(limit=10):
                 details = entry.get("details", {})
-                details_str = ", ".join(f"{k}={v}" for k, v in list(details.items())[:3])
+                details_str = format_details(details)
                 audit_log.append({
                     "agent_name": entry.get("agent_name", ""),
                     "action": entry.get("action", ""),
@@ -203,8 +236,7 @@ def create_dashboard_app(auto_approve: bool = False) -> Flask:
 
         status_counts = orch._count_by_status()
 
-        return render_template_string(
-            DASHBOARD_HTML,
+        body = dashboard_template.render(
             agent_count=len(agents),
             total_incidents=len(orch.incidents),
             resolved_count=status_counts.get("resolved", 0),
@@ -214,11 +246,18 @@ def create_dashboard_app(auto_approve: bool = False) -> Flask:
             incidents=incidents,
             audit_log=audit_log,
         )
+        return app.response_class(
+            _DASHBOARD_HEAD + body.encode() + _DASHBOARD_TAIL, mimetype="text/html"
+        )
 
     @app.route("/api/status")
     def api_status():
         return jsonify(_dashboard_orchestrator.get_status())
 
+    @app.route("/api/events")
+    def api_events():
+        return status_event_response(_dashboard_orchestrator)
+
     return app
 
 
@@ -0,0 +1,73 @@
+"""
+Identifier generation — batched random IDs for agents, tasks, and reports.
+
+``uuid.uuid4()`` reads 16 bytes from ``os.urandom`` on every call. Agents
+mint many short-lived IDs per incident (one per evidence item, hypothesis,
+task, ...), so IDPool reads random bytes in batches and slices them.
+A forked child discards the buffer it inherited, so parent and child
+never hand out the same IDs.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+import weakref
+
+# Every live pool, so a forked child can reset them all
+_pools: weakref.WeakSet[IDPool] = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in _pools:
+        pool._reset()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+class IDPool:
+    """Hands out random bytes from a batched ``os.urandom`` buffer."""
+
+    def __init__(self, batch_size: int = 64) -> None:
+        self._batch_bytes = batch_size * 16
+        self._reset()
+        _pools.add(self)
+
+    def _reset(self) -> None:
+        # A fresh lock too: another thread may have held it at fork time
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def _take(self, n: int) -> bytes:
+        with self._lock:
+            if self._pos + n > len(self._buf):
+                self._buf = os.urandom(max(self._batch_bytes, n))
+                self._pos = 0
+            chunk = self._buf[self._pos:self._pos + n]
+            self._pos += n
+        return chunk
+
+    def short_hex(self, length: int) -> str:
+        """Return ``length`` random hex characters, e.g. for ``EV-1a2b3c``."""
+        return self._take((length + 1) // 2).hex()[:length]
+
+    def uuid4(self) -> str:
+        """Return a random RFC 4122 version-4 UUID string."""
+        return str(uuid.UUID(bytes=self._take(16), version=4))
+
+
+_pool = IDPool()
+
+
+def short_hex(length: int) -> str:
+    """Return ``length`` random hex characters from the shared pool."""
+    return _pool.short_hex(length)
+
+
+def new_uuid() -> str:
+    """Return a random version-4 UUID string from the shared pool."""
+    return _pool.uuid4()
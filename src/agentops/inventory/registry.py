@@ -9,6 +9,8 @@ infrastructure and how it's connected.
 from __future__ import annotations
 
 import time
+from bisect import bisect_right, insort
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -35,7 +37,7 @@ class DeviceStatus(str, Enum):
     DECOMMISSIONED = "decommissioned"
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """An infrastructure device."""
     device_id: str
@@ -51,7 +53,7 @@ class Device:
     registered_at: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceDependency:
     """A dependency between two services."""
     source_service: str
@@ -60,7 +62,7 @@ class ServiceDependency:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceWindow:
     """A scheduled maintenance window."""
     window_id: str
@@ -71,6 +73,10 @@ class MaintenanceWindow:
     approved_by: str = ""
 
 
+def _window_start(window: MaintenanceWindow) -> float:
+    return window.start_time
+
+
 class DeviceRegistry:
     """
     Infrastructure device registry with topology and dependency tracking.
@@ -78,65 +84,130 @@ class DeviceRegistry:
 
     def __init__(self) -> None:
         self.devices: dict[str, Device] = {}
-        self.topology: dict[str, list[str]] = {}  # device_id -> [connected_device_ids]
+        # Devices per type / status value, kept in step with ``devices`` by
+        # register_device, remove_device and set_device_status
+        self._type_counts: dict[str, int] = {}
+        self._status_counts: dict[str, int] = {}
+        # device_id -> connected device_ids, in connection order
+        # (dicts used as ordered sets: O(1) membership and removal)
+        self.topology: dict[str, dict[str, None]] = {}
         self.service_deps: list[ServiceDependency] = []
+        # Service name -> services it depends on / services depending on it
+        self._deps_by_source: dict[str, list[str]] = {}
+        self._deps_by_target: dict[str, list[str]] = {}
         self.maintenance_windows: list[MaintenanceWindow] = []
+        # device_id -> its windows sorted by start_time; see add_maintenance_window.
+        # Rebuilt if maintenance_windows was changed directly (length mismatch)
+        self._device_windows: dict[str, list[MaintenanceWindow]] = {}
+        self._indexed_windows = 0
 
     def register_device(self, device: Device) -> None:
-        """Register a new device."""
+        """Register a new device, replacing any with the same ID."""
+        previous = self.devices.get(device.device_id)
+        if previous is not None:
+            self._count(previous, -1)
         self.devices[device.device_id] = device
-        if device.device_id not in self.topology:
-            self.topology[device.device_id] = []
+        self._count(device, 1)
+        self.topology.setdefault(device.device_id, {})
+
+    def set_device_status(self, device_id: str, status: DeviceStatus) -> None:
+        """Change a device's status; use this rather than assigning to it."""
+        device = self.devices[device_id]
+        self._count(device, -1)
+        device.status = status
+        self._count(device, 1)
+
+    def _count(self, device: Device, delta: int) -> None:
+        """Add ``delta`` to the device's type and status counts."""
+        for counts, key in (
+            (self._type_counts, device.device_type.value),
+            (self._status_counts, device.status.value),
+        ):
+            n = counts.get(key, 0) + delta
+            if n:
+                counts[key] = n
+            else:
+                del counts[key]
 
     def remove_device(self, device_id: str) -> None:
         """Remove a device from the registry."""
-        self.devices.pop(device_id, None)
-        self.topology.pop(device_id, None)
-        for neighbors in self.topology.values():
-            if device_id in neighbors:
-                neighbors.remove(device_id)
+        device = self.devices.pop(device_id, None)
+        if device is not None:
+            self._count(device, -1)
+        # Connections are symmetric, so only the device's own neighbors
+        # can refer back to it (including itself, for a self-loop)
+        for neighbor in self.topology.pop(device_id, ()):
+            self.topology.get(neighbor, {}).pop(device_id, None)
 
     def add_connection(self, device_a: str, device_b: str) -> None:
         """Add a bidirectional connection between two devices."""
-        if device_a not in self.topology:
-            self.topology[device_a] = []
-        if device_b not in self.topology:
-            self.topology[device_b] = []
-        if device_b not in self.topology[device_a]:
-            self.topology[device_a].append(device_b)
-        if device_a not in self.topology[device_b]:
-            self.topology[device_b].append(device_a)
+        self.topology.setdefault(device_a, {})[device_b] = None
+        self.topology.setdefault(device_b, {})[device_a] = None
 
     def get_neighbors(self, device_id: str) -> list[Device]:
         """Get all directly connected devices."""
-        neighbor_ids = self.topology.get(device_id, [])
+        neighbor_ids = self.topology.get(device_id, ())
         return [self.devices[nid] for nid in neighbor_ids if nid in self.devices]
 
     def get_blast_radius(self, device_id: str, depth: int = 2) -> list[str]:
-        """Calculate blast radius — devices affected if this one fails."""
-        visited = set()
-        queue = [(device_id, 0)]
+        """
+        Calculate blast radius — devices affected if this one fails.
+
+        Returns every device within ``depth`` hops, nearest first. Devices
+        are marked when enqueued, so each is queued at most once, and
+        nothing past the depth horizon is ever queued.
+        """
+        seen = {device_id}
+        affected: list[str] = []
+        queue = deque([(device_id, 0)])
 
         while queue:
-            current, current_depth = queue.pop(0)
-            if current in visited or current_depth > depth:
+            current, current_depth = queue.popleft()
+            if current_depth == depth:
                 continue
-            visited.add(current)
-            for neighbor in self.topology.get(current, []):
-                if neighbor not in visited:
+            for neighbor in self.topology.get(current, ()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    affected.append(neighbor)
                     queue.append((neighbor, current_depth + 1))
 
-        visited.discard(device_id)
-        return list(visited)
+        return affected
 
-    def is_in_maintenance(self, device_id: str) -> bool:
-        """Check if a device is currently in a maintenance window."""
-        now = time.time()
+    def add_maintenance_window(self, window: MaintenanceWindow) -> None:
+        """Schedule a maintenance window and index it under each of its devices."""
+        self._sync_window_index()
+        self.maintenance_windows.append(window)
+        self._index_window(window)
+        self._indexed_windows += 1
+
+    def _index_window(self, window: MaintenanceWindow) -> None:
+        for device_id in window.device_ids:
+            insort(self._device_windows.setdefault(device_id, []), window, key=_window_start)
+
+    def _sync_window_index(self) -> None:
+        """Rebuild the per-device index if windows were added or removed directly."""
+        if len(self.maintenance_windows) == self._indexed_windows:
+            return
+        self._device_windows = {}
         for window in self.maintenance_windows:
-            if device_id in window.device_ids:
-                if window.start_time <= now <= window.end_time:
-                    return True
-        return False
+            self._index_window(window)
+        self._indexed_windows = len(self.maintenance_windows)
+
+    def is_in_maintenance(self, device_id: str, now: float | None = None) -> bool:
+        """
+        Check if a device is in a maintenance window at ``now`` (default: now).
+
+        Only the device's own windows are looked at, and of those only the
+        ones that have already started, latest start first.
+        """
+        self._sync_window_index()
+        windows = self._device_windows.get(device_id)
+        if not windows:
+            return False
+        if now is None:
+            now = time.time()
+        started = bisect_right(windows, now, key=_window_start)
+        return any(windows[i].end_time >= now for i in range(started - 1, -1, -1))
 
     def add_service_dependency(self, source: str, target: str, dep_type: str = "hard") -> None:
         """Add a service dependency."""
@@ -145,27 +216,23 @@ class DeviceRegistry:
             target_service=target,
             dependency_type=dep_type,
         ))
+        self._deps_by_source.setdefault(source, []).append(target)
+        self._deps_by_target.setdefault(target, []).append(source)
 
     def get_service_dependencies(self, service_name: str) -> list[str]:
         """Get all services that a given service depends on."""
-        return [d.target_service for d in self.service_deps if d.source_service == service_name]
+        return list(self._deps_by_source.get(service_name, ()))
 
     def get_dependent_services(self, service_name: str) -> list[str]:
         """Get all services that depend on a given service."""
-        return [d.source_service for d in self.service_deps if d.target_service == service_name]
+        return list(self._deps_by_target.get(service_name, ()))
 
     def get_inventory_summary(self) -> dict[str, Any]:
         """Get a summary of the full inventory."""
-        type_counts: dict[str, int] = {}
-        status_counts: dict[str, int] = {}
-        for device in self.devices.values():
-            type_counts[device.device_type.value] = type_counts.get(device.device_type.value, 0) + 1
-            status_counts[device.status.value] = status_counts.get(device.status.value, 0) + 1
-
         return {
             "total_devices": len(self.devices),
-            "by_type": type_counts,
-            "by_status": status_counts,
+            "by_type": dict(self._type_counts),
+            "by_status": dict(self._status_counts),
             "total_connections": sum(len(v) for v in self.topology.values()) // 2,
             "service_dependencies": len(self.service_deps),
             "maintenance_windows": len(self.maintenance_windows),
@@ -10,13 +10,22 @@ Provides comprehensive observability for all agent actions:
 
 from __future__ import annotations
 
+import threading
 import time
-import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, Iterable
 
+from agentops.ids import short_hex
 
-@dataclass
+# Scalar span fields exported by Tracer.export_columns by default
+SPAN_COLUMNS = (
+    "trace_id", "span_id", "parent_span_id", "operation_name",
+    "start_time", "end_time", "status",
+)
+
+
+@dataclass(slots=True)
 class Span:
     """An OTel-compatible trace span."""
     trace_id: str
@@ -29,6 +38,8 @@ class Span:
     status: str = "ok"  # ok, error
     attributes: dict[str, Any] = field(default_factory=dict)
     events: list[dict[str, Any]] = field(default_factory=list)
+    # Set by the Tracer that recorded the span, so finish() updates its totals
+    _on_finish: Callable[[Span], None] | None = field(default=None, repr=False, compare=False)
 
     @property
     def duration_ms(self) -> float | None:
@@ -46,6 +57,8 @@ class Span:
     def finish(self, status: str = "ok") -> None:
         self.end_time = time.time()
         self.status = status
+        if self._on_finish is not None:
+            self._on_finish(self)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -63,7 +76,7 @@ class Span:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionRecord:
     """An auditable record of a decision made by an agent."""
     decision_id: str
@@ -78,7 +91,7 @@ class DecisionRecord:
     trace_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """A performance metric observation."""
     metric_name: str
@@ -102,11 +115,21 @@ class Tracer:
         self.decisions: list[DecisionRecord] = []
         self.metrics: list[PerformanceMetric] = []
         self._active_spans: dict[str, Span] = {}
+        # Per-trace and per-agent views of spans / decisions, in record order
+        self._spans_by_trace: dict[str, list[Span]] = {}
+        self._decisions_by_agent: dict[str, list[DecisionRecord]] = {}
+        # Keeps each record and its index entry in step across threads;
+        # held only for the appends, never while building dicts for export
+        self._lock = threading.Lock()
+        # Running totals over finished spans, for get_performance_summary
+        self._completed_spans = 0
+        self._duration_sum_ms = 0.0
+        self._duration_max_ms = 0.0
 
     def start_trace(self, operation_name: str, attributes: dict[str, Any] | None = None) -> Span:
         """Start a new trace (root span)."""
-        trace_id = uuid.uuid4().hex[:32]
-        span_id = uuid.uuid4().hex[:16]
+        trace_id = short_hex(32)
+        span_id = short_hex(16)
 
         span = Span(
             trace_id=trace_id,
@@ -118,8 +141,7 @@ class Tracer:
             attributes=attributes or {},
         )
 
-        self._active_spans[span_id] = span
-        self.spans.append(span)
+        self._record_span(span)
         return span
 
     def start_span(
@@ -129,7 +151,7 @@ class Tracer:
         attributes: dict[str, Any] | None = None,
     ) -> Span:
         """Start a child span within an existing trace."""
-        span_id = uuid.uuid4().hex[:16]
+        span_id = short_hex(16)
 
         span = Span(
             trace_id=parent.trace_id,
@@ -141,14 +163,30 @@ class Tracer:
             attributes=attributes or {},
         )
 
-        self._active_spans[span_id] = span
-        self.spans.append(span)
+        self._record_span(span)
         return span
 
+    def _record_span(self, span: Span) -> None:
+        span._on_finish = self._span_finished
+        with self._lock:
+            self._active_spans[span.span_id] = span
+            self.spans.append(span)
+            self._spans_by_trace.setdefault(span.trace_id, []).append(span)
+
     def finish_span(self, span: Span, status: str = "ok") -> None:
-        """Finish a span."""
+        """Finish a span; the same as calling ``span.finish(status)``."""
         span.finish(status)
-        self._active_spans.pop(span.span_id, None)
+
+    def _span_finished(self, span: Span) -> None:
+        """Count a recorded span in the running totals when it first finishes."""
+        duration = span.duration_ms or 0.0
+        with self._lock:
+            if self._active_spans.pop(span.span_id, None) is None:
+                return  # already finished; don't count it twice
+            self._completed_spans += 1
+            self._duration_sum_ms += duration
+            if duration > self._duration_max_ms:
+                self._duration_max_ms = duration
 
     def record_decision(
         self,
@@ -163,7 +201,7 @@ class Tracer:
     ) -> DecisionRecord:
         """Record an auditable decision."""
         record = DecisionRecord(
-            decision_id=f"DEC-{uuid.uuid4().hex[:8]}",
+            decision_id=f"DEC-{short_hex(8)}",
             agent_id=agent_id,
             agent_name=agent_name,
             decision_type=decision_type,
@@ -173,7 +211,9 @@ class Tracer:
             confidence=confidence,
             trace_id=trace_id,
         )
-        self.decisions.append(record)
+        with self._lock:
+            self.decisions.append(record)
+            self._decisions_by_agent.setdefault(agent_id, []).append(record)
         return record
 
     def record_metric(
@@ -194,13 +234,32 @@ class Tracer:
 
     def get_trace(self, trace_id: str) -> list[dict[str, Any]]:
         """Get all spans for a trace."""
-        return [s.to_dict() for s in self.spans if s.trace_id == trace_id]
+        with self._lock:
+            spans = list(self._spans_by_trace.get(trace_id, ()))
+        return [s.to_dict() for s in spans]
+
+    def export_columns(self, fields: Iterable[str] = SPAN_COLUMNS) -> dict[str, list[Any]]:
+        """
+        Export spans column-wise: one list per field, one row per span.
+
+        For bulk analysis (durations, status counts) this skips building a
+        dict per span; each column is gathered with a C-level attrgetter
+        map. ``duration_ms`` may be requested like any stored field.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            name: [s.duration_ms for s in spans] if name == "duration_ms"
+            else list(map(attrgetter(name), spans))
+            for name in fields
+        }
 
     def get_audit_trail(self, agent_id: str | None = None) -> list[dict[str, Any]]:
         """Get the decision audit trail, optionally filtered by agent."""
-        decisions = self.decisions
-        if agent_id:
-            decisions = [d for d in decisions if d.agent_id == agent_id]
+        with self._lock:
+            decisions = list(
+                self._decisions_by_agent.get(agent_id, ()) if agent_id else self.decisions
+            )
         return [
             {
                 "decision_id": d.decision_id,
@@ -214,20 +273,28 @@ class Tracer:
         ]
 
     def get_performance_summary(self) -> dict[str, Any]:
-        """Get performance metrics summary."""
-        completed_spans = [s for s in self.spans if s.end_time is not None]
-        durations = [s.duration_ms for s in completed_spans if s.duration_ms is not None]
+        """
+        Get performance metrics summary.
 
-        return {
-            "total_spans": len(self.spans),
-            "completed_spans": len(completed_spans),
-            "active_spans": len(self._active_spans),
-            "total_decisions": len(self.decisions),
-            "total_metrics": len(self.metrics),
-            "avg_span_duration_ms": round(sum(durations) / len(durations), 2) if durations else 0,
-            "max_span_duration_ms": round(max(durations), 2) if durations else 0,
-        }
+        Span counts and durations are running totals, updated whenever a
+        recorded span finishes (through finish_span or Span.finish), so
+        this costs the same however many spans have been recorded.
+        """
+        with self._lock:
+            completed = self._completed_spans
+            total = self._duration_sum_ms
+            return {
+                "total_spans": len(self.spans),
+                "completed_spans": completed,
+                "active_spans": len(self._active_spans),
+                "total_decisions": len(self.decisions),
+                "total_metrics": len(self.metrics),
+                "avg_span_duration_ms": round(total / completed, 2) if completed else 0,
+                "max_span_duration_ms": round(self._duration_max_ms, 2) if completed else 0,
+            }
 
     def export_otel_format(self) -> list[dict[str, Any]]:
         """Export spans in OTel-compatible format."""
-        return [s.to_dict() for s in self.spans]
+        with self._lock:
+            spans = list(self.spans)
+        return [s.to_dict() for s in spans]
@@ -12,19 +12,47 @@ Pipeline: Monitor -> Diagnose -> Remediate -> Verify
 
 from __future__ import annotations
 
+import graphlib
+import threading
 import time
-import uuid
+from collections import deque
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Iterator, NamedTuple
 
 from agentops.agents.base import BaseAgent
 from agentops.agents.diagnoser import DiagnoserAgent
 from agentops.agents.monitor import MonitorAgent
-from agentops.agents.remediator import RemediatorAgent
+from agentops.agents.remediator import RemediationPlan, RemediatorAgent
 from agentops.agents.verifier import VerifierAgent
+from agentops.ids import short_hex
 from agentops.protocol.a2a import A2AProtocol
 
+# Most recent agent actions kept for the combined audit view
+AUDIT_LOG_SIZE = 200
+
+# Threads for running independent DAG nodes of one layer concurrently
+DAG_WORKERS = 4
+
+# Returned by a stage handler to stop the pipeline (e.g. awaiting approval)
+_HALT = object()
+
+# The incident pipeline DAG, as (node_id, task_type, agent_capability,
+# dependencies). Nodes carry per-incident status and results, so each
+# incident gets fresh DAGNodes built from this; only the first (detect)
+# node takes params.
+_DAG_TEMPLATE: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ("detect", "detect", "metric_collection", ()),
+    ("diagnose", "diagnose", "root_cause_analysis", ("detect",)),
+    ("plan", "generate_plan", "fix_generation", ("diagnose",)),
+    ("approve", "approve", "change_execution", ("plan",)),
+    ("execute", "execute", "change_execution", ("approve",)),
+    ("verify", "verify", "metric_comparison", ("execute",)),
+)
+
 
 class IncidentStatus(str, Enum):
     """Incident lifecycle status."""
@@ -41,7 +69,7 @@ class IncidentStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class DAGNode:
     """A node in the task execution DAG."""
     node_id: str
@@ -56,7 +84,15 @@ class DAGNode:
     timeout_seconds: int = 300
 
 
-@dataclass
+class TimelineEvent(NamedTuple):
+    """One incident timeline entry; expanded to a dict only on export."""
+    ns: int  # time.monotonic_ns() when recorded
+    event: str
+    status: str
+    details: dict[str, Any]
+
+
+@dataclass(slots=True)
 class Incident:
     """An infrastructure incident being processed by the orchestrator."""
     incident_id: str
@@ -70,10 +106,38 @@ class Incident:
     diagnosis_report: Any = None
     remediation_plan: Any = None
     verification_report: Any = None
-    timeline: list[dict[str, Any]] = field(default_factory=list)
+    timeline: list[TimelineEvent] = field(default_factory=list)
     auto_approve: bool = False
 
 
+def dag_layers(nodes: list[DAGNode]) -> list[list[DAGNode]]:
+    """
+    Group DAG nodes into layers: each layer depends only on earlier ones.
+
+    Nodes keep their list order within a layer. Raises ValueError on a
+    dependency cycle or a dependency on a node not in the DAG.
+    """
+    by_id = {node.node_id: node for node in nodes}
+    sorter: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter()
+    for node in nodes:
+        missing = [d for d in node.dependencies if d not in by_id]
+        if missing:
+            raise ValueError(f"DAG node {node.node_id!r} depends on unknown {missing}")
+        sorter.add(node.node_id, *node.dependencies)
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as e:
+        raise ValueError(f"DAG has a dependency cycle: {e.args[1]}") from e
+
+    position = {node_id: i for i, node_id in enumerate(by_id)}
+    layers = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready(), key=position.__getitem__)
+        layers.append([by_id[node_id] for node_id in ready])
+        sorter.done(*ready)
+    return layers
+
+
 class Orchestrator:
     """
     Central orchestrator for the AgentOps incident resolution pipeline.
@@ -97,9 +161,35 @@ class Orchestrator:
         self.auto_approve = auto_approve
         self.incidents: dict[str, Incident] = {}
         self._agents: list[BaseAgent] = []
+        # Wall-clock time at monotonic zero. Timeline events are stamped
+        # with monotonic_ns() and converted with this only when exported.
+        self._wall_epoch = time.time() - time.monotonic_ns() / 1e9
+        # Bumped on every incident event; lets views cache rendered state
+        # and lets event streams sleep until something changed
+        self._state_version = 0
+        # Guards incidents, timelines and the remediator's plan tables
+        # against concurrent API requests. Readers copy what they need under
+        # it and serialize after releasing it.
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._pool: ThreadPoolExecutor | None = None
+        # DAGNode.task_type -> stage handler(incident, results so far)
+        self._stage_handlers: dict[str, Callable[[Incident, dict[str, Any]], Any]] = {
+            "detect": self._detect,
+            "diagnose": self._diagnose,
+            "generate_plan": self._plan,
+            "approve": self._approve,
+            "execute": self._execute,
+            "verify": self._verify,
+        }
+        # Actions from every agent, in write order, filled as they are logged
+        self.audit_log: deque[tuple[float, BaseAgent, str, dict[str, Any]]] = deque(
+            maxlen=AUDIT_LOG_SIZE
+        )
 
         # Register all agents
         for agent in [self.monitor, self.diagnoser, self.remediator, self.verifier]:
+            agent.attach_audit_log(self.audit_log)
             agent.start()
             self.protocol.register_agent(agent)
             self._agents.append(agent)
@@ -112,7 +202,7 @@ class Orchestrator:
 
         This creates the full DAG and begins execution.
         """
-        incident_id = f"INC-{uuid.uuid4().hex[:8]}"
+        incident_id = f"INC-{short_hex(8)}"
 
         incident = Incident(
             incident_id=incident_id,
@@ -124,7 +214,8 @@ class Orchestrator:
 
         # Build the execution DAG
         incident.dag_nodes = self._build_dag(incident_id, device_id, scenario)
-        self.incidents[incident_id] = incident
+        with self._lock:
+            self.incidents[incident_id] = incident
 
         self._add_timeline(incident, "incident_created", {
             "description": description,
@@ -137,27 +228,81 @@ class Orchestrator:
         """
         Process an incident through the full pipeline.
 
-        Executes DAG nodes in dependency order, handling each stage
-        of the detect -> diagnose -> remediate -> verify pipeline.
+        Executes DAG nodes layer by layer in dependency order, handling each
+        stage of the detect -> diagnose -> remediate -> verify pipeline.
+        Nodes in the same layer don't depend on each other and run
+        concurrently; each node's result is stored on it for its dependents.
+        Stops early at the approval gate unless the incident is approved.
         """
         incident = self.incidents.get(incident_id)
         if not incident:
             raise KeyError(f"Unknown incident: {incident_id}")
 
-        # Stage 1: Monitor / Detect
+        results: dict[str, Any] = {}
+        for layer in dag_layers(incident.dag_nodes):
+            if len(layer) == 1:
+                outcomes = [self._run_node(incident, layer[0], results)]
+            else:
+                futures = [
+                    self._node_pool().submit(self._run_node, incident, node, results)
+                    for node in layer
+                ]
+                wait(futures, return_when=ALL_COMPLETED)
+                outcomes = [f.result() for f in futures]
+            for node, outcome in zip(layer, outcomes, strict=True):
+                results[node.node_id] = outcome
+            if any(outcome is _HALT for outcome in outcomes):
+                break
+
+        return incident
+
+    def _node_pool(self) -> ThreadPoolExecutor:
+        """Worker threads for DAG layers with more than one node; built on first use."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=DAG_WORKERS, thread_name_prefix="agentops-dag"
+                )
+            return self._pool
+
+    def _run_node(self, incident: Incident, node: DAGNode, results: dict[str, Any]) -> Any:
+        """Run one DAG node's stage, recording its status, timing and result."""
+        handler = self._stage_handlers.get(node.task_type)
+        if handler is None:
+            raise ValueError(f"No stage handler for DAG task type {node.task_type!r}")
+        node.status = "running"
+        node.started_at = time.time()
+        try:
+            result = handler(incident, results)
+        except Exception:
+            node.status = "failed"
+            node.completed_at = time.time()
+            raise
+        if result is _HALT:
+            node.status = "pending"
+            return result
+        node.result = result
+        node.status = "completed"
+        node.completed_at = time.time()
+        return result
+
+    def _detect(self, incident: Incident, results: dict[str, Any]) -> dict[str, Any]:
+        """Stage 1: Monitor / Detect. Returns the device health report."""
         incident.status = IncidentStatus.DETECTED
         self._add_timeline(incident, "detection_started", {})
 
         self.monitor.setup_mock_device(incident.device_id, incident.scenario)
         health_report = self.monitor.check_device(incident.device_id)
-        pre_metrics = health_report["metrics"]
 
         self._add_timeline(incident, "detection_complete", {
             "alerts": len(health_report["alerts"]),
             "healthy": health_report["healthy"],
         })
+        return health_report
 
-        # Stage 2: Diagnose
+    def _diagnose(self, incident: Incident, results: dict[str, Any]) -> Any:
+        """Stage 2: Diagnose. Returns the diagnosis report."""
+        health_report = results["detect"]
         incident.status = IncidentStatus.DIAGNOSING
         self._add_timeline(incident, "diagnosis_started", {})
 
@@ -165,7 +310,7 @@ class Orchestrator:
             incident_id=incident.incident_id,
             device_id=incident.device_id,
             alerts=health_report["alerts"],
-            metrics=pre_metrics,
+            metrics=health_report["metrics"],
         )
         incident.diagnosis_report = diagnosis
 
@@ -179,13 +324,11 @@ class Orchestrator:
             ),
             "confidence": diagnosis.confidence_level,
         })
+        return diagnosis
 
-        # Determine incident type from diagnosis
-        incident_type = incident.scenario
-        if diagnosis.primary_hypothesis:
-            incident_type = diagnosis.primary_hypothesis.category
-
-        # Stage 3: Generate remediation plan
+    def _plan(self, incident: Incident, results: dict[str, Any]) -> RemediationPlan:
+        """Stage 3: Generate remediation plan."""
+        diagnosis = results["diagnose"]
         incident.status = IncidentStatus.REMEDIATING
         self._add_timeline(incident, "remediation_planning", {})
 
@@ -193,13 +336,14 @@ class Orchestrator:
         if diagnosis.primary_hypothesis:
             blast_radius = diagnosis.primary_hypothesis.blast_radius
 
-        plan = self.remediator.generate_plan(
-            incident_id=incident.incident_id,
-            diagnosis_report_id=diagnosis.report_id,
-            incident_type=incident.scenario,
-            device_id=incident.device_id,
-            blast_radius=blast_radius,
-        )
+        with self._lock:
+            plan = self.remediator.generate_plan(
+                incident_id=incident.incident_id,
+                diagnosis_report_id=diagnosis.report_id,
+                incident_type=incident.scenario,
+                device_id=incident.device_id,
+                blast_radius=blast_radius,
+            )
         incident.remediation_plan = plan
 
         self._add_timeline(incident, "remediation_plan_generated", {
@@ -207,30 +351,41 @@ class Orchestrator:
             "risk_level": plan.risk_level.value,
             "step_count": len(plan.steps),
         })
+        return plan
 
-        # Stage 4: Approval gate
+    def _approve(self, incident: Incident, results: dict[str, Any]) -> Any:
+        """Stage 4: Approval gate. Halts the pipeline until approved."""
+        plan = results["plan"]
         incident.status = IncidentStatus.AWAITING_APPROVAL
         self._add_timeline(incident, "awaiting_approval", {
             "plan_id": plan.plan_id,
             "auto_approve": incident.auto_approve,
         })
 
-        if incident.auto_approve:
-            self.remediator.approve_plan(plan.plan_id, approved_by="auto-orchestrator")
-            self._add_timeline(incident, "auto_approved", {"plan_id": plan.plan_id})
-        else:
+        if not incident.auto_approve:
             # In non-auto mode, stop here and wait for manual approval
-            return incident
+            return _HALT
+        with self._lock:
+            self.remediator.approve_plan(plan.plan_id, approved_by="auto-orchestrator")
+        self._add_timeline(incident, "auto_approved", {"plan_id": plan.plan_id})
+        return plan
 
-        # Stage 5: Execute
+    def _execute(self, incident: Incident, results: dict[str, Any]) -> RemediationPlan:
+        """Stage 5: Execute the approved plan."""
+        plan: RemediationPlan = results["approve"]
         incident.status = IncidentStatus.EXECUTING
         self._add_timeline(incident, "execution_started", {"plan_id": plan.plan_id})
 
-        self.remediator.execute_plan(plan.plan_id)
+        with self._lock:
+            self.remediator.execute_plan(plan.plan_id)
 
         self._add_timeline(incident, "execution_complete", {"plan_id": plan.plan_id})
+        return plan
 
-        # Stage 6: Verify
+    def _verify(self, incident: Incident, results: dict[str, Any]) -> Any:
+        """Stage 6: Verify, then Stage 7: roll back or resolve."""
+        plan: RemediationPlan = results["execute"]
+        pre_metrics = results["detect"]["metrics"]
         incident.status = IncidentStatus.VERIFYING
         self._add_timeline(incident, "verification_started", {})
 
@@ -251,9 +406,9 @@ class Orchestrator:
             "rollback_recommended": verification.rollback_recommended,
         })
 
-        # Stage 7: Rollback or resolve
         if verification.rollback_recommended:
-            self.remediator.rollback_plan(plan.plan_id, reason="verification_failed")
+            with self._lock:
+                self.remediator.rollback_plan(plan.plan_id, reason="verification_failed")
             incident.status = IncidentStatus.ROLLED_BACK
             self._add_timeline(incident, "rolled_back", {
                 "reason": "Verification failed — metrics did not improve",
@@ -264,30 +419,96 @@ class Orchestrator:
             self._add_timeline(incident, "resolved", {
                 "duration_seconds": round(incident.resolved_at - incident.created_at, 2),
             })
-
-        return incident
+        return verification
 
     def approve_incident(self, incident_id: str, approved_by: str = "operator") -> Incident:
         """Manually approve an incident's remediation plan and continue processing."""
         incident = self.incidents.get(incident_id)
         if not incident:
             raise KeyError(f"Unknown incident: {incident_id}")
-        if incident.status != IncidentStatus.AWAITING_APPROVAL:
-            raise ValueError(f"Incident not awaiting approval: {incident.status.value}")
+        with self._lock:
+            if incident.status != IncidentStatus.AWAITING_APPROVAL:
+                raise ValueError(f"Incident not awaiting approval: {incident.status.value}")
 
-        plan = incident.remediation_plan
-        self.remediator.approve_plan(plan.plan_id, approved_by=approved_by)
-        incident.auto_approve = True  # Allow pipeline to continue
+            plan = incident.remediation_plan
+            self.remediator.approve_plan(plan.plan_id, approved_by=approved_by)
+            incident.auto_approve = True  # Allow pipeline to continue
 
         # Re-process from approval point
         return self.process_incident(incident_id)
 
     def get_incident_timeline(self, incident_id: str) -> list[dict[str, Any]]:
-        """Get the full timeline for an incident."""
+        """Get the full timeline for an incident, with wall-clock timestamps."""
         incident = self.incidents.get(incident_id)
         if not incident:
             return []
-        return incident.timeline
+        with self._lock:
+            events = list(incident.timeline)
+        epoch = self._wall_epoch
+        return [
+            {"timestamp": epoch + ns / 1e9, "event": event, "status": status, "details": details}
+            for ns, event, status, details in events
+        ]
+
+    def snapshot_incidents(self) -> list[Incident]:
+        """Return the incidents, oldest first, as a list safe to iterate."""
+        with self._lock:
+            return list(self.incidents.values())
+
+    def recent_incidents(self, limit: int) -> list[Incident]:
+        """
+        Return up to ``limit`` of the newest incidents, oldest first.
+
+        Walks back from the newest, so only the returned incidents are touched.
+        """
+        with self._lock:
+            recent = list(islice(reversed(self.incidents.values()), limit))
+        recent.reverse()
+        return recent
+
+    def pending_approvals(self) -> list[RemediationPlan]:
+        """Return the remediator's plans awaiting approval."""
+        with self._lock:
+            return self.remediator.get_pending_approvals()
+
+    def get_audit_log(self) -> list[dict[str, Any]]:
+        """Return the combined agent audit log, newest first."""
+        return list(self.iter_audit_log())
+
+    def iter_audit_log(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the combined agent audit log, newest first, one dict at a time.
+
+        The buffer is snapshotted up front, so agents may keep logging while
+        the caller is still consuming. Entries are appended in write order,
+        which is timestamp order except where a batched flush (see
+        BaseAgent.log_batch) lands after another agent's newer entries; the
+        sort puts those back in place, and costs one linear pass (Timsort
+        sees a single run) when the buffer is already in order.
+        """
+        snapshot = sorted(self.audit_log, key=itemgetter(0), reverse=True)
+        for ts, agent, action, details in snapshot:
+            yield {
+                "timestamp": ts,
+                "agent_id": agent.agent_id,
+                "agent_name": agent.name,
+                "action": action,
+                "details": details,
+            }
+
+    @property
+    def state_version(self) -> int:
+        """Counter that changes whenever an incident is created or advances."""
+        return self._state_version
+
+    def wait_for_change(self, version: int, timeout: float | None = None) -> int:
+        """
+        Block until ``state_version`` differs from ``version`` or ``timeout``
+        seconds pass. Returns the current version either way.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._state_version != version, timeout)
+            return self._state_version
 
     def get_status(self) -> dict[str, Any]:
         """Get orchestrator status summary."""
@@ -301,45 +522,13 @@ class Orchestrator:
         }
 
     def _build_dag(self, incident_id: str, device_id: str, scenario: str) -> list[DAGNode]:
-        """Build the execution DAG for an incident."""
-        return [
-            DAGNode(
-                node_id="detect",
-                task_type="detect",
-                agent_capability="metric_collection",
-                params={"device_id": device_id, "scenario": scenario},
-            ),
-            DAGNode(
-                node_id="diagnose",
-                task_type="diagnose",
-                agent_capability="root_cause_analysis",
-                dependencies=["detect"],
-            ),
-            DAGNode(
-                node_id="plan",
-                task_type="generate_plan",
-                agent_capability="fix_generation",
-                dependencies=["diagnose"],
-            ),
-            DAGNode(
-                node_id="approve",
-                task_type="approve",
-                agent_capability="change_execution",
-                dependencies=["plan"],
-            ),
-            DAGNode(
-                node_id="execute",
-                task_type="execute",
-                agent_capability="change_execution",
-                dependencies=["approve"],
-            ),
-            DAGNode(
-                node_id="verify",
-                task_type="verify",
-                agent_capability="metric_comparison",
-                dependencies=["execute"],
-            ),
+        """Build the execution DAG for an incident from _DAG_TEMPLATE."""
+        nodes = [
+            DAGNode(node_id, task_type, capability, {}, list(deps))
+            for node_id, task_type, capability, deps in _DAG_TEMPLATE
         ]
+        nodes[0].params = {"device_id": device_id, "scenario": scenario}
+        return nodes
 
     def _simulate_post_remediation_metrics(
         self, pre_metrics: dict[str, float], scenario: str
@@ -365,17 +554,17 @@ class Orchestrator:
         self, incident: Incident, event: str, details: dict[str, Any]
     ) -> None:
         """Add an event to the incident timeline."""
-        incident.timeline.append({
-            "timestamp": time.time(),
-            "event": event,
-            "status": incident.status.value,
-            "details": details,
-        })
+        with self._changed:
+            incident.timeline.append(
+                TimelineEvent(time.monotonic_ns(), event, incident.status.value, details)
+            )
+            self._state_version += 1
+            self._changed.notify_all()
 
     def _count_by_status(self) -> dict[str, int]:
         """Count incidents by status."""
         counts: dict[str, int] = {}
-        for inc in self.incidents.values():
+        for inc in self.snapshot_incidents():
             status = inc.status.value
             counts[status] = counts.get(status, 0) + 1
         return counts
@@ -97,8 +97,7 @@ class A2AProtocol:
         def score(agent_id: str) -> tuple[int, int]:
             card = self._cards[agent_id]
             agent = self._agents[agent_id]
-            active = len([t for t in agent._active_tasks.values() if t["status"] == "created"])
-            return (card.priority, active)
+            return (card.priority, agent.active_task_count)
 
         candidates.sort(key=score)
         return candidates[0]
@@ -74,9 +74,7 @@ class KillSwitch:
                 try:
                     agent.pause()
                     affected_agents.append(agent.agent_id)
-                    affected_tasks += len(
-                        [t for t in agent._active_tasks.values() if t["status"] == "created"]
-                    )
+                    affected_tasks += agent.active_task_count
                 except ValueError:
                     # Agent may already be in a non-pausable state
                     pass
@@ -0,0 +1,60 @@
+"""
+JSON serialization helpers with an optional orjson fast path.
+
+orjson is used when installed (``pip install agentops[fast]``); otherwise
+the stdlib json module produces equivalent compact output.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any, Callable, cast
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] = str) -> bytes:
+    """
+    Serialize ``obj`` to compact UTF-8 JSON bytes.
+
+    ``default`` converts objects JSON has no encoding for. Non-string
+    dict keys (ints, enums) are accepted on both paths.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def make_to_dict(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generate a flat ``to_dict`` function for a dataclass.
+
+    The function body is a single dict display listing every public field,
+    compiled once with exec, so each call is one BUILD_MAP with no loop,
+    getattr, or recursive copying as in dataclasses.asdict. Fields whose
+    names start with an underscore are skipped.
+    """
+    names = [f.name for f in dataclasses.fields(cls) if not f.name.startswith("_")]
+    for name in names:
+        if not name.isidentifier():
+            raise ValueError(f"Cannot generate to_dict for field {name!r}")
+    items = ", ".join(f"{name!r}: self.{name}" for name in names)
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", {}, namespace)
+    fn = cast(Callable[[Any], dict[str, Any]], namespace["to_dict"])
+    fn.__qualname__ = f"{cls.__qualname__}.to_dict"
+    fn.__doc__ = f"Return the public fields of a {cls.__name__} as a dict."
+    return fn
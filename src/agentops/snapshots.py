@@ -0,0 +1,99 @@
+"""
+Snapshot stores — durable state for long-lived agent objects.
+
+Remediation plans can sit in AWAITING_APPROVAL for hours. A SnapshotStore
+keeps each plan's serialized state keyed by ID so pending approvals
+survive a process restart and resume from exactly the state that was
+suspended. Blobs are opaque bytes; the status column lets callers find
+e.g. every plan still awaiting approval without decoding them all.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Protocol
+
+
+class SnapshotStore(Protocol):
+    """Keyed blob storage with a queryable status per entry."""
+
+    def save(self, key: str, status: str, blob: bytes) -> None: ...
+
+    def load(self, key: str) -> bytes | None: ...
+
+    def keys(self, status: str | None = None) -> list[str]: ...
+
+
+class MemorySnapshotStore:
+    """In-process SnapshotStore, for tests and single-run demos."""
+
+    def __init__(self) -> None:
+        self._rows: dict[str, tuple[str, bytes]] = {}
+
+    def save(self, key: str, status: str, blob: bytes) -> None:
+        self._rows[key] = (status, blob)
+
+    def load(self, key: str) -> bytes | None:
+        row = self._rows.get(key)
+        return row[1] if row else None
+
+    def keys(self, status: str | None = None) -> list[str]:
+        if status is None:
+            return list(self._rows)
+        return [k for k, (s, _) in self._rows.items() if s == status]
+
+
+class SQLiteSnapshotStore:
+    """
+    SnapshotStore backed by a SQLite file, one row per key.
+
+    The database runs in WAL mode so readers (e.g. the API listing pending
+    approvals) never block the agent writing a status change. A single
+    connection is shared across threads behind a lock.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " key TEXT PRIMARY KEY, status TEXT NOT NULL, blob BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS snapshots_status ON snapshots (status)"
+            )
+
+    def save(self, key: str, status: str, blob: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO snapshots (key, status, blob) VALUES (?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET status = excluded.status, blob = excluded.blob",
+                (key, status, blob),
+            )
+
+    def load(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob FROM snapshots WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def keys(self, status: str | None = None) -> list[str]:
+        with self._lock:
+            if status is None:
+                rows = self._conn.execute("SELECT key FROM snapshots ORDER BY rowid")
+            else:
+                rows = self._conn.execute(
+                    "SELECT key FROM snapshots WHERE status = ? ORDER BY rowid", (status,)
+                )
+            return [r[0] for r in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -24,6 +24,14 @@ class TestAPI:
         assert resp.status_code == 200
         assert resp.get_json()["status"] == "healthy"
 
+    def test_health_timestamp_is_current(self, client):
+        import time
+
+        before = time.time()
+        data = client.get("/api/v1/health").get_json()
+        assert isinstance(data["timestamp"], float)
+        assert before <= data["timestamp"] <= time.time()
+
     def test_status(self, client):
         resp = client.get("/api/v1/status")
         assert resp.status_code == 200
@@ -79,3 +87,182 @@ class TestAPI:
     def test_approvals(self, client):
         resp = client.get("/api/v1/approvals")
         assert resp.status_code == 200
+
+
+class TestJSONProvider:
+    def test_responses_compact_and_unsorted(self, client):
+        resp = client.get("/")
+        assert resp.data.startswith(b'{"name":"AgentOps API","version":')
+
+    def test_debug_mode_stays_compact(self):
+        app = create_api_app()
+        app.debug = True
+        resp = app.test_client().get("/api/v1/audit")
+        assert b"\n" not in resp.data
+        assert b'{"audit_log":[' in resp.data
+
+    def test_enums_encoded_by_value(self):
+        from enum import Enum
+
+        from agentops.api.json_provider import FastJSONProvider
+
+        class Color(Enum):
+            RED = 1
+
+        app = create_api_app()
+        assert isinstance(app.json, FastJSONProvider)
+        assert app.json.loads(app.json.dumps({"c": Color.RED})) == {"c": 1}
+
+
+class TestRequestValidation:
+    def test_invalid_field_type_rejected(self, client):
+        resp = client.post("/api/v1/incidents", json={"device_id": 42})
+        assert resp.status_code == 422
+        data = resp.get_json()
+        assert data["details"][0]["loc"] == ["device_id"]
+
+    def test_missing_body_uses_defaults(self, client):
+        resp = client.post("/api/v1/incidents")
+        assert resp.status_code == 201
+        assert resp.get_json()["device_id"] == "unknown"
+
+    def test_truncated_incident_body_rejected(self, client):
+        resp = client.post(
+            "/api/v1/incidents",
+            data='{"device_id": "core-rtr-01", "scenario": "cpu_spike"',
+            content_type="application/json",
+        )
+        assert resp.status_code == 400
+        assert client.get("/api/v1/status").get_json()["incidents"]["total"] == 0
+
+    def test_truncated_approval_body_rejected(self):
+        app = create_api_app(auto_approve=False)
+        client = app.test_client()
+        incident_id = client.post("/api/v1/incidents", json={
+            "device_id": "web-srv-01", "scenario": "cpu_spike",
+        }).get_json()["incident_id"]
+        client.post(f"/api/v1/incidents/{incident_id}/process")
+
+        resp = client.post(
+            f"/api/v1/incidents/{incident_id}/approve",
+            data='{"approved_by": "alice"',
+            content_type="application/json",
+        )
+        assert resp.status_code == 400
+        status = client.get(f"/api/v1/incidents/{incident_id}").get_json()["status"]
+        assert status == "awaiting_approval"
+
+    def test_non_object_body_rejected(self, client):
+        resp = client.post("/api/v1/incidents", json=["web-srv-01"])
+        assert resp.status_code == 422
+
+
+class TestCachedViews:
+    def test_status_replayed_until_state_changes(self, client):
+        from agentops.api.routes import get_orchestrator
+
+        orch = get_orchestrator()
+        first = client.get("/api/v1/status")
+        orch.protocol.get_stats = lambda: {"patched": True}  # not a state change
+        assert client.get("/api/v1/status").data == first.data
+
+        version = orch.state_version
+        client.post("/api/v1/incidents", json={"device_id": "web-srv-01"})
+        assert orch.state_version > version
+        fresh = client.get("/api/v1/status").get_json()
+        assert fresh["incidents"]["total"] == 1
+        assert fresh["protocol"] == {"patched": True}
+
+    def test_entry_expires_after_ttl(self, client, monkeypatch):
+        from agentops.api import caching
+        from agentops.api.routes import get_orchestrator
+
+        client.get("/api/v1/status")
+        get_orchestrator().protocol.get_stats = lambda: {"patched": True}
+        now = caching.time.monotonic()
+        monkeypatch.setattr(caching.time, "monotonic", lambda: now + 5)
+        assert client.get("/api/v1/status").get_json()["protocol"] == {"patched": True}
+
+
+class TestStreamedAudit:
+    def test_audit_streamed_in_chunks(self, client, monkeypatch):
+        from agentops.api import routes
+
+        monkeypatch.setattr(routes, "STREAM_CHUNK_SIZE", 3)
+        client.post("/api/v1/incidents", json={"device_id": "web-srv-01"})
+        resp = client.get("/api/v1/audit")
+        assert resp.is_streamed
+        entries = resp.get_json()["audit_log"]
+        assert entries == routes.get_orchestrator().get_audit_log()
+        assert len(entries) > 3
+
+    def test_blueprint_on_a_plain_flask_app(self):
+        from flask import Flask
+
+        from agentops.api.routes import api_bp, set_orchestrator
+        from agentops.orchestrator.engine import Orchestrator
+
+        orch = Orchestrator()
+        orch.submit_incident("web-srv-01", "test", "cpu_spike")
+        set_orchestrator(orch)
+        app = Flask(__name__)  # default JSON provider
+        app.register_blueprint(api_bp)
+        resp = app.test_client().get("/api/v1/audit")
+        assert resp.status_code == 200
+        assert resp.get_json()["audit_log"] == orch.get_audit_log()
+
+    def test_empty_array(self):
+        from agentops.api.routes import _stream_json_array
+
+        assert b"".join(_stream_json_array("k", iter([]), bytes)) == b'{"k":[]}'
+
+
+class TestStatusEvents:
+    def test_event_per_state_change(self, client):
+        import json
+
+        resp = client.get("/api/v1/events", buffered=False)
+        assert resp.mimetype == "text/event-stream"
+        stream = resp.response
+        first = next(stream)
+        assert first.startswith(b"id: ") and first.endswith(b"\n\n")
+        client.post("/api/v1/incidents", json={"device_id": "web-srv-01"})
+        second = next(stream)
+        payload = json.loads(second.split(b"data: ", 1)[1])
+        assert payload["incidents"]["total"] == 1
+        assert second != first
+        resp.close()
+
+    def test_stream_on_a_plain_flask_app(self):
+        from flask import Flask
+
+        from agentops.api.routes import api_bp, set_orchestrator
+        from agentops.orchestrator.engine import Orchestrator
+
+        set_orchestrator(Orchestrator())
+        app = Flask(__name__)  # default JSON provider
+        app.register_blueprint(api_bp)
+        resp = app.test_client().get("/api/v1/events", buffered=False)
+        assert next(resp.response).startswith(b"id: ")
+        resp.close()
+
+
+class TestCompression:
+    def test_json_gzipped_when_accepted(self, client):
+        import gzip
+        import json
+
+        client.post("/api/v1/incidents", json={"device_id": "web-srv-01"})
+        plain = client.get("/api/v1/agents")
+        assert "Content-Encoding" not in plain.headers
+        resp = client.get("/api/v1/agents", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert json.loads(gzip.decompress(resp.data)) == plain.get_json()
+        assert len(resp.data) < len(plain.data)
+
+    def test_small_and_streamed_responses_untouched(self, client):
+        headers = {"Accept-Encoding": "gzip"}
+        assert "Content-Encoding" not in client.get("/api/v1/health", headers=headers).headers
+        resp = client.get("/api/v1/audit", headers=headers)
+        assert resp.is_streamed and "Content-Encoding" not in resp.headers
@@ -1,7 +1,10 @@
 """Tests for BaseAgent — lifecycle, messaging, task management."""
 
+import asyncio
+import json
+
 import pytest
-from agentops.agents.base import BaseAgent, AgentCard, AgentState
+from agentops.agents.base import BaseAgent, AgentCard, AgentState, format_details
 
 
 class TestAgentCard:
@@ -22,6 +25,25 @@ class TestAgentCard:
         assert d["agent_id"] == "t1"
         assert isinstance(d["capabilities"], list)
 
+    def test_card_to_dict_invalidated_on_mutation(self):
+        card = AgentCard(agent_id="t1", name="T", description="D")
+        assert card.to_dict()["priority"] == 5
+        card.priority = 1
+        assert card.to_dict()["priority"] == 1
+
+    def test_card_to_dict_returns_copy(self):
+        card = AgentCard(agent_id="t1", name="T", description="D")
+        card.to_dict()["name"] = "changed"
+        assert card.to_dict()["name"] == "T"
+
+    def test_card_to_json_bytes(self):
+        card = AgentCard(agent_id="t1", name="T", description="D", capabilities=["x"])
+        blob = card.to_json_bytes()
+        assert json.loads(blob)["capabilities"] == ["x"]
+        assert card.to_json_bytes() is blob
+        card.name = "U"
+        assert json.loads(card.to_json_bytes())["name"] == "U"
+
     def test_card_defaults(self):
         card = AgentCard(agent_id="t1", name="T", description="D")
         assert card.priority == 5
@@ -63,12 +85,26 @@ class TestAgentLifecycle:
         with pytest.raises(ValueError, match="Invalid state transition"):
             agent.state = AgentState.ACTIVE  # Can't go INIT -> ACTIVE directly
 
+    def test_stopped_only_reinitializes(self):
+        agent = BaseAgent("test", "test agent")
+        agent.start()
+        agent.stop()
+        with pytest.raises(ValueError, match="stopped -> active"):
+            agent.state = AgentState.ACTIVE
+        agent.state = AgentState.INIT
+        assert agent.state == AgentState.INIT
+
     def test_error_recovery(self):
         agent = BaseAgent("test", "test agent")
         agent.state = AgentState.ERROR
         agent.state = AgentState.INIT
         assert agent.state == AgentState.INIT
 
+    def test_slots_reject_unknown_attributes(self):
+        agent = BaseAgent("test", "test agent")
+        with pytest.raises(AttributeError):
+            agent.not_a_field = 1
+
 
 class TestAgentMessaging:
     def test_register_handler(self):
@@ -148,3 +184,187 @@ class TestAgentStatus:
         agent = BaseAgent("test", "test agent")
         assert "test" in repr(agent)
         assert "init" in repr(agent)
+
+    def test_status_task_counters(self):
+        agent = BaseAgent("test", "test agent")
+        t1 = agent.create_task("a", {})
+        t2 = agent.create_task("b", {})
+        agent.create_task("c", {})
+        agent.complete_task(t1, None)
+        agent.fail_task(t2, "err")
+        status = agent.get_status()
+        counts = (status["active_tasks"], status["completed_tasks"], status["failed_tasks"])
+        assert counts == (1, 1, 1)
+        assert agent.active_task_count == 1
+
+
+class TestAgentHistoryBounds:
+    def test_action_log_is_bounded(self):
+        agent = BaseAgent("test", "test agent", history_limit=5)
+        for i in range(20):
+            agent.create_task("t", {"i": i})
+        assert len(agent.get_action_log()) == 5
+        assert agent.get_status()["evicted_log_entries"] == 15
+
+    def test_message_counts_include_evicted(self):
+        agent = BaseAgent("test", "test agent", history_limit=3)
+        for _ in range(10):
+            agent.receive_message({"type": "ping"})
+            agent.send_message("target-1", {"type": "pong"})
+        status = agent.get_status()
+        assert len(agent._inbox) == 3
+        assert status["messages_received"] == 10
+        assert status["messages_sent"] == 10
+
+    def test_action_log_limit_returns_most_recent(self):
+        agent = BaseAgent("test", "test agent")
+        for i in range(5):
+            agent.create_task(f"t{i}", {})
+        log = agent.get_action_log(limit=2)
+        assert [e["details"]["type"] for e in log] == ["t3", "t4"]
+        assert log[0]["agent_name"] == "test"
+
+
+class TestActionBatch:
+    def test_entries_appended_on_exit(self):
+        agent = BaseAgent("test", "test agent")
+        with agent.log_batch() as batch:
+            batch.add("a", {"i": 1})
+            batch.add("b")
+            assert agent.get_action_log() == []
+        assert [(e["action"], e["details"]) for e in agent.get_action_log()] == [
+            ("a", {"i": 1}), ("b", {}),
+        ]
+
+    def test_flushes_when_full_and_on_error(self):
+        agent = BaseAgent("test", "test agent")
+        with pytest.raises(RuntimeError), agent.log_batch(max_batch=2) as batch:
+            for i in range(3):
+                batch.add("step", {"i": i})
+                if i == 1:
+                    assert len(agent.get_action_log()) == 2
+            raise RuntimeError("executor failed")
+        assert [e["details"]["i"] for e in agent.get_action_log()] == [0, 1, 2]
+
+    def test_bulk_append_counts_evictions(self):
+        agent = BaseAgent("test", "test agent", history_limit=5)
+        agent.create_task("t", {})
+        with agent.log_batch() as batch:
+            for i in range(8):
+                batch.add("step", {"i": i})
+        assert [e["details"]["i"] for e in agent.get_action_log()] == [3, 4, 5, 6, 7]
+        assert agent.get_status()["evicted_log_entries"] == 4
+
+
+    def test_format_details_keeps_first_three_in_order(self):
+        details = {"b": 1, "a": [2], "c": None, "d": "dropped"}
+        assert format_details(details) == "b=1, a=[2], c=None"
+        assert format_details({}) == ""
+
+
+class TestAsyncInbox:
+    def test_consumer_dispatches_posted_messages(self):
+        received = []
+
+        async def handler(message):
+            received.append(message["n"])
+
+        async def run():
+            agent = BaseAgent("test", "test agent")
+            agent.register_handler("work", handler)
+            agent.start()
+            for n in range(3):
+                await agent.post_message({"type": "work", "n": n})
+            await agent.drain()
+            agent.stop()
+
+        asyncio.run(run())
+        assert received == [0, 1, 2]
+
+    def test_handler_error_does_not_stop_consumer(self):
+        def handler(message):
+            if message["n"] == 0:
+                raise RuntimeError("boom")
+            return {"ok": True}
+
+        async def run():
+            agent = BaseAgent("test", "test agent")
+            agent.register_handler("work", handler)
+            agent.start()
+            await agent.post_message({"type": "work", "n": 0})
+            await agent.post_message({"type": "work", "n": 1})
+            await agent.drain()
+            agent.stop()
+            return agent
+
+        agent = asyncio.run(run())
+        actions = [e["action"] for e in agent.get_action_log()]
+        assert "message_handler_error" in actions
+        assert len(agent._inbox) == 2
+
+    def test_start_without_loop_has_no_consumer(self):
+        agent = BaseAgent("test", "test agent")
+        agent.start()
+        assert agent._consumer is None
+
+    def test_slow_async_handler_times_out(self):
+        async def slow(message):
+            await asyncio.sleep(1)
+
+        async def run():
+            agent = BaseAgent("test", "test agent")
+            agent.handler_timeout_seconds = 0.01
+            agent.register_handler("slow", slow)
+            agent.start()
+            await agent.post_message({"type": "slow"})
+            await agent.drain()
+            agent.stop()
+            return agent
+
+        agent = asyncio.run(run())
+        assert any(e["action"] == "message_handler_timeout" for e in agent.get_action_log())
+
+
+class TestBatchingOutbox:
+    def test_flush_when_batch_full(self):
+        batches = []
+        agent = BaseAgent("test", "test agent")
+        agent.set_batch_transport(batches.append, max_batch=3)
+        for i in range(7):
+            agent.send_message("target-1", {"type": "t", "n": i})
+        assert [len(b) for b in batches] == [3, 3]
+        assert agent.flush_outbox() == 1
+        assert len(batches[2]) == 1
+        assert len(agent._outbox) == 7
+
+    def test_async_transport_rejected(self):
+        async def send(batch):
+            pass
+
+        agent = BaseAgent("test", "test agent")
+        with pytest.raises(TypeError):
+            agent.set_batch_transport(send)
+        assert agent._batcher is None
+
+    def test_linger_flush_in_event_loop(self):
+        batches = []
+
+        async def run():
+            agent = BaseAgent("test", "test agent")
+            agent.set_batch_transport(batches.append, max_batch=100, linger_ms=1)
+            agent.send_message("target-1", {"type": "a"})
+            agent.send_message("target-1", {"type": "b"})
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        assert len(batches) == 1
+        assert [m["type"] for m in batches[0]] == ["a", "b"]
+
+    def test_stop_flushes_pending(self):
+        batches = []
+        agent = BaseAgent("test", "test agent")
+        agent.start()
+        agent.set_batch_transport(batches.append)
+        agent.send_message("target-1", {"type": "a"})
+        agent.stop()
+        assert len(batches) == 1
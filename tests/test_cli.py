@@ -0,0 +1,101 @@
+"""Tests for CLI commands that talk to a running API server."""
+
+import json
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from agentops import cli
+from agentops.api.routes import create_api_app
+
+API_URL = "http://agentops.test"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """An in-process API server the CLI's HTTP client is routed to."""
+    app = create_api_app(auto_approve=False)
+    app.config["TESTING"] = True
+    client = httpx.Client(transport=httpx.WSGITransport(app=app), timeout=5.0)
+    monkeypatch.setattr(cli, "_api_client", lambda: client)
+    yield client
+    client.close()
+
+
+def _pending_incident(api, device_id="web-srv-01", scenario="cpu_spike"):
+    """Submit and process an incident so its plan waits for approval."""
+    resp = api.post(f"{API_URL}/api/v1/incidents", json={
+        "device_id": device_id, "description": "test", "scenario": scenario,
+    })
+    incident_id = resp.json()["incident_id"]
+    api.post(f"{API_URL}/api/v1/incidents/{incident_id}/process")
+    return incident_id
+
+
+def _pending_plans(api):
+    return api.get(f"{API_URL}/api/v1/approvals").json()["pending"]
+
+
+class TestApprove:
+    def test_without_api_url_prints_instructions(self):
+        result = CliRunner().invoke(cli.cli, ["approve", "REM-1"])
+        assert result.exit_code == 0
+        assert "POST /api/v1/incidents/<incident_id>/approve" in result.output
+
+    def test_requires_plan_id_or_all(self, api):
+        result = CliRunner().invoke(cli.cli, ["approve", "--api-url", API_URL])
+        assert result.exit_code == 2
+        assert "Give a PLAN_ID or --all" in result.output
+
+    def test_approve_one_plan(self, api):
+        _pending_incident(api, "web-srv-01")
+        _pending_incident(api, "db-srv-01", "disk_full")
+        first, second = _pending_plans(api)
+
+        result = CliRunner().invoke(
+            cli.cli, ["approve", first["plan_id"], "--api-url", API_URL],
+        )
+        assert result.exit_code == 0, result.output
+        assert f"Approved {first['plan_id']}" in result.output
+        assert [p["plan_id"] for p in _pending_plans(api)] == [second["plan_id"]]
+
+    def test_approve_all(self, api):
+        _pending_incident(api, "web-srv-01")
+        _pending_incident(api, "db-srv-01", "disk_full")
+        plan_ids = [p["plan_id"] for p in _pending_plans(api)]
+
+        result = CliRunner().invoke(cli.cli, ["approve", "--all", "--api-url", API_URL])
+        assert result.exit_code == 0, result.output
+        assert all(f"Approved {plan_id}" in result.output for plan_id in plan_ids)
+        assert _pending_plans(api) == []
+
+    def test_unknown_plan_id(self, api):
+        _pending_incident(api)
+        result = CliRunner().invoke(cli.cli, ["approve", "REM-missing", "--api-url", API_URL])
+        assert result.exit_code == 1
+        assert "No pending plan REM-missing" in result.output
+        assert len(_pending_plans(api)) == 1
+
+    def test_api_error_raises_click_exception(self, monkeypatch):
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = httpx.Client(transport=httpx.MockTransport(refuse))
+        monkeypatch.setattr(cli, "_api_client", lambda: client)
+        result = CliRunner().invoke(cli.cli, ["approve", "--all", "--api-url", API_URL])
+        assert result.exit_code == 1
+        assert f"API request to {API_URL} failed" in result.output
+
+
+class TestStatusJson:
+    def test_local_and_api_agents_share_a_schema(self, api):
+        local = CliRunner().invoke(cli.cli, ["status", "--json"])
+        remote = CliRunner().invoke(cli.cli, ["status", "--json", "--api-url", API_URL])
+        assert local.exit_code == 0, local.output
+        assert remote.exit_code == 0, remote.output
+
+        local_agents = json.loads(local.output)["agents"]
+        remote_agents = json.loads(remote.output)["agents"]
+        assert local_agents == remote_agents
+        assert set(local_agents[0]) == {"name", "state", "capabilities"}
@@ -0,0 +1,66 @@
+"""Tests for the web dashboard."""
+
+import pytest
+from agentops.dashboard.app import create_dashboard_app, get_dashboard_orchestrator
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app(auto_approve=True)
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+class TestDashboard:
+    def test_index_renders(self, client):
+        orch = get_dashboard_orchestrator()
+        orch.submit_incident("web-srv-01", "CPU spike", "cpu_spike")
+        resp = client.get("/")
+        assert resp.status_code == 200
+        assert b"4 Agents Active" in resp.data
+        assert b"web-srv-01" in resp.data
+
+    def test_index_escapes_incident_text(self, client):
+        get_dashboard_orchestrator().submit_incident("dev-1", "<script>x</script>")
+        resp = client.get("/")
+        assert b"<script>x</script>" not in resp.data
+        assert b"&lt;script&gt;" in resp.data
+
+    def test_api_status(self, client):
+        assert "agents" in client.get("/api/status").get_json()
+
+    def test_lists_only_recent_incidents_in_order(self, client):
+        orch = get_dashboard_orchestrator()
+        ids = [orch.submit_incident(f"dev-{i}", "x").incident_id for i in range(12)]
+        page = client.get("/").get_data(as_text=True)
+        assert ids[0] not in page and ids[1] not in page
+        positions = [page.index(i) for i in ids[2:]]
+        assert positions == sorted(positions)
+
+    def test_status_classes(self, client):
+        orch = get_dashboard_orchestrator()
+        resolved = orch.submit_incident("web-srv-01", "CPU spike", "cpu_spike")
+        orch.process_incident(resolved.incident_id)
+        orch.submit_incident("web-srv-02", "new")
+        page = client.get("/").get_data(as_text=True)
+        assert 'class="status status-resolved">resolved<' in page
+        assert 'class="status status-detecting">detected<' in page
+
+    def test_events_stream_shares_encoding(self, client):
+        first = client.get("/api/events", buffered=False)
+        second = client.get("/api/events", buffered=False)
+        assert first.mimetype == "text/event-stream"
+        # One encoding per state version, reused by every listener
+        assert next(first.response) is next(second.response)
+        first.close()
+        second.close()
+
+    def test_page_assembled_and_gzipped(self, client):
+        import gzip
+
+        plain = client.get("/").data
+        assert plain.startswith(b"\n<!DOCTYPE html>") and plain.endswith(b"</html>\n")
+        resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(resp.data) == plain
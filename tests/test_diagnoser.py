@@ -1,5 +1,7 @@
 """Tests for DiagnoserAgent — RCA, evidence collection, hypothesis ranking."""
 
+import asyncio
+
 import pytest
 from agentops.agents.diagnoser import DiagnoserAgent, DIAGNOSTIC_RULES
 
@@ -111,3 +113,96 @@ class TestDiagnoserAgent:
         })
         assert result is not None
         assert "report_id" in result
+
+
+class TestCompiledRules:
+    def test_compiled_rules_cover_all_types(self):
+        from agentops.agents.diagnoser import _RULES_COMPILED
+        assert set(_RULES_COMPILED) == set(DIAGNOSTIC_RULES)
+        for itype, rule in _RULES_COMPILED.items():
+            assert len(rule["confidences"]) == len(DIAGNOSTIC_RULES[itype]["common_causes"])
+            assert rule["confidences"][0] == 0.95
+
+
+class TestClassification:
+    @pytest.mark.parametrize("alerts,metrics,expected", [
+        ([{"metric": "link_state"}], {}, "link_down"),
+        ([], {"bgp_prefixes": 40.0}, "bgp_flap"),
+        ([], {"cpu_percent": 95.0, "disk_percent": 95.0}, "cpu_spike"),
+        ([{"metric": "disk_percent"}], {"memory_percent": 90.0}, "memory_leak"),
+        ([], {"disk_percent": 91.0}, "disk_full"),
+        ([], {"cpu_percent": 20.0}, "unknown"),
+    ])
+    def test_classify_priority(self, alerts, metrics, expected):
+        agent = DiagnoserAgent()
+        assert agent._classify_incident(alerts, metrics) == expected
+
+
+class TestTopologyContextCache:
+    def test_context_is_memoized_until_topology_changes(self):
+        agent = DiagnoserAgent()
+        agent.set_topology({"dev-1": ["dev-2"], "dev-2": ["dev-1", "dev-3"]})
+        first = agent._get_topology_context("dev-1")
+        assert first["second_hop_neighbors"] == ["dev-3"]
+        assert "dev-1" in agent._topo_cache
+
+        agent.set_topology({"dev-1": ["dev-2", "dev-4"]})
+        second = agent._get_topology_context("dev-1")
+        assert second["neighbor_count"] == 2
+        assert second["second_hop_neighbors"] == []
+
+
+class TestEvidenceIds:
+    def test_ids_are_sequential_and_unique(self):
+        agent = DiagnoserAgent()
+        report = agent.diagnose_incident(
+            "INC-1", "dev-1", [{"metric": "cpu_percent", "message": "hot"}], {"cpu_percent": 97.0}
+        )
+        ids = [e.evidence_id for e in report.evidence_collected]
+        assert len(set(ids)) == len(ids)
+        assert all(i.startswith(f"EV-{agent.agent_id[:4]}-") for i in ids)
+        assert report.all_hypotheses[0].hypothesis_id.endswith("-000001")
+
+    def test_hypothesis_evidence_resolves_through_report(self):
+        agent = DiagnoserAgent()
+        report = agent.diagnose_incident(
+            "INC-1", "dev-1",
+            [{"metric": "disk_percent", "message": "full"}],
+            {"disk_percent": 95.0},
+        )
+        primary = report.primary_hypothesis
+        resolved = report.evidence_for(primary)
+        assert [e.evidence_id for e in resolved] == primary.evidence_ids
+        assert len(resolved) == 3
+        assert report.get_evidence(primary.evidence_ids[0]) is resolved[0]
+
+
+class TestAsyncDiagnosis:
+    def test_async_matches_sync_evidence_shape(self):
+        agent = DiagnoserAgent()
+        agent.set_topology({"dev-1": ["dev-2", "dev-3", "dev-4", "dev-5"]})
+        alerts = [{"metric": "link_state", "message": "Link down"}]
+        metrics = {"link_state": 0.0}
+
+        sync_report = agent.diagnose_incident("INC-1", "dev-1", alerts, metrics)
+        async_report = asyncio.run(
+            agent.diagnose_incident_async("INC-2", "dev-1", alerts, metrics)
+        )
+
+        def shape(report):
+            return [(e.source, e.category) for e in report.evidence_collected]
+
+        assert shape(async_report) == shape(sync_report)
+        assert [e.source for e in async_report.evidence_collected if e.category == "topology"] == [
+            "dev-2", "dev-3", "dev-4",
+        ]
+        assert async_report.primary_hypothesis.category == "hardware"
+
+    def test_local_evidence_shares_one_timestamp(self):
+        agent = DiagnoserAgent()
+        report = agent.diagnose_incident(
+            "INC-1", "dev-1", [{"metric": "cpu_percent", "message": "hot"}],
+            {"cpu_percent": 97.0, "response_time_ms": 1500.0},
+        )
+        assert len({e.timestamp for e in report.evidence_collected}) == 1
+        assert report.duration_seconds >= 0
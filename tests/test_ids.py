@@ -0,0 +1,39 @@
+"""Tests for batched ID generation."""
+
+import os
+import uuid
+
+import pytest
+
+from agentops.ids import IDPool, new_uuid, short_hex
+
+
+class TestIDPool:
+    def test_short_hex_length(self):
+        assert len(short_hex(6)) == 6
+        assert len(short_hex(7)) == 7
+        int(short_hex(8), 16)
+
+    def test_uuid_is_version_4(self):
+        assert uuid.UUID(new_uuid()).version == 4
+
+    def test_refills_across_batches(self):
+        pool = IDPool(batch_size=1)
+        ids = {pool.uuid4() for _ in range(50)}
+        assert len(ids) == 50
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_forked_child_does_not_repeat_parent_ids(self):
+        pool = IDPool()
+        pool.uuid4()  # fill the buffer before forking
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, pool.uuid4().encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_id = pipe.read()
+        os.waitpid(pid, 0)
+        assert child_id != pool.uuid4()
@@ -72,7 +72,7 @@ class TestEndToEndPipeline:
         orch = Orchestrator(auto_approve=True)
         inc = orch.submit_incident("dev-1", "Link down", "link_down")
         inc = orch.process_incident(inc.incident_id)
-        events = [e["event"] for e in inc.timeline]
+        events = [e.event for e in inc.timeline]
         assert "incident_created" in events
         assert "detection_started" in events
         assert "diagnosis_started" in events
@@ -90,3 +90,22 @@ class TestEndToEndPipeline:
         # Now approve
         inc = orch.approve_incident(inc.incident_id, "test-operator")
         assert inc.status == IncidentStatus.RESOLVED
+
+
+class TestPackageImports:
+    def test_import_is_lazy(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, agentops; "
+            "assert 'agentops.orchestrator.engine' not in sys.modules; "
+            "agentops.Orchestrator; "
+            "assert 'agentops.orchestrator.engine' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_public_names_resolve(self):
+        import agentops
+        for name in agentops.__all__:
+            assert getattr(agentops, name).__name__ == name
@@ -1,7 +1,9 @@
 """Tests for infrastructure inventory — devices, topology, dependencies."""
 
 import pytest
-from agentops.inventory.registry import DeviceRegistry, Device, DeviceType, DeviceStatus
+from agentops.inventory.registry import (
+    DeviceRegistry, Device, DeviceType, DeviceStatus, MaintenanceWindow,
+)
 
 
 class TestDeviceRegistry:
@@ -25,6 +27,23 @@ class TestDeviceRegistry:
         assert "b" in reg.topology["a"]
         assert "a" in reg.topology["b"]
 
+    def test_remove_device_drops_its_connections(self):
+        reg = DeviceRegistry()
+        reg.setup_demo_inventory()
+        reg.remove_device("dist-sw-01")
+        assert "dist-sw-01" not in reg.topology
+        assert all("dist-sw-01" not in n for n in reg.topology.values())
+        assert list(reg.topology["core-rtr-01"]) == ["core-rtr-02", "fw-01"]
+
+    def test_remove_device_with_self_loop(self):
+        reg = DeviceRegistry()
+        reg.register_device(Device("a", "A", DeviceType.SWITCH))
+        reg.register_device(Device("b", "B", DeviceType.SWITCH))
+        reg.add_connection("a", "a")
+        reg.add_connection("a", "b")
+        reg.remove_device("a")
+        assert reg.topology == {"b": {}}
+
     def test_get_neighbors(self):
         reg = DeviceRegistry()
         reg.register_device(Device("a", "A", DeviceType.ROUTER))
@@ -49,6 +68,16 @@ class TestDeviceRegistry:
         assert "d2" in radius
         assert "d4" not in radius  # too far
 
+    def test_blast_radius_nearest_first_without_duplicates(self):
+        reg = DeviceRegistry()
+        reg.setup_demo_inventory()
+        radius = reg.get_blast_radius("core-rtr-01", depth=2)
+        assert len(radius) == len(set(radius))
+        assert "core-rtr-01" not in radius
+        assert set(radius[:3]) == {"core-rtr-02", "dist-sw-01", "fw-01"}
+        assert set(radius[3:]) == {"dist-sw-02", "web-srv-01", "web-srv-02", "lb-01"}
+        assert reg.get_blast_radius("core-rtr-01", depth=0) == []
+
     def test_service_dependencies(self):
         reg = DeviceRegistry()
         reg.add_service_dependency("app", "database", "hard")
@@ -58,6 +87,16 @@ class TestDeviceRegistry:
         dependents = reg.get_dependent_services("app")
         assert "web" in dependents
 
+    def test_dependency_lookups_keep_insertion_order(self):
+        reg = DeviceRegistry()
+        reg.setup_demo_inventory()
+        assert reg.get_service_dependencies("app") == ["postgresql", "routing"]
+        assert reg.get_dependent_services("nginx") == ["haproxy"]
+        assert reg.get_service_dependencies("unknown") == []
+        # Callers get a copy, not the index itself
+        reg.get_service_dependencies("app").append("x")
+        assert reg.get_service_dependencies("app") == ["postgresql", "routing"]
+
     def test_demo_inventory(self):
         reg = DeviceRegistry()
         reg.setup_demo_inventory()
@@ -74,3 +113,36 @@ class TestDeviceRegistry:
         assert summary["total_devices"] == 2
         assert "server" in summary["by_type"]
         assert "router" in summary["by_type"]
+
+    def test_summary_counts_follow_changes(self):
+        reg = DeviceRegistry()
+        reg.register_device(Device("s1", "S1", DeviceType.SERVER))
+        reg.register_device(Device("s2", "S2", DeviceType.SERVER))
+        reg.register_device(Device("s2", "S2", DeviceType.DATABASE))  # replaced
+        reg.set_device_status("s1", DeviceStatus.MAINTENANCE)
+        summary = reg.get_inventory_summary()
+        assert summary["by_type"] == {"server": 1, "database": 1}
+        assert summary["by_status"] == {"maintenance": 1, "active": 1}
+        reg.remove_device("s1")
+        assert reg.get_inventory_summary()["by_status"] == {"active": 1}
+
+    def test_maintenance_windows_per_device(self):
+        reg = DeviceRegistry()
+        reg.add_maintenance_window(MaintenanceWindow("mw-2", ["a"], 300.0, 400.0))
+        reg.add_maintenance_window(MaintenanceWindow("mw-1", ["a", "b"], 100.0, 200.0))
+        assert reg.is_in_maintenance("a", now=150.0)
+        assert reg.is_in_maintenance("b", now=200.0)
+        assert not reg.is_in_maintenance("a", now=250.0)
+        assert reg.is_in_maintenance("a", now=350.0)
+        assert not reg.is_in_maintenance("b", now=350.0)
+        assert not reg.is_in_maintenance("c", now=150.0)
+        assert reg.get_inventory_summary()["maintenance_windows"] == 2
+
+    def test_windows_appended_directly_are_honored(self):
+        reg = DeviceRegistry()
+        reg.add_maintenance_window(MaintenanceWindow("mw-1", ["a"], 100.0, 200.0))
+        reg.maintenance_windows.append(MaintenanceWindow("mw-2", ["a", "b"], 300.0, 400.0))
+        assert reg.is_in_maintenance("a", now=350.0)
+        assert reg.is_in_maintenance("b", now=350.0)
+        del reg.maintenance_windows[0]
+        assert not reg.is_in_maintenance("a", now=150.0)
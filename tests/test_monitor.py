@@ -1,7 +1,9 @@
 """Tests for MonitorAgent — metrics, thresholds, anomaly detection."""
 
 import pytest
-from agentops.agents.monitor import MonitorAgent, ThresholdRule, Severity
+from agentops.agents.monitor import (
+    Alert, MetricSample, MetricSeries, MonitorAgent, Severity, ThresholdRule, WelfordState,
+)
 
 
 class TestThresholdRule:
@@ -25,6 +27,93 @@ class TestThresholdRule:
         rule = ThresholdRule("bgp", 100.0, 50.0, "lt")
         assert rule.evaluate(75.0) == Severity.HIGH
 
+    def test_boundary_is_not_a_violation(self):
+        rule = ThresholdRule("cpu", 80.0, 95.0, "gt")
+        assert rule.evaluate(80.0) is None
+        assert rule.evaluate(95.0) == Severity.HIGH
+        low = ThresholdRule("bgp", 100.0, 50.0, "lt")
+        assert low.evaluate(100.0) is None
+        assert low.evaluate(50.0) == Severity.HIGH
+
+    def test_unsupported_comparison_never_fires(self):
+        rule = ThresholdRule("cpu", 80.0, 95.0, "eq")
+        assert rule.evaluate(95.0) is None
+
+
+class TestSlots:
+    @pytest.mark.parametrize("obj", [
+        ThresholdRule("cpu", 80.0, 95.0),
+        MetricSample("dev-1", "cpu", 1.0),
+        Alert("ALT-1", "dev-1", "cpu", Severity.HIGH, 90.0, 80.0),
+    ])
+    def test_no_instance_dict(self, obj):
+        assert not hasattr(obj, "__dict__")
+
+
+class TestWelfordState:
+    def test_update_and_remove(self):
+        state = WelfordState()
+        for v in [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]:
+            state.update(v)
+        assert state.mean == pytest.approx(5.0)
+        assert state.std == pytest.approx(2.0)
+        state.remove(9.0)
+        assert state.count == 7
+        assert state.mean == pytest.approx(31.0 / 7)
+
+    def test_stable_for_large_offsets(self):
+        state = WelfordState()
+        for v in [1e9 + 1, 1e9 + 2, 1e9 + 3]:
+            state.update(v)
+        assert state.std == pytest.approx((2.0 / 3) ** 0.5)
+
+
+class TestMetricSeries:
+    def test_ring_buffer_keeps_most_recent(self):
+        series = MetricSeries(capacity=5, window=3)
+        for v in range(8):
+            series.append(float(v))
+        assert len(series) == 5
+        assert series.values() == [3.0, 4.0, 5.0, 6.0, 7.0]
+        assert series.values(2) == [6.0, 7.0]
+        assert series.last() == 7.0
+
+    def test_append_never_reallocates(self):
+        series = MetricSeries(capacity=4)
+        buffer = series._values
+        for v in range(20):
+            series.append(float(v))
+        assert series._values is buffer
+        assert len(buffer) == 4
+
+    def test_timestamps_parallel_to_values(self):
+        series = MetricSeries(capacity=3)
+        for i in range(5):
+            series.append(float(i), 100.0 + i)
+        assert series.values() == [2.0, 3.0, 4.0]
+        assert series.timestamps() == [102.0, 103.0, 104.0]
+        assert series.timestamps(1) == [104.0]
+
+    def test_window_stats_match_direct_computation(self):
+        series = MetricSeries(capacity=10, window=4)
+        values = [1.0, 5.0, 2.0, 8.0, 3.0, 9.0, 4.0]
+        for v in values:
+            series.append(v)
+        window = values[-4:]
+        mean = sum(window) / 4
+        std = (sum((v - mean) ** 2 for v in window) / 4) ** 0.5
+        n, got_mean, got_std = series.window_stats()
+        assert n == 4
+        assert got_mean == pytest.approx(mean)
+        assert got_std == pytest.approx(std)
+
+    def test_history_bounded_per_metric(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "healthy")
+        for _ in range(1005):
+            agent.collect_metrics("dev-1")
+        assert len(agent.metric_history["dev-1:cpu_percent"]) == 1000
+
 
 class TestMonitorAgent:
     def test_creation(self):
@@ -58,6 +147,36 @@ class TestMonitorAgent:
         names = [s.metric_name for s in samples]
         assert "cpu_percent" in names
 
+    def test_jitter_stays_near_base_and_skips_link_state(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "healthy")
+        for _ in range(50):
+            metrics = {s.metric_name: s.value for s in agent.collect_metrics("dev-1")}
+            assert metrics["link_state"] == 1.0
+            assert 0.0 <= metrics["cpu_percent"] < 25.0 * 1.2
+
+    def test_seeded_jitter_is_reproducible(self):
+        runs = []
+        for _ in range(2):
+            agent = MonitorAgent(seed=42)
+            agent.setup_mock_device("dev-1", "healthy")
+            runs.append([s.value for s in agent.collect_metrics("dev-1")])
+        assert runs[0] == runs[1]
+
+    def test_samples_share_collection_timestamp(self):
+        agent = MonitorAgent()
+        samples = agent.collect_metrics("dev-1")
+        assert len({s.timestamp for s in samples}) == 1
+        report = agent.check_device("dev-1")
+        assert report["timestamp"] == agent.metric_history["dev-1:cpu_percent"].timestamps(1)[0]
+
+    def test_reports_round_but_history_keeps_precision(self):
+        agent = MonitorAgent(seed=7)
+        report = agent.check_device("dev-1")
+        raw = agent.metric_history["dev-1:cpu_percent"].last()
+        assert report["metrics"]["cpu_percent"] == round(raw, 3)
+        assert raw != round(raw, 3)
+
     def test_evaluate_alerts(self):
         agent = MonitorAgent()
         agent.setup_mock_device("dev-1", "cpu_spike")
@@ -84,6 +203,29 @@ class TestMonitorAgent:
         assert "alerts" in report
         assert not report["healthy"]
 
+    def test_check_device_reports_anomaly(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "healthy")
+        for _ in range(30):
+            agent.collect_metrics("dev-1")
+        agent._mock_columns["dev-1"] = (("cpu_percent",), (70.0,), (0.0,))
+        report = agent.check_device("dev-1")
+        assert [a["metric_name"] for a in report["anomalies"]] == ["cpu_percent"]
+        assert report["anomalies"][0]["direction"] == "high"
+        assert report["anomalies"] == [agent.detect_anomaly("dev-1", "cpu_percent")]
+        assert not report["healthy"]
+
+    def test_check_fleet(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-2", "link_down")
+        reports = agent.check_fleet(["dev-1", "dev-2", "dev-3", "dev-1"], max_workers=4)
+        assert list(reports) == ["dev-1", "dev-2", "dev-3"]
+        assert any(a["metric"] == "link_state" for a in reports["dev-2"]["alerts"])
+        ids = [a["alert_id"] for r in reports.values() for a in r["alerts"]]
+        assert ids == sorted(ids)
+        assert {a.alert_id for a in agent.get_active_alerts()} == set(ids)
+        assert len(agent.metric_history["dev-3:cpu_percent"]) == 1
+
     def test_acknowledge_alert(self):
         agent = MonitorAgent()
         agent.setup_mock_device("dev-1", "cpu_spike")
@@ -94,6 +236,132 @@ class TestMonitorAgent:
             active = agent.get_active_alerts()
             assert alerts[0].alert_id not in [a.alert_id for a in active]
 
+    def test_rules_indexed_by_metric(self):
+        agent = MonitorAgent()
+        assert [r.metric_name for r in agent._rules_by_metric["cpu_percent"]] == ["cpu_percent"]
+        agent.receive_message({
+            "type": "add_rule",
+            "rule": {
+                "metric_name": "cpu_percent",
+                "warning_threshold": 10.0,
+                "critical_threshold": 20.0,
+            },
+        })
+        assert len(agent._rules_by_metric["cpu_percent"]) == 2
+        agent.setup_mock_device("dev-1", "healthy")
+        alerts = agent.evaluate_metrics(agent.collect_metrics("dev-1"))
+        assert [a.metric_name for a in alerts] == ["cpu_percent"]
+
+    def test_evaluate_metrics_batch(self):
+        agent = MonitorAgent()
+        alerts = agent.evaluate_metrics_batch(
+            ["dev-1", "dev-2", "dev-3"],
+            {"cpu_percent": [25.0, 85.0, 97.0], "link_state": [1.0, 0.0, 1.0]},
+        )
+        found = {(a.device_id, a.metric_name): a.severity for a in alerts}
+        assert found == {
+            ("dev-2", "cpu_percent"): Severity.HIGH,
+            ("dev-3", "cpu_percent"): Severity.CRITICAL,
+            ("dev-2", "link_state"): Severity.CRITICAL,
+        }
+
+    def test_evaluate_metrics_batch_matches_scalar(self):
+        agent = MonitorAgent()
+        devices = ["a", "b", "c", "d"]
+        values = [10.0, 80.0, 80.5, 96.0]
+        batch = agent.evaluate_metrics_batch(devices, {"memory_percent": values})
+        rule = agent._rules_by_metric["memory_percent"][0]
+        expected = [
+            (d, rule.evaluate(v))
+            for d, v in zip(devices, values, strict=True)
+            if rule.evaluate(v)
+        ]
+        assert [(a.device_id, a.severity) for a in batch] == expected
+
+    def test_acknowledge_unknown_alert(self):
+        agent = MonitorAgent()
+        assert agent.acknowledge_alert("ALT-999999") is False
+
+    def test_alerts_indexed_by_id(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "cpu_spike")
+        alerts = agent.evaluate_metrics(agent.collect_metrics("dev-1"))
+        for alert in alerts:
+            assert agent._alerts_by_id[alert.alert_id] is alert
+
+    def test_active_alerts_by_severity(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "link_down")
+        alerts = agent.evaluate_metrics(agent.collect_metrics("dev-1"))
+        critical = [a for a in alerts if a.severity == Severity.CRITICAL]
+        assert critical
+        assert agent.get_active_alerts(Severity.CRITICAL) == critical
+        agent.acknowledge_alert(critical[0].alert_id)
+        assert agent.get_active_alerts(Severity.CRITICAL) == critical[1:]
+        assert critical[0] not in agent.get_active_alerts()
+        assert agent.get_active_alerts(Severity.LOW) == []
+
+    def test_alert_message_formatted_lazily(self):
+        agent = MonitorAgent()
+        agent.setup_mock_device("dev-1", "disk_full")
+        alert = agent.evaluate_metrics(agent.collect_metrics("dev-1"))[0]
+        assert alert.message is None
+        text = alert.render_message()
+        assert text.startswith("Disk utilization: disk_percent=")
+        assert text.endswith(f"exceeds threshold {alert.threshold_value}")
+        assert alert.message == text
+
+    def test_alert_retention_evicts_oldest(self):
+        agent = MonitorAgent(alert_retention=3)
+        agent.setup_mock_device("dev-1", "link_down")
+        raised = []
+        for _ in range(3):
+            raised.extend(agent.evaluate_metrics(agent.collect_metrics("dev-1")))
+        assert len(raised) > 3
+        kept = raised[-3:]
+        assert list(agent.alerts) == kept
+        assert set(agent._alerts_by_id) == {a.alert_id for a in kept}
+        assert agent.get_active_alerts() == kept
+        assert agent.acknowledge_alert(raised[0].alert_id) is False
+
+    def test_quiet_bounds_from_rules(self):
+        agent = MonitorAgent()
+        assert agent._quiet_bounds["cpu_percent"] == (float("-inf"), 80.0)
+        assert agent._quiet_bounds["bgp_prefixes"] == (100.0, float("inf"))
+        agent.add_rule(ThresholdRule("cpu_percent", 10.0, 5.0, "lt"))
+        assert agent._quiet_bounds["cpu_percent"] == (10.0, 80.0)
+
+    @pytest.mark.parametrize("value", [0.0, 5.0, 9.99, 10.0, 50.0, 80.0, 80.01, 96.0])
+    def test_quiet_bounds_agree_with_rules(self, value):
+        agent = MonitorAgent()
+        agent.add_rule(ThresholdRule("cpu_percent", 10.0, 5.0, "lt"))
+        sample = MetricSample("dev-1", "cpu_percent", value)
+        expected = [
+            r.evaluate(value) for r in agent._rules_by_metric["cpu_percent"] if r.evaluate(value)
+        ]
+        assert [a.severity for a in agent.evaluate_metrics([sample])] == expected
+
+    def test_rule_rows_skip_unsupported_comparisons(self):
+        agent = MonitorAgent()
+        agent.add_rule(ThresholdRule("cpu_percent", 1.0, 2.0, "eq"))
+        assert len(agent._rules_by_metric["cpu_percent"]) == 2
+        assert [row[3].comparison for row in agent._rule_rows["cpu_percent"]] == ["gt"]
+        assert agent._rule_rows["bgp_prefixes"][0][:3] == (-1.0, -100.0, -50.0)
+
+    def test_evaluate_metric_matrix(self):
+        agent = MonitorAgent()
+        alerts = agent.evaluate_metric_matrix(
+            ["a", "b"],
+            ["cpu_percent", "bgp_prefixes"],
+            [[50.0, 40.0], [99.0, 900.0]],
+        )
+        assert [(a.device_id, a.metric_name, a.severity) for a in alerts] == [
+            ("b", "cpu_percent", Severity.CRITICAL),
+            ("a", "bgp_prefixes", Severity.CRITICAL),
+        ]
+        with pytest.raises(ValueError):
+            agent.evaluate_metric_matrix(["a"], ["cpu_percent", "bgp_prefixes"], [[1.0]])
+
     def test_message_handler_collect(self):
         agent = MonitorAgent()
         agent.setup_mock_device("dev-1", "healthy")
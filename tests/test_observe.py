@@ -12,6 +12,14 @@ class TestTracer:
         assert span.parent_span_id is None
         assert span.operation_name == "incident_pipeline"
 
+    def test_id_widths(self):
+        tracer = Tracer()
+        root = tracer.start_trace("op")
+        child = tracer.start_span("child", root)
+        assert len(root.trace_id) == 32 and len(root.span_id) == len(child.span_id) == 16
+        assert root.span_id != child.span_id
+        int(root.trace_id + child.span_id, 16)  # hex only
+
     def test_child_span(self):
         tracer = Tracer()
         root = tracer.start_trace("parent")
@@ -61,6 +69,16 @@ class TestTracer:
         trace = tracer.get_trace(root.trace_id)
         assert len(trace) == 3
 
+    def test_traces_kept_apart(self):
+        tracer = Tracer()
+        first = tracer.start_trace("a")
+        second = tracer.start_trace("b")
+        tracer.start_span("a.child", first)
+        ops = [s["operation_name"] for s in tracer.get_trace(first.trace_id)]
+        assert ops == ["a", "a.child"]
+        assert len(tracer.get_trace(second.trace_id)) == 1
+        assert tracer.get_trace("missing") == []
+
     def test_audit_trail(self):
         tracer = Tracer()
         tracer.record_decision("a1", "Agent1", "diag", {}, {}, "test", 0.9)
@@ -78,9 +96,78 @@ class TestTracer:
         assert summary["total_spans"] == 1
         assert summary["completed_spans"] == 1
 
+    def test_performance_summary_running_totals(self):
+        import time
+
+        tracer = Tracer()
+        for seconds in (0.010, 0.030):
+            span = tracer.start_trace("op")
+            span.start_time = time.time() - seconds
+            tracer.finish_span(span)
+        tracer.finish_span(span)  # finishing again must not recount
+        summary = tracer.get_performance_summary()
+        assert summary["completed_spans"] == 2
+        assert summary["active_spans"] == 0
+        assert summary["avg_span_duration_ms"] == pytest.approx(20, abs=5)
+        assert summary["max_span_duration_ms"] == pytest.approx(30, abs=5)
+
+    def test_span_finish_counts_in_summary(self):
+        import time
+
+        tracer = Tracer()
+        span = tracer.start_trace("op")
+        span.start_time = time.time() - 0.010
+        span.finish()  # directly, not through Tracer.finish_span
+        summary = tracer.get_performance_summary()
+        assert summary["completed_spans"] == 1
+        assert summary["active_spans"] == 0
+        assert summary["avg_span_duration_ms"] == pytest.approx(10, abs=5)
+        assert summary["max_span_duration_ms"] == pytest.approx(10, abs=5)
+
     def test_otel_export(self):
         tracer = Tracer()
         tracer.start_trace("test")
         exported = tracer.export_otel_format()
         assert len(exported) == 1
         assert "trace_id" in exported[0]
+
+    def test_concurrent_traces(self):
+        import threading
+
+        tracer = Tracer()
+
+        def work():
+            for _ in range(100):
+                root = tracer.start_trace("op")
+                tracer.finish_span(tracer.start_span("child", root))
+                tracer.finish_span(root)
+                tracer.record_decision("a1", "Agent1", "diag", {}, {}, "r")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        summary = tracer.get_performance_summary()
+        assert summary["total_spans"] == summary["completed_spans"] == 800
+        assert summary["active_spans"] == 0
+        assert len(tracer.get_audit_trail("a1")) == 400
+        assert sum(len(tracer.get_trace(t)) for t in tracer._spans_by_trace) == 800
+
+    def test_records_have_no_instance_dict(self):
+        tracer = Tracer()
+        span = tracer.start_trace("op")
+        record = tracer.record_decision("a1", "Agent1", "diag", {}, {}, "r")
+        assert not hasattr(span, "__dict__") and not hasattr(record, "__dict__")
+
+    def test_export_columns_align_with_rows(self):
+        tracer = Tracer()
+        root = tracer.start_trace("op")
+        tracer.finish_span(tracer.start_span("child", root), status="error")
+        rows = tracer.export_otel_format()
+        cols = tracer.export_columns()
+        for name, values in cols.items():
+            assert values == [r[name] for r in rows]
+        durations = tracer.export_columns(["duration_ms"])["duration_ms"]
+        assert durations == [r["duration_ms"] for r in rows]
+        assert durations[0] is None
@@ -1,7 +1,9 @@
 """Tests for Orchestrator — incident pipeline, DAG execution."""
 
 import pytest
-from agentops.orchestrator.engine import Orchestrator, IncidentStatus
+from agentops.orchestrator.engine import (
+    DAGNode, Orchestrator, IncidentStatus, TimelineEvent, dag_layers,
+)
 
 
 class TestOrchestrator:
@@ -72,6 +74,22 @@ class TestOrchestrator:
         assert "incident_created" in events
         assert "resolved" in events
 
+    def test_timeline_timestamps_are_wall_clock_and_ordered(self):
+        import time
+
+        before = time.time()
+        orch = Orchestrator(auto_approve=True)
+        incident = orch.submit_incident("web-srv-01", "CPU spike", "cpu_spike")
+        orch.process_incident(incident.incident_id)
+        stamps = [e["timestamp"] for e in orch.get_incident_timeline(incident.incident_id)]
+        assert stamps == sorted(stamps)
+        assert before - 1 <= stamps[0] <= stamps[-1] <= time.time() + 1
+        # Stored compactly, expanded only on export
+        first = incident.timeline[0]
+        assert isinstance(first, TimelineEvent) and first.event == "incident_created"
+        exported = orch.get_incident_timeline(incident.incident_id)[0]
+        assert list(exported) == ["timestamp", "event", "status", "details"]
+
     def test_unknown_incident(self):
         orch = Orchestrator()
         with pytest.raises(KeyError):
@@ -83,3 +101,128 @@ class TestOrchestrator:
         orch.submit_incident("d2", "test", "disk_full")
         status = orch.get_status()
         assert status["incidents"]["total"] == 2
+
+
+class TestAuditLog:
+    def test_combined_log_newest_first_and_bounded(self):
+        orch = Orchestrator(auto_approve=True)
+        for _ in range(12):
+            incident = orch.submit_incident("web-srv-01", "CPU spike", "cpu_spike")
+            orch.process_incident(incident.incident_id)
+        audit = orch.get_audit_log()
+        assert len(audit) == len(orch.audit_log) == orch.audit_log.maxlen
+        timestamps = [e["timestamp"] for e in audit]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert {e["agent_name"] for e in audit} >= {"RemediatorAgent", "VerifierAgent"}
+        # Batched entries (plan execution) reach the combined log too
+        assert any(e["action"] == "batch_completed" for e in audit)
+
+    def test_late_batch_flush_merged_by_timestamp(self):
+        orch = Orchestrator()
+        with orch.remediator.log_batch() as batch:
+            batch.add("early")
+            orch.monitor._log_action("late")
+        actions = [e["action"] for e in orch.get_audit_log()[:2]]
+        assert actions == ["late", "early"]
+
+
+class TestChangeNotification:
+    def test_wait_for_change_wakes_on_incident(self):
+        import threading
+
+        orch = Orchestrator()
+        version = orch.state_version
+        threading.Timer(0.05, orch.submit_incident, ("d1", "test", "cpu_spike")).start()
+        assert orch.wait_for_change(version, timeout=5) > version
+
+    def test_wait_for_change_times_out(self):
+        orch = Orchestrator()
+        assert orch.wait_for_change(orch.state_version, timeout=0.01) == orch.state_version
+
+
+class TestConcurrentAccess:
+    def test_reads_during_submissions(self):
+        import threading
+
+        orch = Orchestrator(auto_approve=True)
+        errors = []
+
+        def submit():
+            for i in range(200):
+                orch.submit_incident(f"d{i}", "test", "cpu_spike")
+
+        def read():
+            try:
+                for _ in range(200):
+                    orch.get_status()
+                    orch.recent_incidents(5)
+                    orch.pending_approvals()
+            except RuntimeError as e:  # dict changed size during iteration
+                errors.append(e)
+
+        threads = [threading.Thread(target=submit), threading.Thread(target=read)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert len(orch.snapshot_incidents()) == 200
+        recent = orch.recent_incidents(3)
+        assert recent == orch.snapshot_incidents()[-3:]
+
+
+class TestDAGExecution:
+    def test_layers_follow_dependencies(self):
+        nodes = [
+            DAGNode("a", "t", "c"),
+            DAGNode("c", "t", "c", dependencies=["a"]),
+            DAGNode("b", "t", "c", dependencies=["a"]),
+            DAGNode("d", "t", "c", dependencies=["b", "c"]),
+        ]
+        layers = [[n.node_id for n in layer] for layer in dag_layers(nodes)]
+        assert layers == [["a"], ["c", "b"], ["d"]]
+        nodes[0].dependencies.append("d")
+        with pytest.raises(ValueError, match="cycle"):
+            dag_layers(nodes)
+
+    def test_incidents_get_independent_dags(self):
+        orch = Orchestrator()
+        first = orch.submit_incident("d1", "test", "cpu_spike")
+        second = orch.submit_incident("d2", "test", "disk_full")
+        first.dag_nodes[1].dependencies.append("extra")
+        first.dag_nodes[1].params["k"] = "v"
+        assert second.dag_nodes[1].dependencies == ["detect"]
+        assert second.dag_nodes[1].params == {}
+        assert second.dag_nodes[0].params == {"device_id": "d2", "scenario": "disk_full"}
+
+    def test_nodes_record_progress_and_halt_at_approval(self):
+        orch = Orchestrator()
+        incident = orch.submit_incident("web-srv-01", "CPU spike", "cpu_spike")
+        orch.process_incident(incident.incident_id)
+        status = {n.node_id: n.status for n in incident.dag_nodes}
+        assert status == {
+            "detect": "completed", "diagnose": "completed", "plan": "completed",
+            "approve": "pending", "execute": "pending", "verify": "pending",
+        }
+        assert incident.dag_nodes[2].result is incident.remediation_plan
+
+        orch.approve_incident(incident.incident_id)
+        assert all(n.status == "completed" for n in incident.dag_nodes)
+        assert incident.dag_nodes[-1].result is incident.verification_report
+
+    def test_independent_nodes_run_concurrently(self):
+        import threading
+
+        orch = Orchestrator()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def probe(incident, results):
+            barrier.wait()  # only passes if both nodes are running at once
+            return threading.current_thread().name
+
+        orch._stage_handlers["probe"] = probe
+        incident = orch.submit_incident("d1", "test")
+        incident.dag_nodes = [DAGNode("p1", "probe", "x"), DAGNode("p2", "probe", "x")]
+        orch.process_incident(incident.incident_id)
+        assert [n.status for n in incident.dag_nodes] == ["completed", "completed"]
+        assert incident.dag_nodes[0].result != incident.dag_nodes[1].result
@@ -1,7 +1,19 @@
 """Tests for RemediatorAgent — plan generation, approval, execution, rollback."""
 
+import asyncio
+import threading
+
 import pytest
-from agentops.agents.remediator import RemediatorAgent, RemediationStatus, RiskLevel
+from agentops.agents.remediator import (
+    _COMPILED_TEMPLATES,
+    REMEDIATION_TEMPLATES,
+    RemediationStatus,
+    RemediationStep,
+    RemediatorAgent,
+    RiskLevel,
+    _escalation_template,
+    rollback_waves,
+)
 
 
 class TestRemediatorAgent:
@@ -91,7 +103,324 @@ class TestRemediatorAgent:
         assert "steps" in summary
         assert "blast_radius" in summary
 
+    def test_bulk_summaries_match_single(self):
+        agent = RemediatorAgent()
+        for i in range(3):
+            agent.generate_plan(f"INC-{i}", f"DIAG-{i}", "cpu_spike", "web-srv-01")
+        pending = agent.get_pending_approvals()
+        assert agent.get_plan_summaries(pending) == [
+            agent.get_plan_summary(p.plan_id) for p in pending
+        ]
+
     def test_unknown_plan(self):
         agent = RemediatorAgent()
         with pytest.raises(KeyError):
             agent.approve_plan("nonexistent")
+
+
+class TestAsyncApproval:
+    def test_await_resolved_by_approve(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-20", "DIAG-20", "cpu_spike", "web-srv-01")
+
+        async def scenario():
+            waiter = asyncio.create_task(agent.await_approval(plan.plan_id))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            agent.approve_plan(plan.plan_id, "alice")
+            return await waiter
+
+        decision = asyncio.run(scenario())
+        assert decision.approved is True
+        assert decision.decided_by == "alice"
+
+    def test_await_after_decision_returns_immediately(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-21", "DIAG-21", "cpu_spike", "web-srv-01")
+        agent.reject_plan(plan.plan_id, "Too risky")
+        decision = asyncio.run(agent.await_approval(plan.plan_id))
+        assert decision.approved is False
+        assert decision.reason == "Too risky"
+
+    def test_await_timeout_leaves_plan_pending(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-22", "DIAG-22", "cpu_spike", "web-srv-01")
+        with pytest.raises(TimeoutError):
+            asyncio.run(agent.await_approval(plan.plan_id, timeout=0.01))
+        assert plan.status == RemediationStatus.AWAITING_APPROVAL
+
+    def test_timeout_then_approve(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-24", "DIAG-24", "cpu_spike", "web-srv-01")
+        with pytest.raises(TimeoutError):
+            asyncio.run(agent.await_approval(plan.plan_id, timeout=0.01))
+        # The timed-out waiter's loop is closed; awaiting again on a new one works
+        with pytest.raises(TimeoutError):
+            asyncio.run(agent.await_approval(plan.plan_id, timeout=0.01))
+
+        agent.approve_plan(plan.plan_id, "carol")
+        assert plan.status == RemediationStatus.APPROVED
+        assert agent.get_action_log()[-1]["action"] == "plan_approved"
+        assert asyncio.run(agent.await_approval(plan.plan_id)).decided_by == "carol"
+
+    def test_decisions_are_bounded(self, monkeypatch):
+        monkeypatch.setattr("agentops.agents.remediator.MAX_DECISIONS", 2)
+        agent = RemediatorAgent()
+        plans = [
+            agent.generate_plan(f"INC-3{i}", f"DIAG-3{i}", "cpu_spike", "web-srv-01")
+            for i in range(3)
+        ]
+        for plan in plans:
+            agent.approve_plan(plan.plan_id, "dave")
+        assert list(agent._decisions) == [plans[1].plan_id, plans[2].plan_id]
+        # An evicted decision is rebuilt from the plan
+        assert asyncio.run(agent.await_approval(plans[0].plan_id)).decided_by == "dave"
+
+    def test_approve_from_another_thread(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-23", "DIAG-23", "cpu_spike", "web-srv-01")
+
+        async def scenario():
+            waiter = asyncio.create_task(agent.await_approval(plan.plan_id, timeout=5))
+            await asyncio.sleep(0)
+            thread = threading.Thread(target=agent.approve_plan, args=(plan.plan_id, "bob"))
+            thread.start()
+            decision = await waiter
+            thread.join()
+            return decision
+
+        assert asyncio.run(scenario()).decided_by == "bob"
+
+
+class _RecordingExecutor:
+    def __init__(self):
+        self.calls = []
+
+    def execute_batch(self, target, steps):
+        self.calls.append((target, [s.order for s in steps]))
+        return [f"ok {s.action}" for s in steps]
+
+
+class _FailingExecutor:
+    def __init__(self, results=None):
+        self.results = results
+
+    def execute_batch(self, target, steps):
+        if self.results is None:
+            raise ConnectionError(f"{target} unreachable")
+        return self.results
+
+
+class TestBatchExecution:
+    def test_steps_grouped_by_target(self):
+        executor = _RecordingExecutor()
+        agent = RemediatorAgent(executor=executor)
+        plan = agent.generate_plan("INC-30", "DIAG-30", "link_down", "core-rtr-01")
+        plan.steps[1].target = "core-rtr-02"
+        plan.steps[3].target = "core-rtr-02"
+        agent.approve_plan(plan.plan_id)
+        agent.execute_plan(plan.plan_id)
+        assert executor.calls == [("core-rtr-01", [1, 3]), ("core-rtr-02", [2, 4])]
+        assert all(s.executed and s.result.startswith("ok ") for s in plan.steps)
+
+    def test_one_log_entry_per_batch(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-31", "DIAG-31", "disk_full", "db-srv-01")
+        agent.approve_plan(plan.plan_id)
+        agent.execute_plan(plan.plan_id)
+        actions = [e["action"] for e in agent.get_action_log()]
+        assert actions.count("batch_executing") == 1
+        assert "SUCCESS" in plan.steps[0].result
+
+    def test_duration_ignores_wall_clock_steps(self, monkeypatch):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-32", "DIAG-32", "disk_full", "db-srv-01")
+        agent.approve_plan(plan.plan_id)
+        # Wall clock stepping backwards mid-execution (e.g. an NTP correction)
+        clock = iter(range(1_000_000, 0, -1000))
+        monkeypatch.setattr("agentops.agents.remediator.time.time", lambda: float(next(clock)))
+        agent.execute_plan(plan.plan_id)
+        monkeypatch.undo()
+        entry = next(e for e in agent.get_action_log() if e["action"] == "plan_executed")
+        assert entry["details"]["duration"] >= 0
+
+    def test_executor_error_fails_plan(self):
+        agent = RemediatorAgent(executor=_FailingExecutor())
+        plan = agent.generate_plan("INC-33", "DIAG-33", "disk_full", "db-srv-01")
+        agent.approve_plan(plan.plan_id)
+        with pytest.raises(ConnectionError):
+            agent.execute_plan(plan.plan_id)
+        assert plan.status == RemediationStatus.FAILED
+        status = agent.get_status()
+        assert status["active_tasks"] == 0
+        assert status["failed_tasks"] == 1
+        entry = agent.get_action_log()[-1]
+        assert entry["action"] == "plan_failed"
+        assert "db-srv-01 unreachable" in entry["details"]["error"]
+
+    def test_wrong_result_count_fails_plan(self):
+        agent = RemediatorAgent(executor=_FailingExecutor(results=["only one"]))
+        plan = agent.generate_plan("INC-34", "DIAG-34", "disk_full", "db-srv-01")
+        agent.approve_plan(plan.plan_id)
+        with pytest.raises(ValueError):
+            agent.execute_plan(plan.plan_id)
+        assert plan.status == RemediationStatus.FAILED
+        assert agent.get_status()["failed_tasks"] == 1
+
+
+class _SlowAsyncExecutor:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute_batch_async(self, target, steps):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [f"{target}:{s.action}" for s in steps]
+
+    def execute_batch(self, target, steps):  # pragma: no cover - async path used
+        raise AssertionError("sync path should not be used")
+
+
+class TestAsyncExecution:
+    def _multi_target_plan(self, agent):
+        plan = agent.generate_plan("INC-40", "DIAG-40", "link_down", "rtr-a")
+        for step, target in zip(plan.steps, ["rtr-a", "rtr-b", "rtr-c", "rtr-a"], strict=True):
+            step.target = target
+        agent.approve_plan(plan.plan_id)
+        return plan
+
+    def test_groups_run_concurrently(self):
+        executor = _SlowAsyncExecutor()
+        agent = RemediatorAgent(executor=executor)
+        plan = self._multi_target_plan(agent)
+        result = asyncio.run(agent.execute_plan_async(plan.plan_id))
+        assert result.status == RemediationStatus.COMPLETED
+        assert executor.peak == 3
+        assert plan.steps[3].result == "rtr-a:verify_connectivity"
+
+    def test_concurrency_capped_by_blast_radius(self):
+        executor = _SlowAsyncExecutor()
+        agent = RemediatorAgent(executor=executor)
+        agent._max_blast_radius = 2
+        plan = self._multi_target_plan(agent)
+        asyncio.run(agent.execute_plan_async(plan.plan_id))
+        assert executor.peak == 2
+
+    def test_sync_executor_runs_in_thread(self):
+        agent = RemediatorAgent()
+        plan = self._multi_target_plan(agent)
+        asyncio.run(agent.execute_plan_async(plan.plan_id))
+        assert all("SUCCESS" in s.result for s in plan.steps)
+
+    def test_requires_approval(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-41", "DIAG-41", "cpu_spike", "web-srv-01")
+        with pytest.raises(ValueError):
+            asyncio.run(agent.execute_plan_async(plan.plan_id))
+
+    def test_failed_batch_fails_plan_after_others_finish(self):
+        executor = _SlowAsyncExecutor()
+
+        async def flaky(target, steps):
+            if target == "rtr-b":
+                raise ConnectionError("rtr-b unreachable")
+            return await _SlowAsyncExecutor.execute_batch_async(executor, target, steps)
+
+        executor.execute_batch_async = flaky
+        agent = RemediatorAgent(executor=executor)
+        plan = self._multi_target_plan(agent)
+        with pytest.raises(ConnectionError):
+            asyncio.run(agent.execute_plan_async(plan.plan_id))
+        assert plan.status == RemediationStatus.FAILED
+        assert agent.get_status()["failed_tasks"] == 1
+        # The other targets' batches still ran and were recorded
+        completed = [
+            e["details"]["target"] for e in agent.get_action_log()
+            if e["action"] == "batch_completed"
+        ]
+        assert sorted(completed) == ["rtr-a", "rtr-c"]
+        assert agent.get_action_log()[-1]["action"] == "plan_failed"
+
+
+class TestCompiledTemplates:
+    def test_every_template_compiled(self):
+        assert set(_COMPILED_TEMPLATES) == set(REMEDIATION_TEMPLATES)
+        compiled = _COMPILED_TEMPLATES["link_down"]
+        assert compiled.risk_level == RiskLevel.HIGH
+        assert [s.requires_approval for s in compiled.steps] == [True, False, False, False]
+
+    def test_plans_do_not_share_step_state(self):
+        agent = RemediatorAgent()
+        first = agent.generate_plan("INC-50", "DIAG-50", "cpu_spike", "web-srv-01")
+        second = agent.generate_plan("INC-51", "DIAG-51", "cpu_spike", "web-srv-02")
+        first.steps[0].params["note"] = "mutated"
+        assert "note" not in second.steps[0].params
+        assert "note" not in _COMPILED_TEMPLATES["cpu_spike"].steps[0].params
+        assert second.steps[0].target == "web-srv-02"
+
+    def test_unknown_incident_escalates(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-52", "DIAG-52", "mystery", "dev-1")
+        assert plan.description == "Manual remediation required for mystery"
+        assert [s.action for s in plan.steps] == ["escalate"]
+        assert plan.steps[0].requires_approval
+
+    def test_risk_level_resolved_once_per_template(self):
+        agent = RemediatorAgent()
+        plans = [agent.generate_plan(f"INC-{i}", "D", "mystery", "dev-1") for i in range(2)]
+        assert plans[0].risk_level is plans[1].risk_level is RiskLevel.HIGH
+        assert _escalation_template("mystery") is _escalation_template("mystery")
+        assert plans[0].steps[0].step_id != plans[1].steps[0].step_id
+
+
+class TestStepIds:
+    def test_step_ids_unique_and_prefixed(self):
+        agent = RemediatorAgent()
+        plans = [agent.generate_plan(f"INC-{i}", "D", "link_down", "rtr") for i in range(3)]
+        ids = [s.step_id for p in plans for s in p.steps]
+        assert len(set(ids)) == len(ids)
+        assert all(i.startswith(f"STEP-{agent.agent_id[:4]}-") for i in ids)
+
+    def test_plan_and_steps_use_slots(self):
+        plan = RemediatorAgent().generate_plan("INC-60", "D", "cpu_spike", "web-srv-01")
+        assert not hasattr(plan, "__dict__")
+        assert not hasattr(plan.steps[0], "__dict__")
+
+
+class TestPendingIndex:
+    def test_pending_tracks_status_changes(self):
+        agent = RemediatorAgent()
+        a = agent.generate_plan("INC-70", "D", "cpu_spike", "web-srv-01")
+        b = agent.generate_plan("INC-71", "D", "disk_full", "db-srv-01")
+        c = agent.generate_plan("INC-72", "D", "cpu_spike", "web-srv-02", blast_radius=50)
+        agent.approve_plan(a.plan_id)
+        assert agent.get_pending_approvals() == [b]
+        agent.reject_plan(b.plan_id)
+        assert agent.get_pending_approvals() == []
+        assert c.plan_id not in agent._awaiting
+
+
+class TestRollbackOrder:
+    def test_template_dependencies_become_step_ids(self):
+        plan = RemediatorAgent().generate_plan("INC-1", "DIAG-1", "link_down", "r1")
+        check, bounce, failover, verify = plan.steps
+        assert bounce.dependencies == [check.step_id]
+        assert failover.dependencies == [check.step_id]
+        assert verify.dependencies == [bounce.step_id, failover.step_id]
+
+    def test_independent_branches_share_a_wave(self):
+        plan = RemediatorAgent().generate_plan("INC-1", "DIAG-1", "link_down", "r1")
+        waves = [[s.action for s in wave] for wave in rollback_waves(plan.steps)]
+        assert waves == [
+            ["verify_connectivity"],
+            ["activate_failover", "bounce_interface"],
+            ["check_physical_layer"],
+        ]
+
+    def test_cycle_falls_back_to_reverse_order(self):
+        a = RemediationStep("A", 1, "a", "r1", dependencies=["B"])
+        b = RemediationStep("B", 2, "b", "r1", dependencies=["A"])
+        assert rollback_waves([a, b]) == [[b], [a]]
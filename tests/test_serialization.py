@@ -0,0 +1,40 @@
+"""Tests for JSON helpers and generated to_dict functions."""
+
+from dataclasses import dataclass, field
+
+from agentops.agents.base import AgentCard
+from agentops.serialization import dumps, loads, make_to_dict
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+    tags: list[str] = field(default_factory=list)
+    _hidden: int = 0
+
+
+class TestSerialization:
+    def test_dumps_round_trip(self):
+        data = {"a": 1, "b": [1, 2], "c": "ü"}
+        blob = dumps(data)
+        assert isinstance(blob, bytes)
+        assert loads(blob) == data
+
+    def test_dumps_custom_default_and_int_keys(self):
+        blob = dumps({1: {"v"}}, default=sorted)
+        assert loads(blob) == {"1": ["v"]}
+
+    def test_make_to_dict_skips_private_fields(self):
+        to_dict = make_to_dict(_Point)
+        p = _Point(1, 2, ["t"])
+        assert to_dict(p) == {"x": 1, "y": 2, "tags": ["t"]}
+        assert to_dict(p)["tags"] is p.tags
+
+    def test_agent_card_keys(self):
+        card = AgentCard(agent_id="t1", name="T", description="D")
+        assert list(card.to_dict()) == [
+            "agent_id", "name", "description", "capabilities", "input_schemas",
+            "output_schemas", "endpoint", "version", "priority",
+            "max_concurrent_tasks", "tags",
+        ]
@@ -0,0 +1,99 @@
+"""Tests for snapshot stores and persisted remediation plans."""
+
+import asyncio
+
+import pytest
+from agentops.agents.remediator import (
+    RemediationStatus,
+    RemediatorAgent,
+    plan_from_dict,
+    plan_to_dict,
+)
+from agentops.snapshots import MemorySnapshotStore, SQLiteSnapshotStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemorySnapshotStore()
+    else:
+        s = SQLiteSnapshotStore(tmp_path / "snapshots.db")
+        yield s
+        s.close()
+
+
+class TestSnapshotStore:
+    def test_save_load_overwrite(self, store):
+        store.save("a", "pending", b"one")
+        store.save("b", "done", b"two")
+        store.save("a", "done", b"three")
+        assert store.load("a") == b"three"
+        assert store.load("missing") is None
+        assert store.keys() == ["a", "b"]
+        assert store.keys("done") == ["a", "b"]
+        assert store.keys("pending") == []
+
+    def test_sqlite_survives_reopen(self, tmp_path):
+        path = tmp_path / "plans.db"
+        first = SQLiteSnapshotStore(path)
+        first.save("k", "s", b"blob")
+        first.close()
+        second = SQLiteSnapshotStore(path)
+        assert second.load("k") == b"blob"
+        second.close()
+
+
+class TestPersistedPlans:
+    def test_plan_dict_round_trip(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-1", "DIAG-1", "link_down", "core-rtr-01")
+        restored = plan_from_dict(plan_to_dict(plan))
+        assert restored == plan
+
+    def test_statuses_reload_as_enum_singletons(self):
+        agent = RemediatorAgent()
+        plan = agent.generate_plan("INC-1", "DIAG-1", "cpu_spike", "web-srv-01")
+        data = plan_to_dict(plan)
+        assert data["status"] == "awaiting_approval"  # wire format stays a string
+        # Status checks compare by identity, so reloads must yield the members
+        assert plan_from_dict(data).status is RemediationStatus.AWAITING_APPROVAL
+
+    def test_pending_plan_survives_restart(self, tmp_path):
+        path = tmp_path / "plans.db"
+        store = SQLiteSnapshotStore(path)
+        plan = RemediatorAgent(store=store).generate_plan(
+            "INC-2", "DIAG-2", "cpu_spike", "web-srv-01"
+        )
+        store.close()
+
+        store = SQLiteSnapshotStore(path)
+        agent = RemediatorAgent(store=store)
+        assert [p.plan_id for p in agent.get_pending_approvals()] == [plan.plan_id]
+        agent.approve_plan(plan.plan_id, "alice")
+        executed = agent.execute_plan(plan.plan_id)
+        assert [s.step_id for s in executed.steps] == [s.step_id for s in plan.steps]
+        assert all(step.executed for step in executed.steps)
+        assert agent.get_pending_approvals() == []
+        store.close()
+
+    def test_cache_evicts_but_store_keeps_plans(self):
+        agent = RemediatorAgent(store=MemorySnapshotStore(), cache_size=2)
+        plans = [
+            agent.generate_plan(f"INC-{i}", f"DIAG-{i}", "disk_full", "db-srv-01")
+            for i in range(4)
+        ]
+        assert len(agent.plans) == 2
+        reloaded = agent.get_plan(plans[0].plan_id)
+        assert reloaded is not plans[0]
+        assert reloaded.status == RemediationStatus.AWAITING_APPROVAL
+        assert len(agent.get_pending_approvals()) == 4
+
+    def test_await_decision_made_before_restart(self):
+        store = MemorySnapshotStore()
+        plan = RemediatorAgent(store=store).generate_plan(
+            "INC-3", "DIAG-3", "cpu_spike", "web-srv-01"
+        )
+        RemediatorAgent(store=store).approve_plan(plan.plan_id, "bob")
+        decision = asyncio.run(RemediatorAgent(store=store).await_approval(plan.plan_id))
+        assert decision.approved is True
+        assert decision.decided_by == "bob"
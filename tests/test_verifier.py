@@ -1,7 +1,7 @@
 """Tests for VerifierAgent — verification, SLA checks, rollback recommendation."""
 
 import pytest
-from agentops.agents.verifier import VerifierAgent, VerificationResult
+from agentops.agents.verifier import SLATarget, VerifierAgent, VerificationResult
 
 
 class TestVerifierAgent:
@@ -99,3 +99,174 @@ class TestVerifierAgent:
         })
         assert result is not None
         assert result["result"] in ("passed", "failed", "degraded")
+
+    def test_check_ids_unique_and_prefixed(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            plan_id="REM-9",
+            incident_id="INC-9",
+            pre_metrics={"cpu_percent": 95.0, "memory_percent": 50.0},
+            post_metrics={"cpu_percent": 30.0, "memory_percent": 48.0},
+        )
+        ids = [c.check_id for c in report.checks]
+        assert len(set(ids)) == len(ids)
+        assert all(i.startswith(f"CHK-{agent.agent_id[:4]}-") for i in ids)
+
+    def test_metric_columns_only_cover_common_keys(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            plan_id="REM-10",
+            incident_id="INC-10",
+            pre_metrics={"network_error_rate": 0.0, "bgp_prefixes": 40.0, "cpu_percent": 90.0},
+            post_metrics={"network_error_rate": 0.001, "bgp_prefixes": 800.0},
+        )
+        comparisons = [c for c in report.checks if c.check_type == "metric_comparison"]
+        assert [c.details["metric"] for c in comparisons] == ["network_error_rate", "bgp_prefixes"]
+        assert report.improvement == {"network_error_rate": 0.0, "bgp_prefixes": 1900.0}
+        assert [c.details["improved"] for c in comparisons] == [False, True]
+
+
+class TestSLATarget:
+    @pytest.mark.parametrize("comparison,value,expected", [
+        ("lt", 79.9, True),
+        ("lt", 80.0, False),
+        ("gt", 80.1, True),
+        ("gt", 80.0, False),
+        ("eq", 80.005, True),
+        ("eq", 80.5, False),
+        ("ne", 0.0, True),
+    ])
+    def test_precomputed_comparator(self, comparison, value, expected):
+        assert SLATarget("m", 80.0, comparison).is_compliant(value) is expected
+
+    def test_dataclasses_use_slots(self):
+        report = VerifierAgent().verify_remediation(
+            "REM-1", "INC-1", {"cpu_percent": 1.0}, {"cpu_percent": 1.0},
+        )
+        for obj in (report, report.checks[0], SLATarget("m", 1.0)):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestReportIndex:
+    def test_reports_keyed_by_id(self):
+        agent = VerifierAgent()
+        reports = [
+            agent.verify_remediation(
+                f"REM-{i}", f"INC-{i}", {"cpu_percent": 90.0}, {"cpu_percent": 20.0},
+            )
+            for i in range(3)
+        ]
+        assert list(agent.reports) == [r.report_id for r in reports]
+        assert agent.get_verification_summary(reports[1].report_id)["plan_id"] == "REM-1"
+        assert "error" in agent.get_verification_summary("VER-missing")
+
+
+class TestLazyDescription:
+    def test_description_rendered_on_first_read(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-1", "INC-1", {"cpu_percent": 95.0}, {"cpu_percent": 30.0},
+        )
+        sla, comparison = report.checks  # critical SLAs are checked first
+        assert comparison._description is None
+        assert comparison.description == "cpu_percent: 95.00 -> 30.00 (-68.4%)"
+        assert comparison._description is comparison.description
+        assert sla.description == "SLA: CPU must be below 80% — PASS"
+
+
+class TestCriticalSLAShortCircuit:
+    def test_failed_critical_sla_skips_remaining_checks(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-1", "INC-1", {"link_state": 0.0}, {"link_state": 0.0},
+        )
+        assert report.overall_result == VerificationResult.FAILED
+        assert report.rollback_recommended
+        assert [c.check_type for c in report.checks] == ["sla_check"]
+        assert report.sla_compliance == {"link_state": False}
+        assert report.improvement == {}
+
+    def test_critical_failure_outvoted_stays_degraded(self):
+        # One failed critical SLA out of eight checks is DEGRADED, as in a full run
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-3", "INC-3",
+            {"cpu_percent": 95.0, "memory_percent": 90.0, "disk_percent": 90.0,
+             "response_time_ms": 900.0},
+            {"cpu_percent": 85.0, "memory_percent": 40.0, "disk_percent": 40.0,
+             "response_time_ms": 100.0},
+        )
+        assert report.overall_result == VerificationResult.DEGRADED
+        assert not report.rollback_recommended
+        assert (report.checks_passed, report.checks_failed) == (7, 1)
+        assert report.sla_compliance["cpu_percent"] is False
+
+    def test_failed_link_outvoted_by_other_checks(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-4", "INC-4",
+            {"link_state": 0.0, "memory_percent": 90.0, "disk_percent": 90.0},
+            {"link_state": 0.0, "memory_percent": 40.0, "disk_percent": 40.0},
+        )
+        assert report.overall_result == VerificationResult.DEGRADED
+        assert (report.checks_passed, report.checks_failed) == (5, 1)
+
+    def test_passing_critical_slas_run_full_verification(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-2", "INC-2",
+            {"link_state": 0.0, "memory_percent": 90.0},
+            {"link_state": 1.0, "memory_percent": 40.0},
+        )
+        assert report.overall_result == VerificationResult.PASSED
+        assert report.sla_compliance == {"link_state": True, "memory_percent": True}
+        assert len(report.checks) == 4
+
+    def test_most_failed_critical_sla_checked_first(self):
+        agent = VerifierAgent()
+        post = {"cpu_percent": 50.0, "link_state": 0.0}
+        first = agent.verify_remediation("REM-1", "INC-1", {}, post)
+        order = [c.details["sla_metric"] for c in first.checks]
+        assert order == ["cpu_percent", "link_state"]
+        assert agent.sla_fail_counts == {"link_state": 1}
+
+        second = agent.verify_remediation("REM-2", "INC-2", {}, post)
+        assert [c.details["sla_metric"] for c in second.checks] == ["link_state"]
+        assert second.overall_result == VerificationResult.FAILED
+
+    def test_fail_counts_restored_from_previous_run(self):
+        agent = VerifierAgent(sla_fail_counts={"link_state": 7})
+        post = {"cpu_percent": 50.0, "link_state": 1.0}
+        report = agent.verify_remediation("REM-1", "INC-1", {}, post)
+        order = [c.details["sla_metric"] for c in report.checks]
+        assert order == ["link_state", "cpu_percent"]
+
+
+class TestImprovementPrecision:
+    def test_report_keeps_full_precision_summary_rounds(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-1", "INC-1", {"memory_percent": 90.0}, {"memory_percent": 60.0},
+        )
+        assert report.improvement["memory_percent"] == (60.0 - 90.0) / 90.0 * 100
+        summary = agent.get_verification_summary(report.report_id)
+        assert summary["improvement"] == {"memory_percent": -33.33}
+
+
+class TestBoundedReports:
+    def test_counts_cover_checks_not_kept(self):
+        agent = VerifierAgent(keep_passed_checks=False, max_failed_checks=2)
+        pre = {f"m{i}": 10.0 for i in range(100)}
+        post = {f"m{i}": 20.0 if i % 10 == 0 else 5.0 for i in range(100)}
+        report = agent.verify_remediation("REM-1", "INC-1", pre, post)
+        assert (report.checks_passed, report.checks_failed) == (90, 10)
+        assert [c.details["metric"] for c in report.checks] == ["m0", "m10"]
+        # 10 of 100 failed: same verdict as with every check kept
+        assert report.overall_result == VerificationResult.DEGRADED
+
+    def test_default_keeps_every_check(self):
+        agent = VerifierAgent()
+        report = agent.verify_remediation(
+            "REM-1", "INC-1", {"cpu_percent": 95.0}, {"cpu_percent": 30.0},
+        )
+        assert len(report.checks) == report.checks_passed + report.checks_failed == 2